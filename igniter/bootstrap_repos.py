@@ -4,9 +4,12 @@ from __future__ import annotations
 import logging as log
 import os
 import re
+import json
 import shutil
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
@@ -53,6 +56,131 @@ def sha256sum(filename):
     return h.hexdigest()
 
 
+def get_hash_workers() -> int:
+    """Count of threads used to calculate checksums."""
+    return min(8, os.cpu_count() or 1)
+
+
+class VersionIndex:
+    """Persistent index of results of OpenPype version zip checks.
+
+    Opening and validating zip files of OpenPype versions is slow, mainly
+    on network shares. Results are stored by path of zip file with its size
+    and modification time so only new or changed zip files are checked
+    again.
+
+    Args:
+        index_path (Path): Path to json file where index is stored.
+
+    """
+
+    def __init__(self, index_path: Path):
+        self._index_path = index_path
+        self._data = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_stat(path: Path) -> Union[list, None]:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        return [stat_result.st_size, stat_result.st_mtime]
+
+    def _load(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            try:
+                with open(self._index_path, "r") as stream:
+                    self._data = json.load(stream)
+            except (OSError, ValueError):
+                pass
+        return self._data
+
+    def get(self, path: Path, kind: str) -> Union[tuple, None]:
+        """Get stored result of check.
+
+        Args:
+            path (Path): Path to checked zip file.
+            kind (str): Kind of check e.g. "version" or "validation".
+
+        Returns:
+            tuple: Stored state and reason or None if file was not checked
+                or was changed since.
+
+        """
+        stat = self._get_stat(path)
+        if stat is None:
+            return None
+        with self._lock:
+            item = self._load().get(path.resolve().as_posix())
+        if not item or item.get("stat") != stat or kind not in item:
+            return None
+        return tuple(item[kind])
+
+    def set(self, path: Path, kind: str, result: tuple) -> None:
+        """Store result of check.
+
+        Args:
+            path (Path): Path to checked zip file.
+            kind (str): Kind of check e.g. "version" or "validation".
+            result (tuple): State and reason.
+
+        """
+        stat = self._get_stat(path)
+        if stat is None:
+            return
+        key = path.resolve().as_posix()
+        with self._lock:
+            data = self._load()
+            item = data.get(key)
+            if not item or item.get("stat") != stat:
+                item = {"stat": stat}
+                data[key] = item
+            item[kind] = list(result)
+            self._changed = True
+
+    def save(self) -> None:
+        """Store index to disk if it was changed."""
+        with self._lock:
+            if not self._changed:
+                return
+            # Remove items of files which don't exist anymore
+            data = {
+                key: value
+                for key, value in self._load().items()
+                if os.path.exists(key)
+            }
+            try:
+                self._index_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self._index_path.parent.as_posix(), suffix=".json")
+                with os.fdopen(fd, "w") as stream:
+                    json.dump(data, stream)
+                os.replace(tmp_path, self._index_path)
+            except OSError:
+                log.warning(
+                    f"Cannot store version index {self._index_path}",
+                    exc_info=True)
+                return
+            self._data = data
+            self._changed = False
+
+
+_version_index = None
+
+
+def get_version_index() -> VersionIndex:
+    """Index of checked OpenPype version zip files in user data dir."""
+    global _version_index
+    if _version_index is None:
+        _version_index = VersionIndex(
+            Path(user_data_dir("openpype", "pypeclub")) / "version_index.json"
+        )
+    return _version_index
+
+
 class OpenPypeVersion(semver.VersionInfo):
     """Class for storing information about OpenPype version.
 
@@ -296,6 +424,17 @@ class OpenPypeVersion(semver.VersionInfo):
         if zip_item.suffix.lower() != ".zip":
             return False, "Not a zip"
 
+        index = get_version_index()
+        index_key = f"version:{version.get_main_version()}"
+        result = index.get(zip_item, index_key)
+        if result is None:
+            result = OpenPypeVersion._check_version_in_zip(zip_item, version)
+            index.set(zip_item, index_key, result)
+        return result
+
+    @staticmethod
+    def _check_version_in_zip(
+            zip_item: Path, version: OpenPypeVersion) -> Tuple[bool, str]:
         try:
             with ZipFile(zip_item, "r") as zip_file:
                 with zip_file.open(
@@ -521,6 +660,7 @@ class OpenPypeVersion(semver.VersionInfo):
                 detected_version.path = item
                 _openpype_versions.append(detected_version)
 
+        get_version_index().save()
         return sorted(_openpype_versions)
 
     @staticmethod
@@ -954,16 +1094,47 @@ class BootstrapRepos:
             return False, "Path doesn't exist"
 
         if path.is_file():
-            return self._validate_zip(path)
+            # Unchanged zip files are not validated again
+            index = get_version_index()
+            result = index.get(path, "validation")
+            if result is None:
+                result = self._validate_zip(path)
+                index.set(path, "validation", result)
+                index.save()
+            return result
         return self._validate_dir(path)
 
+    @staticmethod
+    def _hash_zip_members(path: Path, file_names: List[str]) -> List[tuple]:
+        """Calculate checksums of files in zip.
+
+        Returns:
+            list: Tuples with file name and checksum (None if file is
+                missing).
+
+        """
+        output = []
+        with ZipFile(path, "r") as zip_file:
+            for file_name in file_names:
+                try:
+                    data = zip_file.read(file_name)
+                except (FileNotFoundError, KeyError):
+                    output.append((file_name, None))
+                    continue
+                output.append((file_name, hashlib.sha256(data).hexdigest()))
+        return output
+
     @staticmethod
     def _validate_zip(path: Path) -> tuple:
-        """Validate content of zip file."""
+        """Validate content of zip file.
+
+        Checksums are calculated in parallel, each thread reads its part of
+        files with own handle of zip file.
+        """
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
+                checksums_data = zip_file.read("checksums").decode("utf-8")
             except IOError:
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
@@ -985,17 +1156,33 @@ class BootstrapRepos:
             if diff:
                 return False, f"Missing files {diff}"
 
-            # calculate and compare checksums in the zip file
-            for file_checksum, file_name in checksums:
-                if platform.system().lower() == "windows":
-                    file_name = file_name.replace("/", "\\")
-                h = hashlib.sha256()
-                try:
-                    h.update(zip_file.read(file_name))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file_name} ]"
-                if h.hexdigest() != file_checksum:
-                    return False, f"Invalid checksum on {file_name}"
+        # calculate and compare checksums in the zip file
+        # - names of files in zip always use forward slashes
+        expected = {
+            file_name: file_checksum
+            for file_checksum, file_name in checksums
+        }
+
+        file_names = list(expected.keys())
+        workers = get_hash_workers()
+        chunks = [file_names[idx::workers] for idx in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda chunk: BootstrapRepos._hash_zip_members(path, chunk),
+                chunks
+            )
+            current = dict(
+                item
+                for chunk_result in results
+                for item in chunk_result
+            )
+
+        # Keep order of checksums file in reports
+        for file_name in file_names:
+            if current[file_name] is None:
+                return False, f"Missing file [ {file_name} ]"
+            if current[file_name] != expected[file_name]:
+                return False, f"Invalid checksum on {file_name}"
 
         return True, "All ok"
 
@@ -1024,13 +1211,26 @@ class BootstrapRepos:
         if diff:
             return False, f"Missing files {diff}"
 
-        # calculate and compare checksums
-        for file_checksum, file_name in checksums:
-            if platform.system().lower() == "windows":
-                file_name = file_name.replace("/", "\\")
+        def _checksum(file_name):
             try:
-                current = sha256sum((path / file_name).as_posix())
+                return sha256sum((path / file_name).as_posix())
             except FileNotFoundError:
+                return None
+
+        file_names = []
+        for _, file_name in checksums:
+            if platform.system().lower() == "windows":
+                file_name = file_name.replace("/", "\\")
+            file_names.append(file_name)
+
+        # calculate checksums in parallel and compare them
+        with ThreadPoolExecutor(max_workers=get_hash_workers()) as executor:
+            current_checksums = list(executor.map(_checksum, file_names))
+
+        for (file_checksum, _), file_name, current in zip(
+            checksums, file_names, current_checksums
+        ):
+            if current is None:
                 return False, f"Missing file [ {file_name} ]"
 
             if file_checksum != current:
@@ -1557,36 +1757,12 @@ class BootstrapRepos:
         if zip_item.suffix.lower() != ".zip":
             return False
 
-        try:
-            with ZipFile(zip_item, "r") as zip_file:
-                with zip_file.open(
-                        "openpype/version.py") as version_file:
-                    zip_version = {}
-                    exec(version_file.read(), zip_version)
-                    try:
-                        version_check = OpenPypeVersion(
-                            version=zip_version["__version__"])
-                    except ValueError as e:
-                        self._print(str(e), True)
-                        return False
-
-                    version_main = version_check.get_main_version()  # noqa: E501
-                    detected_main = detected_version.get_main_version()  # noqa: E501
-
-                    if version_main != detected_main:
-                        self._print(
-                            (f"zip version ({detected_version}) "
-                             f"and its content version "
-                             f"({version_check}) "
-                             "doesn't match. Skipping."), True)
-                        return False
-        except BadZipFile:
-            self._print(f"{zip_item} is not a zip file", True)
-            return False
-        except KeyError:
-            self._print("Zip does not contain OpenPype", True)
-            return False
-        return True
+        # result is cached in version index for unchanged zip files
+        is_valid, reason = OpenPypeVersion.is_version_in_zip(
+            zip_item, detected_version)
+        if not is_valid:
+            self._print(reason, True)
+        return is_valid
 
     def get_openpype_versions(self,
                               openpype_dir: Path,
@@ -1637,6 +1813,7 @@ class BootstrapRepos:
                 if not staging and not detected_version.is_staging():
                     _openpype_versions.append(detected_version)
 
+        get_version_index().save()
         return sorted(_openpype_versions)
 
 
@@ -147,7 +147,14 @@ def webpublisherwebserver(debug, executable, upload_dir, host=None, port=None):
 @click.option(
     "--envgroup", help="Environment group (e.g. \"farm\")", default=None
 )
-def extractenvironments(output_json_path, project, asset, task, app, envgroup):
+@click.option(
+    "--cache-dir",
+    help="Shared directory where extracted environments are reused",
+    default=None
+)
+def extractenvironments(
+    output_json_path, project, asset, task, app, envgroup, cache_dir
+):
     """Extract environment variables for entered context to a json file.
 
     Entered output filepath will be created if does not exists.
@@ -156,9 +163,13 @@ def extractenvironments(output_json_path, project, asset, task, app, envgroup):
     environments will be extracted.
 
     Context options are "project", "asset", "task", "app"
+
+    Environments for context are computed once and reused from cache
+    directory if "cache-dir" option or "OPENPYPE_ENVIRONMENTS_CACHE_DIR"
+    environment variable is set.
     """
     PypeCommands.extractenvironments(
-        output_json_path, project, asset, task, app, envgroup
+        output_json_path, project, asset, task, app, envgroup, cache_dir
     )
 
 
@@ -430,9 +441,15 @@ def repack_version(directory):
 @click.option(
     "--dirpath", help="Directory where package is stored", default=None
 )
-def pack_project(project, dirpath):
+@click.option(
+    "--workers",
+    help="Count of zip files with project files compressed in parallel",
+    type=int,
+    default=None
+)
+def pack_project(project, dirpath, workers):
     """Create a package of project with all files and database dump."""
-    PypeCommands().pack_project(project, dirpath)
+    PypeCommands().pack_project(project, dirpath, workers)
 
 
 @main.command()
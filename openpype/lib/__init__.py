@@ -18,7 +18,9 @@ site.addsitedir(python_version_dir)
 
 from .events import (
     emit_event,
-    register_event_callback
+    register_event_callback,
+    wait_for_queued_events,
+    get_event_callbacks_metrics
 )
 
 from .vendor_bin_utils import (
@@ -26,9 +28,14 @@ from .vendor_bin_utils import (
     get_vendor_bin_path,
     get_oiio_tools_path,
     get_ffmpeg_tool_path,
+    get_ffprobe_data,
     ffprobe_streams,
     is_oiio_supported
 )
+from .probe_cache import (
+    ProbeCache,
+    get_probe_cache
+)
 
 from .env_tools import (
     env_value_to_bool,
@@ -84,13 +91,17 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfileIndex,
+    get_profile_index
 )
 
 from .transcoding import (
     get_transcode_temp_directory,
     should_convert_for_ffmpeg,
-    convert_for_ffmpeg
+    convert_for_ffmpeg,
+    get_sequence_gaps,
+    link_sequence_gaps
 )
 from .avalon_context import (
     CURRENT_DOC_SCHEMAS,
@@ -152,6 +163,7 @@ from .applications import (
     prepare_app_environments,
     prepare_context_environments,
     get_app_environments_for_context,
+    get_cached_app_environments_for_context,
     apply_project_environments_value
 )
 
@@ -163,6 +175,7 @@ from .plugin_tools import (
     filter_pyblish_plugins,
     set_plugin_attributes_from_settings,
     source_hash,
+    source_hash_from_stat,
     get_unique_layer_name,
     get_background_layers,
 )
@@ -177,6 +190,13 @@ from .path_tools import (
     get_project_basic_paths,
 )
 
+from .file_transfer import (
+    FileTransferError,
+    TransferReport,
+    FileTransferEngine
+)
+from .file_hash_index import FileHashIndex
+
 from .editorial import (
     is_overlapping_otio_ranges,
     otio_range_to_frame_range,
@@ -205,6 +225,8 @@ terminal = Terminal
 __all__ = [
     "emit_event",
     "register_event_callback",
+    "wait_for_queued_events",
+    "get_event_callbacks_metrics",
 
     "find_executable",
     "get_openpype_execute_args",
@@ -225,9 +247,13 @@ __all__ = [
     "get_vendor_bin_path",
     "get_oiio_tools_path",
     "get_ffmpeg_tool_path",
+    "get_ffprobe_data",
     "ffprobe_streams",
     "is_oiio_supported",
 
+    "ProbeCache",
+    "get_probe_cache",
+
     "import_filepath",
     "modules_from_path",
     "recursive_bases_from_class",
@@ -237,6 +263,8 @@ __all__ = [
     "get_transcode_temp_directory",
     "should_convert_for_ffmpeg",
     "convert_for_ffmpeg",
+    "get_sequence_gaps",
+    "link_sequence_gaps",
 
     "CURRENT_DOC_SCHEMAS",
     "PROJECT_NAME_ALLOWED_SYMBOLS",
@@ -289,11 +317,14 @@ __all__ = [
     "prepare_app_environments",
     "prepare_context_environments",
     "get_app_environments_for_context",
+    "get_cached_app_environments_for_context",
     "apply_project_environments_value",
 
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfileIndex",
+    "get_profile_index",
 
     "TaskNotSetError",
     "get_subset_name",
@@ -301,6 +332,7 @@ __all__ = [
     "filter_pyblish_plugins",
     "set_plugin_attributes_from_settings",
     "source_hash",
+    "source_hash_from_stat",
     "get_unique_layer_name",
     "get_background_layers",
 
@@ -343,6 +375,11 @@ __all__ = [
     "create_workdir_extra_folders",
     "get_project_basic_paths",
 
+    "FileTransferError",
+    "TransferReport",
+    "FileTransferEngine",
+    "FileHashIndex",
+
     "op_version_control_available",
     "get_openpype_version",
     "get_build_version",
@@ -730,9 +730,8 @@ class AnatomyTemplates(TemplatesDict):
         roots = self.roots
         if roots:
             copy_data["root"] = roots
-        result = super(AnatomyTemplates, self).format(copy_data)
-        result.strict = strict
-        return result
+        # Data are already copied
+        return self._format_data(copy_data, strict)
 
     def format_all(self, in_data, only_keys=True):
         """ Solves templates based on entered data.
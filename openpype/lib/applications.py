@@ -1,8 +1,12 @@
 import os
+import re
 import sys
 import copy
 import json
+import time
+import hashlib
 import tempfile
+import threading
 import platform
 import collections
 import inspect
@@ -32,7 +36,7 @@ from .avalon_context import (
 )
 
 from .python_module_tools import (
-    modules_from_path,
+    import_filepath,
     classes_from_module
 )
 from .execute import (
@@ -811,6 +815,174 @@ class PostLaunchHook(LaunchHook):
     """
 
 
+class LaunchHooksRegistry(object):
+    """Registry of launch hook classes reused between application launches.
+
+    Hook files are imported only once and imported again only when their
+    modification time changes. Hook classes are indexed by launch context
+    (platform, host, application group and name) so launch context
+    initialize only hooks which may be valid for it.
+    """
+
+    def __init__(self):
+        self.log = PypeLogger.get_logger(self.__class__.__name__)
+        # Imported classes by filepath '{filepath: (mtime, pre, post)}'
+        self._files = {}
+        # Hook classes by launch context and paths
+        self._index = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Remove imported hooks, they're imported again on next launch."""
+        with self._lock:
+            self._files.clear()
+            self._index.clear()
+
+    def get_hook_classes(self, launch_context, paths):
+        """Hook classes from paths which may be valid for launch context.
+
+        Args:
+            launch_context (ApplicationLaunchContext): Context of launching
+                application.
+            paths (list): Directory paths where hooks are.
+
+        Returns:
+            dict: Prelaunch and postlaunch hook classes under "pre" and
+                "post" keys.
+        """
+        with self._lock:
+            filepaths = []
+            changed = False
+            for path in paths:
+                for filepath in self._get_hook_filepaths(path):
+                    filepaths.append(filepath)
+                    if self._update_file(filepath):
+                        changed = True
+
+            if changed:
+                self._index.clear()
+
+            index_key = (
+                platform.system().lower(),
+                launch_context.host_name,
+                launch_context.app_group.name,
+                launch_context.app_name,
+                tuple(filepaths)
+            )
+            hook_classes = self._index.get(index_key)
+            if hook_classes is None:
+                hook_classes = self._filter_classes(
+                    launch_context, filepaths
+                )
+                self._index[index_key] = hook_classes
+
+        return {
+            launch_type: list(classes)
+            for launch_type, classes in hook_classes.items()
+        }
+
+    def _get_hook_filepaths(self, path):
+        """Python files in path which are imported as hooks.
+
+        Same rules as 'modules_from_path' are used.
+        """
+        if not os.path.exists(path):
+            self.log.info(
+                "Path to launch hooks does not exists: \"{}\"".format(path)
+            )
+            return []
+
+        # Do not allow relative imports
+        if path.startswith("."):
+            self.log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(path))
+            return []
+
+        path = os.path.normpath(path)
+        filepaths = []
+        for filename in sorted(os.listdir(path)):
+            # Ignore files which start with underscore
+            if filename.startswith("_") or not filename.endswith(".py"):
+                continue
+
+            filepath = os.path.join(path, filename)
+            if os.path.isfile(filepath):
+                filepaths.append(filepath)
+        return filepaths
+
+    def _update_file(self, filepath):
+        """Import file if was not imported yet or was changed.
+
+        Returns:
+            bool: File was imported.
+        """
+        mtime = os.path.getmtime(filepath)
+        cached = self._files.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return False
+
+        pre_classes = []
+        post_classes = []
+        try:
+            module_name = os.path.splitext(os.path.basename(filepath))[0]
+            module = import_filepath(filepath, module_name)
+            pre_classes = classes_from_module(PreLaunchHook, module)
+            post_classes = classes_from_module(PostLaunchHook, module)
+
+        except Exception:
+            self.log.warning(
+                "Failed to load path: \"{0}\"".format(filepath),
+                exc_info=True
+            )
+
+        self._files[filepath] = (mtime, pre_classes, post_classes)
+        return True
+
+    def _filter_classes(self, launch_context, filepaths):
+        output = {
+            "pre": [],
+            "post": []
+        }
+        for filepath in filepaths:
+            _, pre_classes, post_classes = self._files[filepath]
+            for launch_type, classes in (
+                ("pre", pre_classes),
+                ("post", post_classes)
+            ):
+                for klass in classes:
+                    if self._is_class_valid(klass, launch_context):
+                        output[launch_type].append(klass)
+        return output
+
+    @staticmethod
+    def _is_class_valid(klass, launch_context):
+        """Class validation by attributes which can be indexed.
+
+        Hooks with custom 'class_validation' are validated on initialization
+        because it may depend on other data of launch context.
+        """
+        class_validation = getattr(klass.class_validation, "__func__", None)
+        if class_validation is not LaunchHook.class_validation.__func__:
+            return True
+        try:
+            return klass.class_validation(launch_context)
+        except Exception:
+            # Let hook initialization handle it
+            return True
+
+
+_launch_hooks_registry = None
+
+
+def get_launch_hooks_registry():
+    """Registry of launch hooks shared by launch contexts of process."""
+    global _launch_hooks_registry
+    if _launch_hooks_registry is None:
+        _launch_hooks_registry = LaunchHooksRegistry()
+    return _launch_hooks_registry
+
+
 class ApplicationLaunchContext:
     """Context of launching application.
 
@@ -835,6 +1007,8 @@ class ApplicationLaunchContext:
         **data (dict): Any additional data. Data may be used during
             preparation to store objects usable in multiple places.
     """
+    # Hooks running longer (in seconds) are logged with info level
+    slow_hook_threshold = 1.0
 
     def __init__(self, application, executable, env_group=None, **data):
         from openpype.modules import ModulesManager
@@ -897,6 +1071,8 @@ class ApplicationLaunchContext:
 
         self.prelaunch_hooks = None
         self.postlaunch_hooks = None
+        # Execution times of hooks '(<"pre" or "post">, <name>, <seconds>)'
+        self.hook_times = []
 
         self.process = None
 
@@ -978,31 +1154,16 @@ class ApplicationLaunchContext:
             self.postlaunch_hooks.clear()
 
         self.log.debug("Discovery of launch hooks started.")
+        discovery_start = time.time()
 
         paths = self.paths_to_launch_hooks()
         self.log.debug("Paths where will look for launch hooks:{}".format(
             "\n- ".join(paths)
         ))
 
-        all_classes = {
-            "pre": [],
-            "post": []
-        }
-        for path in paths:
-            if not os.path.exists(path):
-                self.log.info(
-                    "Path to launch hooks does not exists: \"{}\"".format(path)
-                )
-                continue
-
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+        all_classes = get_launch_hooks_registry().get_hook_classes(
+            self, paths
+        )
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1046,8 +1207,12 @@ class ApplicationLaunchContext:
             else:
                 self.postlaunch_hooks = ordered_hooks
 
-        self.log.debug("Found {} prelaunch and {} postlaunch hooks.".format(
-            len(self.prelaunch_hooks), len(self.postlaunch_hooks)
+        self.log.debug((
+            "Found {} prelaunch and {} postlaunch hooks in {:.3f}s."
+        ).format(
+            len(self.prelaunch_hooks),
+            len(self.postlaunch_hooks),
+            time.time() - discovery_start
         ))
 
     @property
@@ -1137,7 +1302,9 @@ class ApplicationLaunchContext:
             self.log.debug("Executing prelaunch hook: {}".format(
                 str(prelaunch_hook.__class__.__name__)
             ))
+            start_time = time.time()
             prelaunch_hook.execute()
+            self._store_hook_time("pre", prelaunch_hook, start_time)
 
         self.log.debug("All prelaunch hook executed. Starting new process.")
 
@@ -1166,6 +1333,7 @@ class ApplicationLaunchContext:
 
             # TODO how to handle errors?
             # - store to variable to let them accessible?
+            start_time = time.time()
             try:
                 postlaunch_hook.execute()
 
@@ -1174,11 +1342,24 @@ class ApplicationLaunchContext:
                     "After launch procedures were not successful.",
                     exc_info=True
                 )
+            self._store_hook_time("post", postlaunch_hook, start_time)
 
         self.log.debug("Launch of {} finished.".format(self.app_name))
 
         return self.process
 
+    def _store_hook_time(self, launch_type, hook, start_time):
+        """Store and log time of launch hook execution."""
+        hook_name = hook.__class__.__name__
+        duration = time.time() - start_time
+        self.hook_times.append((launch_type, hook_name, duration))
+
+        msg = "Launch hook \"{}\" took {:.3f}s".format(hook_name, duration)
+        if duration >= self.slow_hook_threshold:
+            self.log.info(msg)
+        else:
+            self.log.debug(msg)
+
     @staticmethod
     def clear_launch_args(args):
         """Collect launch arguments to final order.
@@ -1306,6 +1487,338 @@ def get_app_environments_for_context(
     return data["env"]
 
 
+class AppEnvironmentsCache(object):
+    """Environments for context stored in shared directory.
+
+    Farm jobs of the same context (e.g. chunks of render job) need same
+    environments. Environments are computed by first of them and stored to
+    shared directory so others can reuse them.
+
+    Only environments changed by computation are stored and are applied on
+    environments of process which is reusing them. Stored values of changed
+    keys before computation are compared with current environments so
+    different initial values cause that environments are computed again.
+
+    Stored environments are identified by context, environment group,
+    OpenPype version, platform, settings overrides, values of project and
+    asset documents used for computation and initial environments
+    referenced in environment settings. Each stored file contains checksum
+    to skip partially written or damaged files.
+
+    Computed environments may contain secrets from settings so stored files
+    are readable only by their owner and are removed after 'MAX_AGE'.
+
+    Args:
+        cache_dir (str): Shared directory where environments are stored.
+    """
+    # Age of stored environments in seconds when they are removed
+    MAX_AGE = 7 * 24 * 60 * 60
+    # Initial environments which are always used in key
+    ENV_KEYS = {"PATH", "PYTHONPATH", "OPENPYPE_ROOT", "OPENPYPE_REPOS_ROOT"}
+    _env_reference_regex = re.compile(r"{([A-Za-z_][A-Za-z0-9_]*)")
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.log = PypeLogger.get_logger(self.__class__.__name__)
+
+    @staticmethod
+    def _get_settings_overrides(project_name):
+        from openpype.settings.lib import (
+            get_studio_system_settings_overrides,
+            get_studio_project_settings_overrides,
+            get_studio_project_anatomy_overrides,
+            get_project_settings_overrides,
+            get_project_anatomy_overrides,
+            get_local_settings
+        )
+
+        return [
+            get_studio_system_settings_overrides(),
+            get_studio_project_settings_overrides(),
+            get_studio_project_anatomy_overrides(),
+            get_project_settings_overrides(project_name),
+            get_project_anatomy_overrides(project_name),
+            get_local_settings()
+        ]
+
+    @staticmethod
+    def _get_documents_data(project_doc, asset_doc):
+        """Values of documents which are used to compute environments."""
+        project_data = None
+        if project_doc:
+            project_data = {
+                "name": project_doc["name"],
+                "code": project_doc["data"].get("code"),
+                "tasks": project_doc["config"].get("tasks")
+            }
+
+        asset_data = None
+        if asset_doc:
+            asset_data = {
+                "name": asset_doc["name"],
+                "parents": asset_doc["data"].get("parents"),
+                "tasks": asset_doc["data"].get("tasks"),
+                "tools_env": asset_doc["data"].get("tools_env")
+            }
+        return [project_data, asset_data]
+
+    def _get_env_keys(self, project_name):
+        """Environment keys which may be used to compute environments.
+
+        Keys are collected from environments of applications, tools and
+        project in settings.
+        """
+        system_settings = get_system_settings()
+        project_settings = get_project_settings(project_name)
+        env_settings = [
+            system_settings["applications"],
+            system_settings["tools"],
+            project_settings["global"]["project_environments"]
+        ]
+        content = json.dumps(env_settings, default=str)
+        env_keys = set(self.ENV_KEYS)
+        env_keys.update(self._env_reference_regex.findall(content))
+        return env_keys
+
+    def get_key(
+        self, project_name, asset_name, task_name, app_name,
+        env_group=None, env=None, project_doc=None, asset_doc=None
+    ):
+        """Key of environments for passed context.
+
+        Returns:
+            str: Hash of all values which have influence on environments.
+        """
+        from openpype.version import __version__
+
+        if env is None:
+            env = os.environ
+
+        key_data = {
+            "context": [
+                project_name, asset_name, task_name, app_name, env_group
+            ],
+            "version": __version__,
+            "platform": platform.system().lower(),
+            "settings": self._get_settings_overrides(project_name),
+            "documents": self._get_documents_data(project_doc, asset_doc),
+            "env": {
+                env_key: env.get(env_key)
+                for env_key in self._get_env_keys(project_name)
+            }
+        }
+        key_content = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha1(key_content.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    @staticmethod
+    def _get_checksum(data):
+        content = json.dumps(data, sort_keys=True)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, path):
+        return os.path.getmtime(path) < time.time() - self.MAX_AGE
+
+    def get(self, key, env=None):
+        """Stored environments for key applied on passed environments.
+
+        Args:
+            key (str): Key of stored environments.
+            env (dict): Initial environment variables. `os.environ` is used
+                when not passed.
+
+        Returns:
+            Union[dict, None]: Environments or None if are not stored, stored
+                file is not valid or was computed from different values of
+                changed environments.
+        """
+        if env is None:
+            env = os.environ
+
+        path = self._get_path(key)
+        try:
+            if not os.path.exists(path) or self._is_expired(path):
+                return None
+
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (IOError, OSError, ValueError):
+            self.log.warning(
+                "Failed to read cached environments \"{}\"".format(path),
+                exc_info=True
+            )
+            return None
+
+        changes = data.get("changes")
+        if (
+            not isinstance(changes, dict)
+            or data.get("checksum") != self._get_checksum(changes)
+        ):
+            self.log.warning(
+                "Cached environments \"{}\" are not valid".format(path)
+            )
+            return None
+
+        for env_key, value in changes["initial"].items():
+            if env.get(env_key) != value:
+                return None
+
+        output = dict(env)
+        output.update(changes["env"])
+        for env_key in changes["removed"]:
+            output.pop(env_key, None)
+        return output
+
+    def set(self, key, env, initial_env=None):
+        """Store changes of environments for key.
+
+        Args:
+            key (str): Key of stored environments.
+            env (dict): Computed environments.
+            initial_env (dict): Environments from which were environments
+                computed. `os.environ` is used when not passed.
+        """
+        if initial_env is None:
+            initial_env = os.environ
+
+        changed = {
+            env_key: value
+            for env_key, value in env.items()
+            if initial_env.get(env_key) != value
+        }
+        removed = [
+            env_key
+            for env_key in initial_env.keys()
+            if env_key not in env
+        ]
+        changes = {
+            "env": changed,
+            "removed": removed,
+            "initial": {
+                env_key: initial_env.get(env_key)
+                for env_key in list(changed.keys()) + removed
+            }
+        }
+
+        path = self._get_path(key)
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            # Write to temp file first so other processes don't read
+            #   partially written file
+            # - temp file is readable and writable only by owner
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as stream:
+                json.dump(
+                    {
+                        "checksum": self._get_checksum(changes),
+                        "changes": changes
+                    },
+                    stream
+                )
+            os.replace(tmp_path, path)
+
+        except (IOError, OSError):
+            self.log.warning(
+                "Failed to store environments \"{}\"".format(path),
+                exc_info=True
+            )
+            return
+
+        self.remove_expired()
+
+    def remove_expired(self):
+        """Remove stored environments older than 'MAX_AGE'."""
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except (IOError, OSError):
+            return
+
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                if self._is_expired(path):
+                    os.remove(path)
+            except (IOError, OSError):
+                # File may be removed by other process
+                pass
+
+
+def get_cached_app_environments_for_context(
+    project_name, asset_name, task_name, app_name, env_group=None, env=None,
+    cache_dir=None
+):
+    """Prepare environment variables by context and reuse stored result.
+
+    Same as 'get_app_environments_for_context' but environments are stored
+    to passed cache directory. Environments are computed only if were not
+    stored yet for the same context, settings, documents and initial
+    environments.
+
+    Args:
+        project_name (str): Name of project.
+        asset_name (str): Name of asset.
+        task_name (str): Name of task.
+        app_name (str): Name of application that is launched and can be found
+            by ApplicationManager.
+        env_group (str): Environment group e.g. "farm".
+        env (dict): Initial environment variables. `os.environ` is used when
+            not passed.
+        cache_dir (str): Shared directory where environments are stored.
+            Value of 'OPENPYPE_ENVIRONMENTS_CACHE_DIR' is used if not passed.
+            Environments are always computed if directory is not set.
+
+    Returns:
+        dict: Environments for passed context and application.
+    """
+    from avalon.api import AvalonMongoDB
+
+    if cache_dir is None:
+        cache_dir = os.environ.get("OPENPYPE_ENVIRONMENTS_CACHE_DIR")
+
+    if not cache_dir:
+        return get_app_environments_for_context(
+            project_name, asset_name, task_name, app_name, env_group, env
+        )
+
+    if env is None:
+        env = os.environ.copy()
+
+    dbcon = AvalonMongoDB()
+    dbcon.Session["AVALON_PROJECT"] = project_name
+    dbcon.install()
+    project_doc = dbcon.find_one({"type": "project"})
+    asset_doc = dbcon.find_one({
+        "type": "asset",
+        "name": asset_name
+    })
+    dbcon.uninstall()
+
+    log = get_logger()
+    cache = AppEnvironmentsCache(cache_dir)
+    key = cache.get_key(
+        project_name, asset_name, task_name, app_name, env_group, env,
+        project_doc, asset_doc
+    )
+    cached_env = cache.get(key, env)
+    if cached_env is not None:
+        log.debug("Using cached environments \"{}\"".format(key))
+        return cached_env
+
+    output = get_app_environments_for_context(
+        project_name, asset_name, task_name, app_name, env_group, dict(env)
+    )
+    cache.set(key, output, env)
+    return output
+
+
 def _merge_env(env, current_env):
     """Modified function(merge) from acre module."""
     import acre
@@ -1,10 +1,16 @@
 """Events holding data about specific event."""
 import os
 import re
+import time
 import inspect
 import logging
 import weakref
+import itertools
+import threading
+import collections
 from uuid import uuid4
+
+from six.moves import queue
 try:
     from weakref import WeakMethod
 except Exception:
@@ -88,6 +94,11 @@ class EventCallback(object):
         self._ref_valid = func_ref is not None
         self._enabled = True
 
+        # Metrics of callback execution
+        self._process_count = 0
+        self._process_time = 0.0
+        self._max_process_time = 0.0
+
     def __repr__(self):
         return "< {} - {} > {}".format(
             self.__class__.__name__, self._func_name, self._func_path
@@ -99,10 +110,28 @@ class EventCallback(object):
             self._log = logging.getLogger(self.__class__.__name__)
         return self._log
 
+    @property
+    def topic(self):
+        return self._topic
+
     @property
     def is_ref_valid(self):
         return self._ref_valid
 
+    @property
+    def metrics(self):
+        """Execution metrics of callback.
+
+        Returns:
+            dict: Count of executions, total and max time of execution in
+                seconds.
+        """
+        return {
+            "count": self._process_count,
+            "total_time": self._process_time,
+            "max_time": self._max_process_time
+        }
+
     def validate_ref(self):
         if not self._ref_valid:
             return
@@ -135,7 +164,9 @@ class EventCallback(object):
         Args:
             event(Event): Event that was triggered.
         """
+        self._process_event(event, True)
 
+    def _process_event(self, event, check_topic):
         # Skip if callback is not enabled or has invalid reference
         if not self._ref_valid or not self._enabled:
             return
@@ -146,22 +177,33 @@ class EventCallback(object):
         if not callback:
             # Change state if is invalid so the callback is removed
             self._ref_valid = False
+            return
 
-        elif self.topic_matches(event.topic):
-            # Try execute callback
-            try:
-                if self._expect_args:
-                    callback(event)
-                else:
-                    callback()
-
-            except Exception:
-                self.log.warning(
-                    "Failed to execute event callback {}".format(
-                        str(repr(self))
-                    ),
-                    exc_info=True
-                )
+        if check_topic and not self.topic_matches(event.topic):
+            return
+
+        # Try execute callback
+        start_time = time.time()
+        try:
+            if self._expect_args:
+                callback(event)
+            else:
+                callback()
+
+        except Exception:
+            self.log.warning(
+                "Failed to execute event callback {}".format(
+                    str(repr(self))
+                ),
+                exc_info=True
+            )
+
+        finally:
+            duration = time.time() - start_time
+            self._process_count += 1
+            self._process_time += duration
+            if duration > self._max_process_time:
+                self._max_process_time = duration
 
 
 # Inherit from 'object' for Python 2 hosts
@@ -209,30 +251,199 @@ class Event(object):
     def topic(self):
         return self._topic
 
-    def emit(self):
-        """Emit event and trigger callbacks."""
-        StoredCallbacks.emit_event(self)
+    def emit(self, queued=False):
+        """Emit event and trigger callbacks.
+
+        Args:
+            queued (bool): Callbacks are triggered in a background thread
+                in order of emitted events. Callbacks which must run in
+                main thread (e.g. using UI or host API) should not be used
+                with queued events.
+        """
+        if queued:
+            StoredCallbacks.emit_event_queued(self)
+        else:
+            StoredCallbacks.emit_event(self)
+
+
+class _TopicPrefixNode(object):
+    """Node of trie with callbacks registered to a topic prefix."""
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self):
+        self.children = {}
+        self.callbacks = []
 
 
 class StoredCallbacks:
-    _registered_callbacks = []
+    """Registry of callbacks indexed by topic.
+
+    Callbacks are indexed by exact topic, by topic prefix when topic ends
+    with '*' (e.g. "workfile.*") and rest of topics with '*' are matched by
+    regex. Resolved callbacks are cached by event topic until registered
+    callbacks change. Each item in index is tuple with registration order
+    and callback so callbacks are triggered in order of registration.
+    """
+    _exact_callbacks = collections.defaultdict(list)
+    _prefix_root = _TopicPrefixNode()
+    _pattern_callbacks = []
+    _callbacks_by_topic = {}
+    _max_cached_topics = 1024
+    _order_counter = itertools.count()
+    _lock = threading.RLock()
+
+    _event_queue = None
+    _queue_thread = None
+
+    @staticmethod
+    def _get_topic_prefix(topic):
+        """Prefix of topic if topic can be matched by prefix.
+
+        Returns:
+            Union[str, None]: Prefix or None if topic does not contain '*'
+                or contain '*' in other place than at the end.
+        """
+        if topic.find("*") == len(topic) - 1:
+            return topic[:-1]
+        return None
+
+    @classmethod
+    def _get_callback_items(cls, topic, create=False):
+        """List in index where callbacks with the topic are stored."""
+        if "*" not in topic:
+            if create:
+                return cls._exact_callbacks[topic]
+            return cls._exact_callbacks.get(topic)
+
+        prefix = cls._get_topic_prefix(topic)
+        if prefix is None:
+            return cls._pattern_callbacks
+
+        node = cls._prefix_root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = _TopicPrefixNode()
+                node.children[char] = child
+            node = child
+        return node.callbacks
 
     @classmethod
     def add_callback(cls, topic, callback):
         callback = EventCallback(topic, callback)
-        cls._registered_callbacks.append(callback)
+        with cls._lock:
+            items = cls._get_callback_items(topic, True)
+            items.append((next(cls._order_counter), callback))
+            cls._callbacks_by_topic.clear()
         return callback
 
+    @classmethod
+    def _remove_callbacks(cls, callbacks):
+        with cls._lock:
+            for callback in callbacks:
+                items = cls._get_callback_items(callback.topic)
+                if not items:
+                    continue
+                for item in items:
+                    if item[1] is callback:
+                        items.remove(item)
+                        break
+            cls._callbacks_by_topic.clear()
+
+    @classmethod
+    def get_topic_callbacks(cls, topic):
+        """Callbacks listening to a topic in order of registration.
+
+        Args:
+            topic (str): Topic of event.
+
+        Returns:
+            tuple: Callbacks matching the topic.
+        """
+        callbacks = cls._callbacks_by_topic.get(topic)
+        if callbacks is not None:
+            return callbacks
+
+        with cls._lock:
+            items = list(cls._exact_callbacks.get(topic) or [])
+            # Wildcard requires at least one character so only prefixes
+            #   shorter than topic are matching
+            node = cls._prefix_root
+            for char in topic:
+                items.extend(node.callbacks)
+                node = node.children.get(char)
+                if node is None:
+                    break
+
+            for item in cls._pattern_callbacks:
+                if item[1].topic_matches(topic):
+                    items.append(item)
+
+            items.sort(key=lambda item: item[0])
+            callbacks = tuple(item[1] for item in items)
+            if len(cls._callbacks_by_topic) >= cls._max_cached_topics:
+                cls._callbacks_by_topic.clear()
+            cls._callbacks_by_topic[topic] = callbacks
+        return callbacks
+
+    @classmethod
+    def get_callbacks(cls):
+        """All registered callbacks in order of registration."""
+        with cls._lock:
+            items = list(cls._pattern_callbacks)
+            for exact_items in cls._exact_callbacks.values():
+                items.extend(exact_items)
+
+            queue_nodes = collections.deque([cls._prefix_root])
+            while queue_nodes:
+                node = queue_nodes.popleft()
+                items.extend(node.callbacks)
+                queue_nodes.extend(node.children.values())
+
+        items.sort(key=lambda item: item[0])
+        return [item[1] for item in items]
+
     @classmethod
     def emit_event(cls, event):
         invalid_callbacks = []
-        for callback in cls._registered_callbacks:
-            callback.process_event(event)
+        for callback in cls.get_topic_callbacks(event.topic):
+            callback._process_event(event, False)
             if not callback.is_ref_valid:
                 invalid_callbacks.append(callback)
 
-        for callback in invalid_callbacks:
-            cls._registered_callbacks.remove(callback)
+        if invalid_callbacks:
+            cls._remove_callbacks(invalid_callbacks)
+
+    @classmethod
+    def emit_event_queued(cls, event):
+        with cls._lock:
+            if cls._event_queue is None:
+                cls._event_queue = queue.Queue()
+
+            if cls._queue_thread is None or not cls._queue_thread.is_alive():
+                thread = threading.Thread(
+                    target=cls._process_queue, name="EventsQueue"
+                )
+                thread.daemon = True
+                thread.start()
+                cls._queue_thread = thread
+        cls._event_queue.put(event)
+
+    @classmethod
+    def _process_queue(cls):
+        while True:
+            event = cls._event_queue.get()
+            try:
+                cls.emit_event(event)
+            finally:
+                cls._event_queue.task_done()
+
+    @classmethod
+    def wait_for_queued_events(cls):
+        if cls._event_queue is not None:
+            cls._event_queue.join()
 
 
 def register_event_callback(topic, callback):
@@ -252,17 +463,44 @@ def register_event_callback(topic, callback):
     return StoredCallbacks.add_callback(topic, callback)
 
 
-def emit_event(topic, data=None, source=None):
+def emit_event(topic, data=None, source=None, queued=False):
     """Emit event with topic and data.
 
     Arg:
         topic(str): Event's topic.
         data(dict): Event's additional data. Optional.
         source(str): Who emitted the topic. Optional.
+        queued(bool): Trigger callbacks in background thread, callbacks are
+            triggered in order of emitted events. Optional.
 
     Returns:
         Event: Object of event that was emitted.
     """
     event = Event(topic, data, source)
-    event.emit()
+    event.emit(queued)
     return event
+
+
+def wait_for_queued_events():
+    """Wait until callbacks of all queued events are processed."""
+    StoredCallbacks.wait_for_queued_events()
+
+
+def get_event_callbacks_metrics():
+    """Execution metrics of registered callbacks.
+
+    Returns:
+        list: Dictionaries with topic, name and filepath of callback function
+            and with count of executions, total and max time of execution
+            in seconds.
+    """
+    output = []
+    for callback in StoredCallbacks.get_callbacks():
+        metrics = callback.metrics
+        metrics.update({
+            "topic": callback.topic,
+            "name": callback._func_name,
+            "filepath": callback._func_path
+        })
+        output.append(metrics)
+    return output
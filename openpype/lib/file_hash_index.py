@@ -0,0 +1,200 @@
+"""Local persistent index of file content hashes.
+
+Index stores content hash of files keyed by file identity (device, inode,
+modification time and size). Content of a file is hashed only once while
+the file is not changed. Published files are stored by their content hash
+so publishing of file with identical content can reuse already published
+file (e.g. by hardlink) instead of copying it again.
+
+Index is stored in sqlite database in OpenPype's user data directory.
+"""
+import os
+import time
+import sqlite3
+import logging
+import contextlib
+
+import appdirs
+
+log = logging.getLogger(__name__)
+
+
+class FileHashIndex(object):
+    """Persistent index of file content hashes.
+
+    Args:
+        path (str): Path to sqlite database file. Database in OpenPype's
+            user data directory is used by default.
+    """
+
+    filename = "file_hash_index.db"
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                self.filename
+            )
+        self.path = path
+        self._initialized = False
+
+    @staticmethod
+    def file_key(filepath, stat_result=None):
+        """Identity of file content.
+
+        Returns:
+            tuple: Device, inode, modification time and size of file.
+        """
+        if stat_result is None:
+            stat_result = os.stat(filepath)
+        return (
+            stat_result.st_dev,
+            stat_result.st_ino,
+            stat_result.st_mtime,
+            stat_result.st_size
+        )
+
+    @contextlib.contextmanager
+    def _connection(self):
+        if not self._initialized:
+            dirpath = os.path.dirname(self.path)
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            if not self._initialized:
+                self._create_tables(connection)
+                self._initialized = True
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def _create_tables(self, connection):
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS file_hashes ("
+            " device INTEGER, inode INTEGER, mtime REAL, size INTEGER,"
+            " algorithm TEXT, checksum TEXT, path TEXT,"
+            " PRIMARY KEY (device, inode, mtime, size, algorithm))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS published_files ("
+            " algorithm TEXT, checksum TEXT, size INTEGER, path TEXT,"
+            " created REAL,"
+            " PRIMARY KEY (algorithm, checksum, size, path))"
+        )
+
+    def get_checksum(self, filepath, algorithm, stat_result=None):
+        """Stored checksum of file if file did not change since stored.
+
+        Returns:
+            Union[str, None]: Checksum or None if is not known.
+        """
+        try:
+            key = self.file_key(filepath, stat_result)
+        except OSError:
+            return None
+
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT checksum FROM file_hashes WHERE device=? AND inode=?"
+                " AND mtime=? AND size=? AND algorithm=?",
+                key + (algorithm, )
+            ).fetchone()
+        if row:
+            return row[0]
+        return None
+
+    def store_checksums(self, items, algorithm):
+        """Store checksums of files.
+
+        Args:
+            items (Iterable[tuple]): Filepath, checksum and optionally
+                stat result of file.
+            algorithm (str): Algorithm used for checksums.
+        """
+        rows = []
+        for item in items:
+            filepath, checksum = item[:2]
+            stat_result = item[2] if len(item) > 2 else None
+            try:
+                key = self.file_key(filepath, stat_result)
+            except OSError:
+                continue
+            rows.append(key + (algorithm, checksum, filepath))
+
+        if not rows:
+            return
+
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO file_hashes"
+                " (device, inode, mtime, size, algorithm, checksum, path)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def add_published_files(self, items, algorithm):
+        """Store published files by their checksums.
+
+        Args:
+            items (Iterable[tuple]): Published filepath, checksum and size.
+            algorithm (str): Algorithm used for checksums.
+        """
+        now = time.time()
+        rows = [
+            (algorithm, checksum, size, filepath, now)
+            for filepath, checksum, size in items
+        ]
+        if not rows:
+            return
+
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO published_files"
+                " (algorithm, checksum, size, path, created)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def find_published_file(self, checksum, size, algorithm):
+        """Find published file with same content.
+
+        Published file is validated that it still exists and was not changed
+        since it was stored. Invalid records are removed from index.
+
+        Returns:
+            Union[str, None]: Path to published file with same content.
+        """
+        with self._connection() as connection:
+            rows = connection.execute(
+                "SELECT path FROM published_files WHERE algorithm=?"
+                " AND checksum=? AND size=? ORDER BY created DESC",
+                (algorithm, checksum, size)
+            ).fetchall()
+
+        invalid_paths = []
+        found_path = None
+        for row in rows:
+            path = row[0]
+            stored_checksum = None
+            if os.path.exists(path):
+                stored_checksum = self.get_checksum(path, algorithm)
+
+            if stored_checksum == checksum:
+                found_path = path
+                break
+            invalid_paths.append(path)
+
+        if invalid_paths:
+            with self._connection() as connection:
+                connection.executemany(
+                    "DELETE FROM published_files WHERE algorithm=?"
+                    " AND checksum=? AND path=?",
+                    [
+                        (algorithm, checksum, path)
+                        for path in invalid_paths
+                    ]
+                )
+        return found_path
@@ -0,0 +1,528 @@
+"""Transfer of files to publish destinations.
+
+Engine copies (or hardlinks) files from source to destination using pool
+of worker threads. Each file transfer is retried with exponential backoff
+and can optionally calculate checksum of transferred content during copy,
+so source file is read only once.
+
+Example:
+    ```
+    engine = FileTransferEngine(max_workers=8, checksum_algorithm="sha256")
+    for src, dst in transfers:
+        engine.add_transfer(src, dst)
+    report = engine.process()
+    report.log_summary(log)
+    ```
+
+Checksum algorithm can be any algorithm available in `hashlib` or
+"xxh64"/"xxh3_64"/"xxh128" if `xxhash` python module is available.
+"""
+import os
+import sys
+import time
+import errno
+import hashlib
+import logging
+import threading
+
+import six
+from six.moves import queue
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from .path_tools import create_hard_link
+
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    try:
+        from speedcopy import copyfile
+    except ImportError:
+        from shutil import copyfile
+else:
+    from shutil import copyfile
+
+log = logging.getLogger(__name__)
+
+# Size of chunk read from source when checksum is calculated (8MB)
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def new_hasher(algorithm):
+    """Create hash object for checksum algorithm.
+
+    Args:
+        algorithm (str): Name of algorithm.
+
+    Raises:
+        ValueError: When algorithm is not available.
+    """
+    if algorithm.startswith("xxh"):
+        if xxhash is None:
+            raise ValueError((
+                "Checksum algorithm \"{}\" requires python module 'xxhash'."
+            ).format(algorithm))
+        hasher_cls = getattr(xxhash, algorithm, None)
+        if hasher_cls is None:
+            raise ValueError(
+                "Unknown xxhash algorithm \"{}\"".format(algorithm)
+            )
+        return hasher_cls()
+    return hashlib.new(algorithm)
+
+
+class FileTransferError(Exception):
+    """Transfer of one or more files failed."""
+
+    def __init__(self, message, failed_transfers=None):
+        self.failed_transfers = failed_transfers or []
+        super(FileTransferError, self).__init__(message)
+
+
+class TransferResult(object):
+    """Result of single file transfer.
+
+    Args:
+        src (str): Source filepath.
+        dst (str): Destination filepath.
+        mode (str): Transfer mode ("copy" or "hardlink").
+    """
+
+    def __init__(self, src, dst, mode):
+        self.src = src
+        self.dst = dst
+        self.mode = mode
+        self.size = 0
+        self.stat = None
+        self.checksum = None
+        self.attempts = 0
+        self.start_time = None
+        self.end_time = None
+        self.root_name = None
+
+    @property
+    def duration(self):
+        if self.start_time is None or self.end_time is None:
+            return 0.0
+        return self.end_time - self.start_time
+
+
+class TransferReport(object):
+    """Collected results of file transfers.
+
+    Results are grouped by destination root so it is possible to see
+    throughput of each storage.
+
+    Args:
+        roots (dict): Root paths by root names. Destinations which are not
+            under any of the roots are grouped under "other".
+    """
+
+    other_root_name = "other"
+
+    def __init__(self, roots=None):
+        self._roots = []
+        for root_name, root_path in (roots or {}).items():
+            if not root_path:
+                continue
+            root_path = os.path.normpath(str(root_path))
+            self._roots.append((root_name, os.path.normcase(root_path)))
+        # Longer roots first so nested roots are matched correctly
+        self._roots.sort(key=lambda item: len(item[1]), reverse=True)
+
+        self._results = []
+        self._results_by_dst = {}
+        self._lock = threading.Lock()
+
+    def root_name_for_path(self, path):
+        """Name of root under which is path located."""
+        path = os.path.normcase(os.path.normpath(path))
+        for root_name, root_path in self._roots:
+            if path == root_path or path.startswith(root_path + os.sep):
+                return root_name
+        return self.other_root_name
+
+    def add_result(self, result):
+        result.root_name = self.root_name_for_path(result.dst)
+        with self._lock:
+            self._results.append(result)
+            self._results_by_dst[result.dst] = result
+
+    @property
+    def results(self):
+        return list(self._results)
+
+    def get_file_sizes(self):
+        """Size of transferred files by destination path."""
+        return {
+            result.dst: result.size
+            for result in self._results
+        }
+
+    def get_result(self, dst):
+        """Result of transfer to destination path."""
+        return self._results_by_dst.get(os.path.normpath(dst))
+
+    def get_checksums(self):
+        """Checksums of transferred files by destination path.
+
+        Only files with calculated checksum are returned.
+        """
+        return {
+            result.dst: result.checksum
+            for result in self._results
+            if result.checksum
+        }
+
+    def get_root_stats(self):
+        """Transfer statistics for each destination root.
+
+        Throughput is calculated from wall clock time between start of first
+        and end of last transfer into the root, so parallel transfers are
+        not counted multiple times.
+
+        Returns:
+            dict: Statistics by root name with keys "files", "bytes",
+                "duration" and "bytes_per_second".
+        """
+        by_root = {}
+        for result in self._results:
+            by_root.setdefault(result.root_name, []).append(result)
+
+        output = {}
+        for root_name, results in by_root.items():
+            start_times = [
+                result.start_time
+                for result in results
+                if result.start_time is not None
+            ]
+            end_times = [
+                result.end_time
+                for result in results
+                if result.end_time is not None
+            ]
+            duration = 0.0
+            if start_times and end_times:
+                duration = max(end_times) - min(start_times)
+
+            total_bytes = sum(result.size for result in results)
+            bytes_per_second = None
+            if duration > 0:
+                bytes_per_second = total_bytes / duration
+
+            output[root_name] = {
+                "files": len(results),
+                "bytes": total_bytes,
+                "duration": duration,
+                "bytes_per_second": bytes_per_second
+            }
+        return output
+
+    def log_summary(self, logger=None):
+        """Log transfer statistics of each destination root."""
+        if logger is None:
+            logger = log
+
+        for root_name, stats in sorted(self.get_root_stats().items()):
+            speed = stats["bytes_per_second"]
+            if speed is None:
+                speed_msg = "N/A"
+            else:
+                speed_msg = "{:.2f} MB/s".format(speed / (1024.0 ** 2))
+            logger.info((
+                "Transferred {} files ({:.2f} MB) to root \"{}\""
+                " in {:.2f}s ({})"
+            ).format(
+                stats["files"],
+                stats["bytes"] / (1024.0 ** 2),
+                root_name,
+                stats["duration"],
+                speed_msg
+            ))
+
+
+class FileTransferEngine(object):
+    """Transfer files using pool of worker threads.
+
+    Transfers are collected with `add_transfer` and processed at once with
+    `process`. Subclasses can change how single file is transferred by
+    overriding `copy_file` or `hardlink_file`.
+
+    Args:
+        max_workers (int): Number of files transferred in parallel.
+        retries (int): How many times is failed transfer retried.
+        retry_delay (float): Delay in seconds before first retry. Delay is
+            doubled for each next retry.
+        checksum_algorithm (str): Name of algorithm used to calculate
+            checksum of copied content (see `new_hasher`). Checksum is not
+            calculated when not set.
+        chunk_size (int): Size of chunks read from source when checksum is
+            calculated.
+        roots (dict): Root paths by root name used to group transfer report.
+        logger (logging.Logger): Logger used for messages.
+    """
+
+    modes = ("copy", "hardlink")
+
+    def __init__(
+        self,
+        max_workers=1,
+        retries=3,
+        retry_delay=1.0,
+        checksum_algorithm=None,
+        chunk_size=None,
+        roots=None,
+        logger=None
+    ):
+        if checksum_algorithm:
+            # Validate algorithm before any transfer starts
+            new_hasher(checksum_algorithm)
+
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.retries = max(int(retries or 0), 0)
+        self.retry_delay = retry_delay
+        self.checksum_algorithm = checksum_algorithm or None
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.roots = roots
+        self.log = logger or log
+
+        self._transfers = []
+
+    def add_transfer(
+        self, src, dst, mode="copy", link_src=None, checksum=None
+    ):
+        """Add file which should be transferred.
+
+        Args:
+            src (str): Source filepath.
+            dst (str): Destination filepath.
+            mode (str): "copy" or "hardlink".
+            link_src (str): File with same content as source which should
+                be hardlinked to destination instead of copy. Source is
+                copied if hardlink can't be created.
+            checksum (str): Known checksum of source content. Used for
+                hardlinked files so their content is not read.
+        """
+        if mode not in self.modes:
+            raise ValueError(
+                "Unknown transfer mode \"{}\". Expected one of {}".format(
+                    mode, ", ".join(self.modes)
+                )
+            )
+        if link_src:
+            link_src = os.path.normpath(link_src)
+        self._transfers.append(
+            (
+                os.path.normpath(src),
+                os.path.normpath(dst),
+                mode,
+                link_src,
+                checksum
+            )
+        )
+
+    def process(self):
+        """Process all added transfers.
+
+        Returns:
+            TransferReport: Report of processed transfers.
+
+        Raises:
+            FileTransferError: When any transfer failed after all retries.
+                Transfers which did not start yet are skipped.
+        """
+        transfers = self._transfers
+        self._transfers = []
+
+        report = TransferReport(self.roots)
+        if not transfers:
+            return report
+
+        transfers_queue = queue.Queue()
+        for item in transfers:
+            transfers_queue.put(item)
+
+        failed = []
+        stop_event = threading.Event()
+        failed_lock = threading.Lock()
+
+        def worker():
+            while not stop_event.is_set():
+                try:
+                    item = transfers_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                src, dst = item[:2]
+                try:
+                    report.add_result(self._process_transfer(*item))
+                except Exception:
+                    with failed_lock:
+                        failed.append((src, dst, sys.exc_info()))
+                    stop_event.set()
+
+        workers_count = min(self.max_workers, len(transfers))
+        if workers_count == 1:
+            worker()
+        else:
+            threads = []
+            for _ in range(workers_count):
+                thread = threading.Thread(target=worker)
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+
+            for thread in threads:
+                thread.join()
+
+        if failed:
+            src, dst, exc_info = failed[0]
+            self.log.warning(
+                "Transfer failed {} -> {}".format(src, dst),
+                exc_info=exc_info
+            )
+            raise FileTransferError(
+                "Failed to transfer {} file/s. First failed: {} -> {} ({})"
+                .format(len(failed), src, dst, exc_info[1]),
+                [(src, dst) for src, dst, _ in failed]
+            )
+        return report
+
+    def _process_transfer(
+        self, src, dst, mode, link_src=None, checksum=None
+    ):
+        result = TransferResult(src, dst, mode)
+        result.start_time = time.time()
+
+        self._create_dirs(os.path.dirname(dst))
+
+        if link_src:
+            try:
+                result.size, result.checksum = self.hardlink_file(
+                    link_src, dst, checksum
+                )
+                result.mode = "hardlink"
+                result.attempts = 1
+                result.stat = os.stat(dst)
+                result.end_time = time.time()
+                return result
+
+            except (IOError, OSError):
+                self.log.debug((
+                    "Hardlink of existing file {} failed. Copying {}"
+                ).format(link_src, src), exc_info=True)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            result.attempts = attempt
+            try:
+                if mode == "hardlink":
+                    size, checksum = self.hardlink_file(src, dst, checksum)
+                else:
+                    size, checksum = self.copy_file(src, dst)
+                break
+
+            except (IOError, OSError, FileTransferError):
+                if attempt > self.retries:
+                    raise
+
+                delay = self.retry_delay * (2 ** (attempt - 1))
+                self.log.warning((
+                    "Transfer {} -> {} failed (attempt {}/{})."
+                    " Retrying in {:.1f}s"
+                ).format(src, dst, attempt, self.retries + 1, delay),
+                    exc_info=True
+                )
+                time.sleep(delay)
+
+        result.size = size
+        result.checksum = checksum
+        result.stat = os.stat(dst)
+        result.end_time = time.time()
+        return result
+
+    def _create_dirs(self, dirpath):
+        try:
+            os.makedirs(dirpath)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                six.reraise(*sys.exc_info())
+
+    def copy_file(self, src, dst):
+        """Copy single file and validate size of copied file.
+
+        Args:
+            src (str): Source filepath.
+            dst (str): Destination filepath.
+
+        Returns:
+            tuple: Size of copied file and checksum (None if checksum
+                algorithm is not set).
+        """
+        self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        # Destination may be hardlink of source from previous publish
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            os.remove(dst)
+
+        expected_size = os.path.getsize(src)
+        checksum = None
+        if self.checksum_algorithm:
+            copied_size, checksum = self._stream_copy(src, dst)
+        else:
+            copyfile(src, dst)
+            copied_size = os.path.getsize(dst)
+
+        if copied_size != expected_size:
+            raise FileTransferError((
+                "Size of copied file does not match source"
+                " ({} != {}) {} -> {}"
+            ).format(copied_size, expected_size, src, dst))
+        return copied_size, checksum
+
+    def hardlink_file(self, src, dst, checksum=None):
+        """Create hardlink of file if destination does not exist yet.
+
+        Checksum is calculated from destination content if checksum
+        algorithm is set and checksum is not passed.
+
+        Returns:
+            tuple: Size of destination file and checksum.
+        """
+        self.log.debug("Hardlinking file ... {} -> {}".format(src, dst))
+        if not os.path.exists(dst):
+            create_hard_link(src, dst)
+
+        if not self.checksum_algorithm:
+            checksum = None
+        elif checksum is None:
+            checksum = self.file_checksum(dst)
+        return os.path.getsize(dst), checksum
+
+    def file_checksum(self, filepath):
+        """Calculate checksum of file content."""
+        hasher = new_hasher(self.checksum_algorithm)
+        with open(filepath, "rb") as stream:
+            while True:
+                chunk = stream.read(self.chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _stream_copy(self, src, dst):
+        """Copy file by chunks and calculate checksum during copy."""
+        hasher = new_hasher(self.checksum_algorithm)
+        copied_size = 0
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                while True:
+                    chunk = src_stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    dst_stream.write(chunk)
+                    copied_size += len(chunk)
+        return copied_size, hasher.hexdigest()
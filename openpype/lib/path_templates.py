@@ -16,6 +16,39 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Max count of items in caches of parsed templates and keys
+PARSE_CACHE_LIMIT = 4096
+_KEY_SUBDICT_CACHE = {}
+
+
+def split_key_to_subdicts(key):
+    """Split formatting key to keys of subdictionaries.
+
+    Padding and other formatting modifiers are removed from the key. Result
+    is cached as the same keys are split for each formatted template.
+
+    Example:
+        "project[name]" -> ("project", "name")
+        "frame:0>4" -> ("frame", )
+
+    Args:
+        key (str): Key from template without curly brackets.
+
+    Returns:
+        tuple: Keys of subdictionaries.
+    """
+    key_subdict = _KEY_SUBDICT_CACHE.get(key)
+    if key_subdict is None:
+        existence_check = key
+        key_padding = KEY_PADDING_PATTERN.findall(existence_check)
+        if key_padding:
+            existence_check = key_padding[0]
+        key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+        if len(_KEY_SUBDICT_CACHE) >= PARSE_CACHE_LIMIT:
+            _KEY_SUBDICT_CACHE.clear()
+        _KEY_SUBDICT_CACHE[key] = key_subdict
+    return key_subdict
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -86,7 +119,14 @@ class TemplateUnsolved(Exception):
 
 
 class StringTemplate(object):
-    """String that can be formatted."""
+    """String that can be formatted.
+
+    Template is parsed to parts only once. Parsed parts are cached by
+    template string and shared between objects because they don't hold any
+    state of formatting.
+    """
+    _parts_cache = {}
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -94,6 +134,25 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        parts = self._parts_cache.get(template)
+        if parts is None:
+            parts = self.parse_template(template)
+            if len(self._parts_cache) >= PARSE_CACHE_LIMIT:
+                self._parts_cache.clear()
+            self._parts_cache[template] = parts
+        self._parts = parts
+
+    @classmethod
+    def parse_template(cls, template):
+        """Parse template string to formatting parts.
+
+        Args:
+            template (str): Template to parse.
+
+        Returns:
+            tuple: Parts of template. Can contain 'str', 'OptionalPart' or
+                'FormattingPart'.
+        """
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -124,7 +183,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return tuple(cls.find_optional_parts(new_parts))
 
     def __str__(self):
         return self.template
@@ -319,9 +378,30 @@ class TemplatesDict(object):
 
         return output
 
+    def _solve_dict_lazy(self, templates, data):
+        """Prepare templates to be solved on first access.
+
+        Values are solved by `TemplatesResultDict` when are accessed so only
+        templates that are really used are formatted.
+
+        Args:
+            templates (dict): All templates which will be formatted.
+            data (dict): Containing keys to be filled into template.
+
+        Returns:
+            dict: With `LazyTemplateValue` in values.
+        """
+        return {
+            key: LazyTemplateValue(self, value, data)
+            for key, value in templates.items()
+        }
+
     def format(self, in_data, only_keys=True, strict=True):
         """ Solves templates based on entered data.
 
+        Templates are formatted lazily when their key is accessed in result.
+        Data are copied so changes of passed data don't affect the result.
+
         Args:
             data (dict): Containing keys to be filled into template.
             only_keys (bool, optional): Decides if environ will be used to
@@ -342,13 +422,45 @@ class TemplatesDict(object):
                 if env_key not in data:
                     data[env_key] = val
 
-        solved = self._solve_dict(self.objected_templates, data)
+        return self._format_data(data, strict)
+
+    def _format_data(self, data, strict=True):
+        """Create result dictionary for already copied data."""
+        solved = self._solve_dict_lazy(self.objected_templates, data)
 
         output = TemplatesResultDict(solved)
         output.strict = strict
         return output
 
 
+class LazyTemplateValue(object):
+    """Template value in result dictionary which is solved on access.
+
+    Args:
+        templates_dict (TemplatesDict): Object which formats the value.
+        value (Any): Objected template or dictionary with templates.
+        data (dict): Data used for formatting.
+    """
+    __slots__ = ("_templates_dict", "_value", "_data")
+
+    def __init__(self, templates_dict, value, data):
+        self._templates_dict = templates_dict
+        self._value = value
+        self._data = data
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, repr(self._value))
+
+    def solve(self):
+        # Subdictionaries are also solved lazily, only objects inherited
+        #   from dictionary (e.g. 'RootItem') are passed to templates object
+        if type(self._value) is dict:
+            return self._templates_dict._solve_dict_lazy(
+                self._value, self._data
+            )
+        return self._templates_dict._format_value(self._value, self._data)
+
+
 class TemplateResult(str):
     """Result of template format with most of information in.
 
@@ -393,7 +505,12 @@ class TemplateResult(str):
 
 
 class TemplatesResultDict(dict):
-    """Holds and wrap TemplateResults for easy bug report."""
+    """Holds and wrap TemplateResults for easy bug report.
+
+    Values may contain `LazyTemplateValue` which are solved on first access
+    of the key. All values are solved when they are accessed at once (e.g.
+    'items', 'values' or iteration).
+    """
 
     def __init__(self, in_data, key=None, parent=None, strict=None):
         super(TemplatesResultDict, self).__init__()
@@ -409,12 +526,12 @@ class TemplatesResultDict(dict):
             self.strict = True
 
     def __getitem__(self, key):
-        if key not in self.keys():
+        if key not in self:
             hier = self.hierarchy()
             hier.append(key)
             raise TemplateMissingKey(hier)
 
-        value = super(TemplatesResultDict, self).__getitem__(key)
+        value = self._solve_value(key)
         if isinstance(value, self.__class__):
             return value
 
@@ -423,6 +540,78 @@ class TemplatesResultDict(dict):
             value.validate()
         return value
 
+    def _solve_value(self, key):
+        value = super(TemplatesResultDict, self).__getitem__(key)
+        if isinstance(value, LazyTemplateValue):
+            value = value.solve()
+            if isinstance(value, dict):
+                value = self.__class__(value, key, self)
+            super(TemplatesResultDict, self).__setitem__(key, value)
+        return value
+
+    def _solve_values(self):
+        for key in tuple(self.keys()):
+            self._solve_value(key)
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self._solve_value(key)
+
+    def items(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).items()
+
+    def values(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).values()
+
+    def __iter__(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).__iter__()
+
+    if six.PY2:
+        def iteritems(self):
+            self._solve_values()
+            return super(TemplatesResultDict, self).iteritems()
+
+        def itervalues(self):
+            self._solve_values()
+            return super(TemplatesResultDict, self).itervalues()
+
+    def copy(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).copy()
+
+    def pop(self, key, *args):
+        if key in self:
+            self._solve_value(key)
+        return super(TemplatesResultDict, self).pop(key, *args)
+
+    def popitem(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).popitem()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self._solve_value(key)
+        return super(TemplatesResultDict, self).setdefault(key, default)
+
+    def __eq__(self, other):
+        self._solve_values()
+        if isinstance(other, TemplatesResultDict):
+            other._solve_values()
+        return super(TemplatesResultDict, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._solve_values()
+        return super(TemplatesResultDict, self).__repr__()
+
     @property
     def raise_on_unsolved(self):
         """To affect this change `strict` attribute."""
@@ -581,13 +770,10 @@ class TemplatePartResult:
     def split_keys_to_subdicts(values):
         output = {}
         for key, value in values.items():
-            key_padding = list(KEY_PADDING_PATTERN.findall(key))
-            if key_padding:
-                key = key_padding[0]
-            key_subdict = list(SUB_DICT_PATTERN.findall(key))
+            key_subdict = split_key_to_subdicts(key)
             data = output
-            last_key = key_subdict.pop(-1)
-            for subkey in key_subdict:
+            last_key = key_subdict[-1]
+            for subkey in key_subdict[:-1]:
                 if subkey not in data:
                     data[subkey] = {}
                 data = data[subkey]
@@ -650,6 +836,15 @@ class FormattingPart:
     """
     def __init__(self, template):
         self._template = template
+        # Key access plan is prepared once for all format calls
+        key = template[1:-1]
+        existence_check = key
+        key_padding = KEY_PADDING_PATTERN.findall(existence_check)
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = split_key_to_subdicts(key)
 
     @property
     def template(self):
@@ -679,17 +874,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
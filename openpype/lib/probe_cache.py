@@ -0,0 +1,157 @@
+"""Cache of media probe outputs shared by publish plugins and scripts.
+
+Probing tools (ffprobe, oiiotool) are called for the same files multiple
+times during publishing by different plugins and by burnin script. Their
+outputs are cached by path, modification time and size of the probed file
+so a changed file is probed again.
+
+Cache is kept in memory of the process. Outputs can be also stored to
+directory defined by 'OPENPYPE_PROBE_CACHE_DIR' environment variable which
+makes them available for subprocesses (e.g. burnin script) and following
+publishes.
+"""
+import os
+import io
+import hashlib
+import logging
+import tempfile
+import threading
+import collections
+
+log = logging.getLogger("ProbeCache")
+
+PROBE_CACHE_DIR_ENV = "OPENPYPE_PROBE_CACHE_DIR"
+
+
+class ProbeCache(object):
+    """Cache of probe outputs with LRU in memory and optional disk store.
+
+    Cached values are strings (raw output of probing tool) so each call
+    parses its own copy and value can be stored to disk.
+
+    Args:
+        max_items (int): Max count of outputs kept in memory.
+        cache_dir (str): Directory where outputs are stored, disk store is
+            not used if not set.
+    """
+
+    def __init__(self, max_items=512, cache_dir=None):
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(kind, path):
+        try:
+            stat_result = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return (
+            kind,
+            os.path.normpath(os.path.abspath(path)),
+            stat_result.st_mtime,
+            stat_result.st_size
+        )
+
+    def _get_cache_path(self, key):
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key_hash + ".cache")
+
+    def get(self, kind, path):
+        """Cached output of probe.
+
+        Args:
+            kind (str): Kind of probe e.g. "ffprobe".
+            path (str): Path to probed file.
+
+        Returns:
+            Union[str, None]: Cached output or None if is not cached.
+        """
+        key = self._get_key(kind, path)
+        if key is None:
+            return None
+
+        with self._lock:
+            value = self._items.pop(key, None)
+            if value is not None:
+                self._items[key] = value
+                return value
+
+        if not self.cache_dir:
+            return None
+
+        cache_path = self._get_cache_path(key)
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            with io.open(cache_path, "r", encoding="utf-8") as stream:
+                value = stream.read()
+        except (IOError, OSError, ValueError):
+            return None
+        self._store(key, value)
+        return value
+
+    def set(self, kind, path, value):
+        """Store output of probe.
+
+        Args:
+            kind (str): Kind of probe e.g. "ffprobe".
+            path (str): Path to probed file.
+            value (str): Output of probe.
+        """
+        key = self._get_key(kind, path)
+        if key is None:
+            return
+
+        self._store(key, value)
+        if not self.cache_dir:
+            return
+
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            cache_path = self._get_cache_path(key)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with io.open(fd, "w", encoding="utf-8") as stream:
+                stream.write(value)
+            try:
+                os.rename(tmp_path, cache_path)
+            except OSError:
+                # Output was stored by other process meanwhile
+                os.remove(tmp_path)
+        except (IOError, OSError):
+            log.warning(
+                "Failed to store probe output of \"{}\"".format(path),
+                exc_info=True
+            )
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def _store(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+
+_probe_cache = None
+
+
+def get_probe_cache():
+    """Probe cache of current process.
+
+    Returns:
+        ProbeCache: Cache using directory from 'OPENPYPE_PROBE_CACHE_DIR'
+            as disk store if is set.
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = ProbeCache(
+            cache_dir=os.environ.get(PROBE_CACHE_DIR_ENV) or None
+        )
+    return _probe_cache
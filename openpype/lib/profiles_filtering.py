@@ -1,8 +1,15 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters which make a filter value a regex instead of exact value
+REGEX_SPECIAL_CHARS = set("\\.^$*+?{}[]|()")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -122,6 +129,282 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+def _compile_profile_filter(in_list):
+    """Prepare profile filter for repeated validation of values.
+
+    Filter is split to exact values and compiled regexes. Exact values are
+    values without regex special characters so can be compared directly.
+
+    Args:
+        in_list (list): Filter values of profile.
+
+    Returns:
+        Union[tuple, None]: Exact values and compiled regexes or None if
+            filter accepts any value (empty or contain "*").
+    """
+    if not in_list:
+        return None
+
+    if not isinstance(in_list, (list, tuple, set)):
+        in_list = [in_list]
+
+    if "*" in in_list:
+        return None
+
+    exact_values = set()
+    regex_items = []
+    for item in in_list:
+        if not item:
+            continue
+
+        if (
+            isinstance(item, six.string_types)
+            and not REGEX_SPECIAL_CHARS.intersection(item)
+        ):
+            exact_values.add(item)
+        else:
+            regex_items.append(item)
+    return exact_values, compile_list_of_regexes(regex_items)
+
+
+def _match_regexes(value, regexes):
+    for regex in regexes:
+        if hasattr(regex, "fullmatch"):
+            result = regex.fullmatch(value)
+        else:
+            result = fullmatch(regex, value)
+        if result:
+            return True
+    return False
+
+
+class _ProfileKeyIndex(object):
+    """Profiles bucketed by filter of single key.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+        key (str): Key of filter in profiles.
+    """
+
+    def __init__(self, profiles_data, key):
+        # Indexes of profiles without filter for the key
+        self.unfiltered = set()
+        # Indexes of profiles by exact filter value
+        self.by_value = collections.defaultdict(set)
+        # Profiles with regexes
+        self.regex_items = []
+
+        for idx, profile in enumerate(profiles_data):
+            profile_filter = _compile_profile_filter(profile.get(key))
+            if profile_filter is None:
+                self.unfiltered.add(idx)
+                continue
+
+            exact_values, regexes = profile_filter
+            for value in exact_values:
+                self.by_value[value].add(idx)
+
+            if regexes:
+                self.regex_items.append((idx, regexes))
+
+    def get_matching(self, value):
+        """Indexes of profiles matching value with filter for the key.
+
+        Args:
+            value (Any): Value to match.
+
+        Returns:
+            set: Indexes of profiles with filter matching the value.
+        """
+        if not value:
+            return set()
+
+        try:
+            output = set(self.by_value.get(value) or ())
+        except TypeError:
+            output = set()
+
+        for idx, regexes in self.regex_items:
+            if idx not in output and _match_regexes(value, regexes):
+                output.add(idx)
+        return output
+
+
+class ProfileIndex(object):
+    """Index of profiles for repeated filtering with different values.
+
+    Filters of profiles are compiled only once and profiles are bucketed by
+    exact values of filters for each key, so only regex filters must be
+    evaluated on filtering. Results are cached by filtered values.
+
+    Matching logic is the same as in `filter_profiles`.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles_data = list(profiles_data or [])
+        self._key_indexes = {}
+        self._results = {}
+        self._lock = threading.Lock()
+
+    @property
+    def profiles_data(self):
+        return self._profiles_data
+
+    def _get_key_index(self, key):
+        key_index = self._key_indexes.get(key)
+        if key_index is None:
+            with self._lock:
+                key_index = self._key_indexes.get(key)
+                if key_index is None:
+                    key_index = _ProfileKeyIndex(self._profiles_data, key)
+                    self._key_indexes[key] = key_index
+        return key_index
+
+    def _find_matching_profiles(self, key_values, keys_order):
+        candidates = None
+        matching_by_key = []
+        for key in keys_order:
+            key_index = self._get_key_index(key)
+            matching = key_index.get_matching(key_values[key])
+            key_candidates = matching | key_index.unfiltered
+            if candidates is None:
+                candidates = key_candidates
+            else:
+                candidates &= key_candidates
+            matching_by_key.append(matching)
+            if not candidates:
+                return None
+
+        if candidates is None:
+            candidates = set(range(len(self._profiles_data)))
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [idx in matching for matching in matching_by_key]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            matching_profiles.append(
+                (self._profiles_data[idx], profile_scores)
+            )
+        return matching_profiles
+
+    def filter(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for passed values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles_data:
+            return None
+
+        if not logger:
+            logger = log
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            # Make all keys from `key_values` are passed
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        cache_key = (
+            keys_order,
+            tuple(key_values[key] for key in keys_order)
+        )
+        try:
+            cached = self._results.get(cache_key)
+        except TypeError:
+            # Values are not hashable
+            cache_key = cached = None
+
+        if cached is None:
+            matching_profiles = self._find_matching_profiles(
+                key_values, keys_order
+            )
+            if not matching_profiles:
+                cached = (None, 0)
+            elif len(matching_profiles) == 1:
+                cached = (matching_profiles[0][0], 1)
+            else:
+                cached = (
+                    _profile_exclusion(matching_profiles, logger),
+                    len(matching_profiles)
+                )
+            if cache_key is not None:
+                self._results[cache_key] = cached
+
+        profile, matching_count = cached
+        if matching_count == 1:
+            return profile
+
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
+        if not matching_count:
+            logger.info(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
+        else:
+            logger.info(
+                "More than one profile match your setup. {}".format(log_parts)
+            )
+        return profile
+
+
+class _ProfileIndexCache:
+    # Indexes by id of profiles data, profiles data are stored with index
+    #   so the id can't be reused by other object
+    items = collections.OrderedDict()
+    max_items = 64
+    lock = threading.Lock()
+
+
+def get_profile_index(profiles_data):
+    """Index of profiles data.
+
+    Index is created once for profiles data object (e.g. profiles from
+    settings applied to a plugin) and reused for following calls.
+
+    Args:
+        profiles_data (list): Profile definitions as dictionaries.
+
+    Returns:
+        ProfileIndex: Index of passed profiles.
+    """
+    cache_key = id(profiles_data)
+    with _ProfileIndexCache.lock:
+        item = _ProfileIndexCache.items.pop(cache_key, None)
+        if item is None or item[0] is not profiles_data:
+            item = (profiles_data, ProfileIndex(profiles_data))
+        _ProfileIndexCache.items[cache_key] = item
+        while len(_ProfileIndexCache.items) > _ProfileIndexCache.max_items:
+            _ProfileIndexCache.items.popitem(last=False)
+    return item[1]
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -140,6 +423,10 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Profiles are filtered by `ProfileIndex` which is cached for passed
+    profiles data object, profiles data should not be modified in place
+    after filtering.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -155,70 +442,6 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    if not matching_profiles:
-        logger.info(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.info(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    return _profile_exclusion(matching_profiles, logger)
+    return get_profile_index(profiles_data).filter(
+        key_values, keys_order, logger
+    )
@@ -10,6 +10,11 @@ This gives ability to create project where a changes and tests can be done.
 
 Keep in mind that to be able create a package of project has few requirements.
 Possible requirement should be listed in 'pack_project' function.
+
+Documents are stored as json lines (one document per line) so they don't
+have to be loaded into memory at once. Project files can be split into more
+zip files (parts) which are compressed in parallel. Files which are already
+compressed (e.g. exr, movies) are stored without compression.
 """
 import os
 import json
@@ -17,6 +22,7 @@ import platform
 import tempfile
 import shutil
 import datetime
+import threading
 
 import zipfile
 from bson.json_util import (
@@ -30,6 +36,31 @@ from avalon.api import AvalonMongoDB
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
 PROJECT_FILES_DIR = "project_files"
+# Count of documents inserted to database at once on unpack
+INSERT_BATCH_SIZE = 1000
+# Extensions of files which are not compressed as they're already compressed
+STORED_EXTENSIONS = {
+    ".exr",
+    ".mov",
+    ".mp4",
+    ".m4v",
+    ".mkv",
+    ".avi",
+    ".webm",
+    ".mxf",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".mp3",
+    ".aac",
+    ".zip",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".7z",
+    ".rar",
+}
 
 
 def add_timestamp(filepath):
@@ -40,7 +71,7 @@ def add_timestamp(filepath):
     return new_base + ext
 
 
-def pack_project(project_name, destination_dir=None):
+def pack_project(project_name, destination_dir=None, workers=None):
     """Make a package of a project with mongo documents and files.
 
     This function has few restrictions:
@@ -52,6 +83,9 @@ def pack_project(project_name, destination_dir=None):
         project_name(str): Project that should be packaged.
         destination_dir(str): Optinal path where zip will be stored. Project's
             root is used if not passed.
+        workers(int): Count of zip files with project files which are
+            compressed in parallel. Files are split to more zip files
+            ("<project name>.part<index>.zip") stored next to main zip.
     """
     print("Creating package of project \"{}\"".format(project_name))
     # Validate existence of project
@@ -99,12 +133,31 @@ def pack_project(project_name, destination_dir=None):
     if os.path.exists(zip_path):
         dst_filepath = add_timestamp(zip_path)
         os.rename(zip_path, dst_filepath)
+        # Rename also parts of existing zip
+        idx = 1
+        while os.path.exists(get_part_zip_path(zip_path, idx)):
+            os.rename(
+                get_part_zip_path(zip_path, idx),
+                get_part_zip_path(dst_filepath, idx)
+            )
+            idx += 1
+
+    # Collect project files and split them to parts by size
+    parts_files = split_files_to_parts(
+        collect_project_files(project_source_path), workers or 1
+    )
+    part_zip_paths = [zip_path]
+    for idx in range(1, len(parts_files)):
+        part_zip_paths.append(get_part_zip_path(zip_path, idx))
 
     # We can add more data
     metadata = {
         "project_name": project_name,
         "root": source_root,
-        "version": 1
+        "version": 2,
+        "documents_format": "jsonl",
+        # Count of zip files next to main zip with part of project files
+        "parts_count": len(part_zip_paths) - 1
     }
     # Create temp json file where metadata are stored
     with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
@@ -114,46 +167,231 @@ def pack_project(project_name, destination_dir=None):
         json.dump(metadata, stream)
 
     # Create temp json file where database documents are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as s:
         temp_docs_json = s.name
 
-    # Query all project documents and store them to temp json
-    docs = list(dbcon.find({}))
-    data = dumps(
-        docs, json_options=CANONICAL_JSON_OPTIONS
-    )
-    with open(temp_docs_json, "w") as stream:
-        stream.write(data)
-
-    print("Packing files into zip")
-    # Write all to zip file
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
-        # Add metadata file
-        zip_stream.write(temp_metadata_json, METADATA_FILE_NAME + ".json")
-        # Add database documents
-        zip_stream.write(temp_docs_json, DOCUMENTS_FILE_NAME + ".json")
-        # Add project files to zip
-        for root, _, filenames in os.walk(project_source_path):
-            for filename in filenames:
-                filepath = os.path.join(root, filename)
-                # TODO add one more folder
-                archive_name = os.path.join(
-                    PROJECT_FILES_DIR,
-                    os.path.relpath(filepath, root_path)
-                )
-                zip_stream.write(filepath, archive_name)
+    # Query all project documents and store them to temp file one by one
+    docs_count = write_documents(dbcon.find({}), temp_docs_json)
+    print("Stored {} documents".format(docs_count))
+
+    print("Packing files into {} zip file/s".format(len(part_zip_paths)))
+    errors = []
+    threads = []
+    for idx, part_zip_path in enumerate(part_zip_paths):
+        # Main zip contains metadata and database documents
+        extra_files = []
+        if idx == 0:
+            extra_files = [
+                (temp_metadata_json, METADATA_FILE_NAME + ".json"),
+                (temp_docs_json, DOCUMENTS_FILE_NAME + ".jsonl")
+            ]
+        threads.append(threading.Thread(
+            target=_write_zip_part,
+            args=(
+                part_zip_path,
+                extra_files,
+                parts_files[idx],
+                root_path,
+                errors
+            )
+        ))
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
 
     print("Cleaning up")
     # Cleanup
     os.remove(temp_docs_json)
     os.remove(temp_metadata_json)
     dbcon.uninstall()
+    if errors:
+        raise errors[0]
     print("*** Packing finished ***")
 
 
+def get_part_zip_path(zip_path, idx):
+    """Path to zip file with part of project files."""
+    base, ext = os.path.splitext(zip_path)
+    return "{}.part{}{}".format(base, idx, ext)
+
+
+def collect_project_files(project_source_path):
+    """Paths and sizes of all project files.
+
+    Returns:
+        list: Tuples with filepath and size of file.
+    """
+    output = []
+    for root, _, filenames in os.walk(project_source_path):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            output.append((filepath, os.path.getsize(filepath)))
+    return output
+
+
+def split_files_to_parts(files, parts_count):
+    """Split files to parts with similar size.
+
+    Args:
+        files (list): Tuples with filepath and size of file.
+        parts_count (int): Max count of parts.
+
+    Returns:
+        list: Filepaths for each part. There is always at least one part.
+    """
+    parts_count = max(1, min(parts_count, len(files)))
+    parts = [[] for _ in range(parts_count)]
+    parts_sizes = [0] * parts_count
+    # Biggest files first so parts are balanced
+    for filepath, size in sorted(files, key=lambda item: -item[1]):
+        idx = parts_sizes.index(min(parts_sizes))
+        parts[idx].append(filepath)
+        parts_sizes[idx] += size
+    return parts
+
+
+def get_compress_type(filepath):
+    """Compression of file in zip based on it's extension."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def write_documents(docs, filepath):
+    """Write documents to file as json lines.
+
+    Args:
+        docs (Iterable[dict]): Documents (or database cursor).
+        filepath (str): Path to output file.
+
+    Returns:
+        int: Count of written documents.
+    """
+    count = 0
+    with open(filepath, "w") as stream:
+        for doc in docs:
+            stream.write(dumps(doc, json_options=CANONICAL_JSON_OPTIONS))
+            stream.write("\n")
+            count += 1
+    return count
+
+
+def iter_documents(stream):
+    """Read documents from stream with json lines."""
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if line:
+            yield loads(line)
+
+
+def _write_zip_part(zip_path, extra_files, filepaths, root_path, errors):
+    try:
+        with zipfile.ZipFile(
+            zip_path, "w", zipfile.ZIP_DEFLATED
+        ) as zip_stream:
+            for filepath, archive_name in extra_files:
+                zip_stream.write(filepath, archive_name)
+
+            # Add project files to zip
+            for filepath in filepaths:
+                # TODO add one more folder
+                archive_name = os.path.join(
+                    PROJECT_FILES_DIR,
+                    os.path.relpath(filepath, root_path)
+                )
+                zip_stream.write(
+                    filepath,
+                    archive_name,
+                    compress_type=get_compress_type(filepath)
+                )
+    except Exception as exc:
+        errors.append(exc)
+
+
+def insert_documents(collection, docs):
+    """Insert documents to collection in batches.
+
+    Args:
+        collection (pymongo.collection.Collection): Target collection.
+        docs (Iterable[dict]): Documents to insert.
+
+    Returns:
+        int: Count of inserted documents.
+    """
+    count = 0
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            collection.insert_many(batch)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        collection.insert_many(batch)
+        count += len(batch)
+    return count
+
+
+def extract_project_files(zip_path, root_path):
+    """Extract project files from zip directly to root.
+
+    Args:
+        zip_path (str): Path to zip with project files.
+        root_path (str): Root directory where project files are extracted.
+    """
+    prefix = PROJECT_FILES_DIR + "/"
+    root_path = os.path.normpath(os.path.abspath(root_path))
+    with zipfile.ZipFile(zip_path, "r") as zip_stream:
+        for member in zip_stream.infolist():
+            if (
+                not member.filename.startswith(prefix)
+                or member.filename.endswith("/")
+            ):
+                continue
+
+            dst_path = os.path.normpath(os.path.join(
+                root_path, member.filename[len(prefix):]
+            ))
+            # Don't allow to write out of root
+            if not dst_path.startswith(root_path + os.path.sep):
+                print("Skipped invalid path in zip \"{}\"".format(
+                    member.filename
+                ))
+                continue
+
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                try:
+                    os.makedirs(dst_dir)
+                except OSError:
+                    # Directory was created by other thread
+                    if not os.path.isdir(dst_dir):
+                        raise
+
+            with zip_stream.open(member) as src_stream:
+                with open(dst_path, "wb") as dst_stream:
+                    shutil.copyfileobj(src_stream, dst_stream, 1024 * 1024)
+
+
+def _extract_project_files(zip_path, root_path, errors):
+    try:
+        extract_project_files(zip_path, root_path)
+    except Exception as exc:
+        errors.append(exc)
+
+
 def unpack_project(path_to_zip, new_root=None):
     """Unpack project zip file to recreate project.
 
+    Parts of project files stored next to the zip are extracted in parallel.
+
     Args:
         path_to_zip(str): Path to zip which was created using 'pack_project'
             function.
@@ -165,36 +403,46 @@ def unpack_project(path_to_zip, new_root=None):
         print("Zip file does not exists: {}".format(path_to_zip))
         return
 
-    tmp_dir = tempfile.mkdtemp(prefix="unpack_")
-    print("Zip is extracted to temp: {}".format(tmp_dir))
+    part_zip_paths = [path_to_zip]
     with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
-        zip_stream.extractall(tmp_dir)
-
-    metadata_json_path = os.path.join(tmp_dir, METADATA_FILE_NAME + ".json")
-    with open(metadata_json_path, "r") as stream:
-        metadata = json.load(stream)
-
-    docs_json_path = os.path.join(tmp_dir, DOCUMENTS_FILE_NAME + ".json")
-    with open(docs_json_path, "r") as stream:
-        content = stream.readlines()
-    docs = loads("".join(content))
-
-    low_platform = platform.system().lower()
-    project_name = metadata["project_name"]
-    source_root = metadata["root"]
-    root_path = source_root[low_platform]
-
-    # Drop existing collection
-    dbcon = AvalonMongoDB()
-    database = dbcon.database
-    if project_name in database.list_collection_names():
-        database.drop_collection(project_name)
-        print("Removed existing project collection")
-
-    print("Creating project documents ({})".format(len(docs)))
-    # Create new collection with loaded docs
-    collection = database[project_name]
-    collection.insert_many(docs)
+        metadata = json.loads(
+            zip_stream.read(METADATA_FILE_NAME + ".json").decode("utf-8")
+        )
+        for idx in range(1, metadata.get("parts_count", 0) + 1):
+            part_zip_path = get_part_zip_path(path_to_zip, idx)
+            if not os.path.exists(part_zip_path):
+                raise ValueError((
+                    "Zip file with part of project files is missing: {}"
+                ).format(part_zip_path))
+            part_zip_paths.append(part_zip_path)
+
+        low_platform = platform.system().lower()
+        project_name = metadata["project_name"]
+        source_root = metadata["root"]
+        root_path = source_root[low_platform]
+
+        # Drop existing collection
+        dbcon = AvalonMongoDB()
+        database = dbcon.database
+        if project_name in database.list_collection_names():
+            database.drop_collection(project_name)
+            print("Removed existing project collection")
+
+        print("Creating project documents")
+        # Create new collection with loaded docs
+        collection = database[project_name]
+        if metadata.get("documents_format") == "jsonl":
+            with zip_stream.open(DOCUMENTS_FILE_NAME + ".jsonl") as stream:
+                docs_count = insert_documents(
+                    collection, iter_documents(stream)
+                )
+        else:
+            # Backwards compatibility of packages with single json
+            docs = loads(
+                zip_stream.read(DOCUMENTS_FILE_NAME + ".json").decode("utf-8")
+            )
+            docs_count = insert_documents(collection, docs)
+        print("Created project documents ({})".format(docs_count))
 
     # Skip change of root if is the same as the one stored in metadata
     if (
@@ -222,9 +470,6 @@ def unpack_project(path_to_zip, new_root=None):
     if not os.path.exists(root_path):
         os.makedirs(root_path)
 
-    src_project_files_dir = os.path.join(
-        tmp_dir, PROJECT_FILES_DIR, project_name
-    )
     dst_project_files_dir = os.path.normpath(
         os.path.join(root_path, project_name)
     )
@@ -235,13 +480,24 @@ def unpack_project(path_to_zip, new_root=None):
         ))
         os.rename(dst_project_files_dir, new_path)
 
-    print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
+    print("Extracting project files from {} zip file/s to \"{}\"".format(
+        len(part_zip_paths), dst_project_files_dir
     ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+    errors = []
+    threads = [
+        threading.Thread(
+            target=_extract_project_files,
+            args=(part_zip_path, root_path, errors)
+        )
+        for part_zip_path in part_zip_paths
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
 
-    # CLeanup
-    print("Cleaning up")
-    shutil.rmtree(tmp_dir)
     dbcon.uninstall()
+    if errors:
+        raise errors[0]
     print("*** Unpack finished ***")
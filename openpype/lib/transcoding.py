@@ -1,12 +1,18 @@
 import os
 import re
 import logging
+import shutil
 import collections
 import tempfile
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
+from .probe_cache import get_probe_cache
 from .vendor_bin_utils import (
     get_oiio_tools_path,
     is_oiio_supported
@@ -14,6 +20,10 @@ from .vendor_bin_utils import (
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
+# Min count of frames converted by one oiiotool process
+MIN_CONVERT_SHARD_FRAMES = 10
+# Frame number before extension of filename
+FRAME_NUMBER_REGEX = re.compile(r"^(.*?)(-?\d+)(\.[^.]+)$")
 # OIIO known xml tags
 STRING_TAGS = {
     "format"
@@ -52,8 +62,14 @@ def get_transcode_temp_directory():
 def get_oiio_info_for_input(filepath, logger=None):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output is cached in probe
+    cache so same file is not probed multiple times.
     """
+    probe_cache = get_probe_cache()
+    xml_text = probe_cache.get("oiio_info", filepath)
+    if xml_text is not None:
+        return parse_oiio_xml_output(xml_text, logger=logger)
+
     args = [
         get_oiio_tools_path(), "--info", "-v", "-i:infoformat=xml", filepath
     ]
@@ -78,6 +94,7 @@ def get_oiio_info_for_input(filepath, logger=None):
         )
 
     xml_text = "\n".join(lines)
+    probe_cache.set("oiio_info", filepath, xml_text)
     return parse_oiio_xml_output(xml_text, logger=logger)
 
 
@@ -372,17 +389,67 @@ def should_convert_for_ffmpeg(src_filepath):
     return False
 
 
+def _get_sequence_pattern(filename, frame):
+    """Replace frame number in filename with printf-style pattern.
+
+    Returns:
+        Union[str, None]: Filename with frame pattern or None if filename
+            does not contain passed frame before extension.
+    """
+    result = FRAME_NUMBER_REGEX.match(filename)
+    if not result:
+        return None
+
+    head, frame_str, tail = result.groups()
+    if int(frame_str) != int(frame):
+        return None
+    return "{}%0{}d{}".format(head, len(frame_str.lstrip("-")), tail)
+
+
+def split_frame_range(frame_start, frame_end, max_shards, min_frames=1):
+    """Split frame range to shards of similar length.
+
+    Args:
+        frame_start (int): First frame.
+        frame_end (int): Last frame.
+        max_shards (int): Max count of shards.
+        min_frames (int): Min count of frames in one shard.
+
+    Returns:
+        list: Tuples with first and last frame of shards.
+    """
+    frame_start = int(frame_start)
+    frame_end = int(frame_end)
+    frames_count = frame_end - frame_start + 1
+    shards_count = max(1, min(max_shards, frames_count // max(1, min_frames)))
+    shard_size, remainder = divmod(frames_count, shards_count)
+    shards = []
+    start = frame_start
+    for idx in range(shards_count):
+        end = start + shard_size - 1
+        if idx < remainder:
+            end += 1
+        shards.append((start, end))
+        start = end + 1
+    return shards
+
+
 def convert_for_ffmpeg(
     first_input_path,
     output_dir,
     input_frame_start=None,
     input_frame_end=None,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Contert source file to format supported in ffmpeg.
 
     Currently can convert only exrs.
 
+    Sequence is split into frame range shards converted by parallel
+    oiiotool processes. Count of processes is limited by 'max_workers'
+    and each shard has at least 'MIN_CONVERT_SHARD_FRAMES' frames.
+
     Args:
         first_input_path (str): Path to first file of a sequence or a single
             file path for non-sequential input.
@@ -391,6 +458,8 @@ def convert_for_ffmpeg(
         input_frame_start (int): Frame start of input.
         input_frame_end (int): Frame end of input.
         logger (logging.Logger): Logger used for logging.
+        max_workers (int): Max count of parallel processes, count of CPU
+            cores is used if not set.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -440,21 +509,40 @@ def convert_for_ffmpeg(
         input_channels.append(alpha)
     input_channels_str = ",".join(input_channels)
 
+    input_path = first_input_path
+    base_file_name = os.path.basename(first_input_path)
+    frame_ranges = [None]
+    if is_sequence:
+        frame_ranges = [(input_frame_start, input_frame_end)]
+        sequence_pattern = _get_sequence_pattern(
+            base_file_name, input_frame_start
+        )
+        if sequence_pattern:
+            input_path = os.path.join(
+                os.path.dirname(first_input_path), sequence_pattern
+            )
+            base_file_name = sequence_pattern
+            if not max_workers:
+                try:
+                    max_workers = multiprocessing.cpu_count()
+                except NotImplementedError:
+                    max_workers = 1
+            frame_ranges = split_frame_range(
+                input_frame_start,
+                input_frame_end,
+                max_workers,
+                MIN_CONVERT_SHARD_FRAMES
+            )
+
     oiio_cmd.extend([
         # Tell oiiotool which channels should be loaded
         # - other channels are not loaded to memory so helps to avoid memory
         #       leak issues
-        "-i:ch={}".format(input_channels_str), first_input_path,
+        "-i:ch={}".format(input_channels_str), input_path,
         # Tell oiiotool which channels should be put to top stack (and output)
         "--ch", channels_arg
     ])
 
-    # Add frame definitions to arguments
-    if is_sequence:
-        oiio_cmd.extend([
-            "--frames", "{}-{}".format(input_frame_start, input_frame_end)
-        ])
-
     ignore_attr_changes_added = False
     for attr_name, attr_value in input_info["attribs"].items():
         if not isinstance(attr_value, str):
@@ -474,12 +562,120 @@ def convert_for_ffmpeg(
             ).format(attr_name, len(attr_value)))
             oiio_cmd.extend(["--eraseattrib", attr_name])
 
-    # Add last argument - path to output
-    base_file_name = os.path.basename(first_input_path)
     output_path = os.path.join(output_dir, base_file_name)
-    oiio_cmd.extend([
-        "-o", output_path
-    ])
+    shard_cmds = []
+    for frame_range in frame_ranges:
+        shard_cmd = list(oiio_cmd)
+        # Add frame definitions to arguments
+        if frame_range is not None:
+            shard_cmd.extend(["--frames", "{}-{}".format(*frame_range)])
+        # Add last argument - path to output
+        shard_cmd.extend(["-o", output_path])
+        shard_cmds.append(shard_cmd)
+
+    if len(shard_cmds) == 1:
+        logger.debug("Conversion command: {}".format(" ".join(shard_cmds[0])))
+        run_subprocess(shard_cmds[0], logger=logger)
+        return
+
+    logger.info("Converting frames {}-{} in {} shards".format(
+        input_frame_start, input_frame_end, len(shard_cmds)
+    ))
+    finished = []
+
+    def _convert_shard(shard_cmd):
+        logger.debug("Conversion command: {}".format(" ".join(shard_cmd)))
+        run_subprocess(shard_cmd, logger=logger)
+        finished.append(shard_cmd)
+        logger.info("Converted frames {} ({}/{} shards)".format(
+            shard_cmd[-3], len(finished), len(shard_cmds)
+        ))
+
+    pool = ThreadPool(len(shard_cmds))
+    try:
+        pool.map(_convert_shard, shard_cmds)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def get_sequence_gaps(filenames, frame_start, frame_end):
+    """Find missing frames of image sequence and files which can fill them.
+
+    Missing frame is filled with nearest previous existing frame, missing
+    frames before first existing frame are filled with the first frame.
 
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+    Args:
+        filenames (list): Filenames of existing frames of the sequence.
+        frame_start (int): First frame of expected sequence.
+        frame_end (int): Last frame of expected sequence.
+
+    Returns:
+        dict: Filename of missing frame with filename of existing frame
+            which should be used instead. Empty if sequence is complete.
+
+    Raises:
+        ValueError: If filenames are not single sequence.
+    """
+    sequences, _ = clique.assemble(filenames)
+    if len(sequences) != 1:
+        raise ValueError(
+            "Expected single sequence. Got {}.".format(len(sequences))
+        )
+
+    collection = sequences[0]
+    indexes = set(collection.indexes)
+    frame_template = "{}{:0" + str(collection.padding) + "d}{}"
+    gaps = {}
+    fill_filename = None
+    for frame in range(int(frame_start), int(frame_end) + 1):
+        filename = frame_template.format(
+            collection.head, frame, collection.tail
+        )
+        if frame in indexes:
+            fill_filename = filename
+            continue
+
+        if fill_filename is None:
+            fill_filename = frame_template.format(
+                collection.head, min(indexes), collection.tail
+            )
+        gaps[filename] = fill_filename
+    return gaps
+
+
+def link_sequence_gaps(staging_dir, gaps, logger=None):
+    """Create files of missing frames without copying their content.
+
+    Missing frames are created as hardlinks to existing frames. Symlink is
+    used when hardlink can't be created (e.g. different devices) and file
+    is copied only when filesystem does not support links at all.
+
+    Args:
+        staging_dir (str): Directory of the sequence.
+        gaps (dict): Output of `get_sequence_gaps`.
+        logger (logging.Logger): Logger used for logging.
+
+    Returns:
+        list: Paths to created files which should be removed after usage.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    created_paths = []
+    for filename, fill_filename in gaps.items():
+        dst_path = os.path.join(staging_dir, filename)
+        if os.path.exists(dst_path):
+            continue
+
+        src_path = os.path.abspath(os.path.join(staging_dir, fill_filename))
+        logger.info("Filling gap {} with {}".format(filename, fill_filename))
+        try:
+            os.link(src_path, dst_path)
+        except (AttributeError, OSError):
+            try:
+                os.symlink(src_path, dst_path)
+            except (AttributeError, NotImplementedError, OSError):
+                shutil.copyfile(src_path, dst_path)
+        created_paths.append(dst_path)
+    return created_paths
@@ -4,6 +4,8 @@ import json
 import platform
 import subprocess
 
+from .probe_cache import get_probe_cache
+
 log = logging.getLogger("Vendor utils")
 
 
@@ -138,16 +140,32 @@ def get_ffmpeg_tool_path(tool="ffmpeg"):
     return find_executable(os.path.join(ffmpeg_dir, tool))
 
 
-def ffprobe_streams(path_to_file, logger=None):
-    """Load streams from entered filepath via ffprobe.
+def get_ffprobe_data(path_to_file, logger=None):
+    """Load data about entered filepath via ffprobe.
+
+    Output is cached in probe cache so same file is not probed multiple
+    times.
 
     Args:
         path_to_file (str): absolute path
         logger (logging.getLogger): injected logger, if empty new is created
 
+    Returns:
+        dict: Parsed json output of ffprobe with "format" and "streams".
     """
     if not logger:
         logger = log
+
+    probe_cache = get_probe_cache()
+    cached_output = probe_cache.get("ffprobe", path_to_file)
+    if cached_output is not None:
+        logger.debug(
+            "Using cached information about input \"{}\".".format(
+                path_to_file
+            )
+        )
+        return json.loads(cached_output)
+
     logger.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -175,17 +193,29 @@ def ffprobe_streams(path_to_file, logger=None):
     )
 
     popen_stdout, popen_stderr = popen.communicate()
-    if popen_stdout:
-        logger.debug("FFprobe stdout:\n{}".format(
-            popen_stdout.decode("utf-8")
-        ))
+    output = popen_stdout.decode("utf-8")
+    if output:
+        logger.debug("FFprobe stdout:\n{}".format(output))
 
     if popen_stderr:
         logger.warning("FFprobe stderr:\n{}".format(
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)["streams"]
+    if popen.returncode == 0:
+        probe_cache.set("ffprobe", path_to_file, output)
+    return json.loads(output)
+
+
+def ffprobe_streams(path_to_file, logger=None):
+    """Load streams from entered filepath via ffprobe.
+
+    Args:
+        path_to_file (str): absolute path
+        logger (logging.getLogger): injected logger, if empty new is created
+
+    """
+    return get_ffprobe_data(path_to_file, logger)["streams"]
 
 
 def is_oiio_supported():
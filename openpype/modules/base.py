@@ -5,13 +5,17 @@ import sys
 import json
 import time
 import inspect
+import hashlib
 import logging
+import functools
 import platform
+import tempfile
 import threading
 import collections
 from uuid import uuid4
 from abc import ABCMeta, abstractmethod
 import six
+import appdirs
 
 import openpype
 from openpype.settings import (
@@ -24,6 +28,8 @@ from openpype.settings import (
 
 from openpype.settings.lib import (
     get_studio_system_settings_overrides,
+    load_openpype_default_settings,
+    apply_overrides,
     load_json_file
 )
 from openpype.lib import PypeLogger
@@ -66,12 +72,17 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Import callbacks of modules which are imported on first access
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
+        if attr_name in self.__lazy__:
+            self.import_lazy_module(attr_name)
+
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -83,7 +94,11 @@ class _ModuleClass(object):
             yield module
 
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        # Import system may set already stored module again
+        if (
+            attr_name in self.__attributes__
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     self.name, attr_name
@@ -117,6 +132,120 @@ class _ModuleClass(object):
     def items(self):
         return self.__attributes__.items()
 
+    def is_lazy(self, key):
+        """Module is registered but was not imported yet."""
+        return key in self.__lazy__
+
+    def import_lazy_module(self, key):
+        """Import module registered for import on first access.
+
+        Returns:
+            Union[module, None]: Imported module or None if import failed.
+        """
+        with _LoadCache.lazy_lock:
+            import_func = self.__lazy__.pop(key, None)
+            if import_func is not None:
+                import_func()
+        return self.__attributes__.get(key)
+
+    def import_lazy_modules(self):
+        """Import all modules which were not imported yet."""
+        for key in tuple(self.__lazy__.keys()):
+            self.import_lazy_module(key)
+
+
+class _LazyModulesFinder(object):
+    """Import finder of modules from `openpype_modules` imported lazily.
+
+    Makes possible to use import statements like
+    'import openpype_modules.<module name>' for modules which were not
+    imported yet.
+
+    Python 2 uses 'find_module' and 'load_module', Python 3 'find_spec',
+    'create_module' and 'exec_module'.
+    """
+    modules_key = "openpype_modules"
+
+    def _get_lazy_name(self, fullname):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != self.modules_key:
+            return None
+        openpype_modules = sys.modules.get(self.modules_key)
+        if (
+            not isinstance(openpype_modules, _ModuleClass)
+            or not openpype_modules.is_lazy(parts[1])
+        ):
+            return None
+        return parts[1]
+
+    def _import_module(self, fullname):
+        openpype_modules = sys.modules[self.modules_key]
+        module_name = fullname.split(".")[-1]
+        module = openpype_modules.import_lazy_module(module_name)
+        if module is None:
+            raise ImportError("Failed to import '{}'".format(fullname))
+        sys.modules[fullname] = module
+        return module
+
+    def find_spec(self, fullname, path=None, target=None):
+        if self._get_lazy_name(fullname) is None:
+            return None
+        import importlib.util
+
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        return self._import_module(spec.name)
+
+    def exec_module(self, module):
+        # Module was executed on import in 'create_module'
+        pass
+
+    def find_module(self, fullname, path=None):
+        if self._get_lazy_name(fullname) is None:
+            return None
+        return self
+
+    def load_module(self, fullname):
+        if fullname in sys.modules:
+            return sys.modules[fullname]
+        return self._import_module(fullname)
+
+
+class _LazyModulesByName(dict):
+    """Modules by name which initialize not imported modules on access.
+
+    Modules which were not imported because they are disabled are
+    initialized when are accessed by their name.
+
+    Args:
+        initialize_func (callable): Initialize module by name and return it.
+    """
+    def __init__(self, initialize_func):
+        super(_LazyModulesByName, self).__init__()
+        self._initialize_func = initialize_func
+        self.lazy_names = set()
+
+    def __missing__(self, key):
+        if key not in self.lazy_names:
+            raise KeyError(key)
+        module = self._initialize_func(key)
+        if module is None:
+            raise KeyError(key)
+        return module
+
+    def __contains__(self, key):
+        return (
+            super(_LazyModulesByName, self).__contains__(key)
+            or key in self.lazy_names
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
 
 class _InterfacesClass(_ModuleClass):
     """Fake module class for storing OpenPype interfaces.
@@ -127,7 +256,7 @@ class _InterfacesClass(_ModuleClass):
     """
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
 
             raise ImportError((
@@ -140,8 +269,15 @@ class _InterfacesClass(_ModuleClass):
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
+    lazy_lock = threading.RLock()
     interfaces_loaded = False
     modules_loaded = False
+    # Time of import of each module in seconds
+    import_times = {}
+    # Key of modules manifest matching current modules directories
+    manifest_key = None
+    # Content of valid modules manifest or None if was not found
+    manifest_modules = None
 
 
 def get_default_modules_dir():
@@ -243,7 +379,122 @@ def _load_interfaces():
         setattr(openpype_interfaces, attr_name, attr)
 
 
-def load_modules(force=False):
+# Version of manifest content which invalidates manifests of older versions
+MODULES_MANIFEST_VERSION = 2
+
+
+def get_modules_manifest_path():
+    """Path to json file with cached manifest of OpenPype modules."""
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "modules_manifest.json"
+    )
+
+
+def _get_modules_manifest_key(dirpaths):
+    """Key of modules manifest for current version and modules directories.
+
+    Manifest is invalidated by different OpenPype version or by change of
+    content of modules directories.
+    """
+    from openpype.version import __version__
+
+    hasher = hashlib.sha1()
+    hasher.update(__version__.encode("utf-8"))
+    hasher.update(str(MODULES_MANIFEST_VERSION).encode("utf-8"))
+    for dirpath in dirpaths:
+        hasher.update(dirpath.encode("utf-8"))
+        if not os.path.isdir(dirpath):
+            continue
+        for filename in sorted(os.listdir(dirpath)):
+            fullpath = os.path.join(dirpath, filename)
+            try:
+                mtime = os.path.getmtime(fullpath)
+            except OSError:
+                continue
+            hasher.update("{}:{}".format(filename, mtime).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _load_modules_manifest(manifest_key):
+    """Load cached modules manifest.
+
+    Returns:
+        Union[dict, None]: Information about module classes by name of
+            python module or None if manifest is missing or outdated.
+    """
+    manifest_path = get_modules_manifest_path()
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as stream:
+            manifest = json.load(stream)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if manifest.get("key") != manifest_key:
+        return None
+    return manifest.get("modules")
+
+
+def _save_modules_manifest(manifest_key, manifest_modules):
+    manifest_path = get_modules_manifest_path()
+    manifest_dir = os.path.dirname(manifest_path)
+    try:
+        if not os.path.exists(manifest_dir):
+            os.makedirs(manifest_dir)
+
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".json")
+        with os.fdopen(fd, "w") as stream:
+            json.dump(
+                {"key": manifest_key, "modules": manifest_modules},
+                stream,
+                indent=4
+            )
+        # Windows does not allow to rename to existing file
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        os.rename(tmp_path, manifest_path)
+
+    except (IOError, OSError):
+        PypeLogger.get_logger("ModulesLoader").warning(
+            "Failed to store modules manifest \"{}\"".format(manifest_path),
+            exc_info=True
+        )
+
+
+def _get_lazy_module_names(manifest_modules, modules_settings):
+    """Names of python modules which don't have to be imported.
+
+    Python module is not imported if all OpenPype modules in it are disabled
+    in settings. Modules without settings key in manifest are always
+    imported, that includes settings definitions which are stored without
+    settings key.
+    """
+    output = set()
+    for module_name, classes_info in manifest_modules.items():
+        if not classes_info:
+            continue
+
+        is_disabled = True
+        for class_info in classes_info:
+            settings_key = class_info.get("settings_key")
+            module_settings = modules_settings.get(settings_key)
+            if (
+                not settings_key
+                or not isinstance(module_settings, dict)
+                or module_settings.get("enabled") is not False
+            ):
+                is_disabled = False
+                break
+
+        if is_disabled:
+            output.add(module_name)
+    return output
+
+
+def load_modules(force=False, modules_settings=None):
     """Load OpenPype modules as python modules.
 
     Modules does not load only classes (like in Interfaces) because there must
@@ -255,21 +506,30 @@ def load_modules(force=False):
     Function makes sure that `load_interfaces` was triggered. Modules import
     has specific order which can't be changed.
 
+    Modules which are disabled in passed modules settings, based on cached
+    modules manifest, are not imported until they're accessed.
+
     Args:
         force(bool): Force to load modules even if are already loaded.
             This won't update already loaded and used (cached) modules.
+        modules_settings(dict): Settings of modules from system settings
+            used to skip import of disabled modules. Studio settings are
+            used if not passed.
     """
 
     if _LoadCache.modules_loaded and not force:
         return
 
+    if modules_settings is None:
+        modules_settings = _get_modules_settings()
+
     # First load interfaces
     # - modules must not be imported before interfaces
     load_interfaces(force)
 
     if not _LoadCache.modules_lock.locked():
         with _LoadCache.modules_lock:
-            _load_modules()
+            _load_modules(modules_settings)
             _LoadCache.modules_loaded = True
     else:
         # If lock is locked wait until is finished
@@ -277,7 +537,43 @@ def load_modules(force=False):
             time.sleep(0.1)
 
 
-def _load_modules():
+def _get_modules_settings():
+    """Modules settings used to skip import of disabled modules.
+
+    Full system settings can't be used because their defaults require
+    settings definitions of imported modules. Defaults of OpenPype with
+    studio overrides are enough to find disabled modules.
+
+    Returns:
+        Union[dict, None]: Modules settings or None if could not be loaded.
+    """
+    try:
+        default_settings = load_openpype_default_settings()
+        system_settings = apply_overrides(
+            default_settings[SYSTEM_SETTINGS_KEY],
+            get_studio_system_settings_overrides()
+        )
+        return system_settings["modules"]
+
+    except Exception:
+        PypeLogger.get_logger("ModulesLoader").warning(
+            "Failed to load modules settings. All modules will be imported.",
+            exc_info=True
+        )
+    return None
+
+
+def _import_openpype_module(module_name, import_func, error_msg, log):
+    """Import module and store time of the import."""
+    start_time = time.time()
+    try:
+        import_func()
+    except Exception:
+        log.error(error_msg, exc_info=True)
+    _LoadCache.import_times[module_name] = time.time() - start_time
+
+
+def _load_modules(modules_settings=None):
     # Import helper functions from lib
     from openpype.lib import (
         import_filepath,
@@ -292,24 +588,46 @@ def _load_modules():
 
     log = PypeLogger.get_logger("ModulesLoader")
 
+    dirpaths = get_module_dirs()
+    manifest_key = _get_modules_manifest_key(dirpaths)
+    manifest_modules = _load_modules_manifest(manifest_key)
+    _LoadCache.manifest_key = manifest_key
+    _LoadCache.manifest_modules = manifest_modules
+
+    lazy_names = set()
+    if manifest_modules is not None and modules_settings is not None:
+        lazy_names = _get_lazy_module_names(
+            manifest_modules, modules_settings
+        )
+
+    def _import_default(default_module_name):
+        import_str = "openpype.modules.{}".format(default_module_name)
+        new_import_str = "{}.{}".format(modules_key, default_module_name)
+        default_module = __import__(import_str, fromlist=("", ))
+        sys.modules[new_import_str] = default_module
+        setattr(openpype_modules, default_module_name, default_module)
+
+    def _import_dirpath(dirpath, filename):
+        import_module_from_dirpath(dirpath, filename, modules_key)
+
+    def _import_file(fullpath, basename):
+        module = import_filepath(fullpath)
+        setattr(openpype_modules, basename, module)
+
+    # Prepare imports in order in which modules are imported
+    imports = []
     # Import default modules imported from 'openpype.modules'
     for default_module_name in DEFAULT_OPENPYPE_MODULES:
-        try:
-            import_str = "openpype.modules.{}".format(default_module_name)
-            new_import_str = "{}.{}".format(modules_key, default_module_name)
-            default_module = __import__(import_str, fromlist=("", ))
-            sys.modules[new_import_str] = default_module
-            setattr(openpype_modules, default_module_name, default_module)
-
-        except Exception:
-            msg = (
-                "Failed to import default module '{}'."
-            ).format(default_module_name)
-            log.error(msg, exc_info=True)
+        imports.append((
+            default_module_name,
+            functools.partial(_import_default, default_module_name),
+            "Failed to import default module '{}'.".format(
+                default_module_name
+            )
+        ))
 
     # Look for OpenPype modules in paths defined with `get_module_dirs`
     #   - dynamically imported OpenPype modules and addons
-    dirpaths = get_module_dirs()
     for dirpath in dirpaths:
         if not os.path.exists(dirpath):
             log.warning((
@@ -324,31 +642,53 @@ def _load_modules():
 
             fullpath = os.path.join(dirpath, filename)
             basename, ext = os.path.splitext(filename)
+            error_msg = "Failed to import '{}'.".format(fullpath)
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
-            try:
-                if os.path.isdir(fullpath):
-                    # Module without init file can't be used as OpenPype module
-                    #   because the module class could not be imported
-                    init_file = os.path.join(fullpath, "__init__.py")
-                    if not os.path.exists(init_file):
-                        log.info((
-                            "Skipping module directory because of"
-                            " missing \"__init__.py\" file. \"{}\""
-                        ).format(fullpath))
-                        continue
-                    import_module_from_dirpath(dirpath, filename, modules_key)
-
-                elif ext in (".py", ):
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+            if os.path.isdir(fullpath):
+                # Module without init file can't be used as OpenPype module
+                #   because the module class could not be imported
+                init_file = os.path.join(fullpath, "__init__.py")
+                if not os.path.exists(init_file):
+                    log.info((
+                        "Skipping module directory because of"
+                        " missing \"__init__.py\" file. \"{}\""
+                    ).format(fullpath))
+                    continue
+                imports.append((
+                    filename,
+                    functools.partial(_import_dirpath, dirpath, filename),
+                    error_msg
+                ))
 
-            except Exception:
-                log.error(
-                    "Failed to import '{}'.".format(fullpath),
-                    exc_info=True
-                )
+            elif ext in (".py", ):
+                imports.append((
+                    basename,
+                    functools.partial(_import_file, fullpath, basename),
+                    error_msg
+                ))
+
+    skipped_names = []
+    for module_name, import_func, error_msg in imports:
+        import_func = functools.partial(
+            _import_openpype_module, module_name, import_func, error_msg, log
+        )
+        if module_name in lazy_names:
+            openpype_modules.__lazy__[module_name] = import_func
+            skipped_names.append(module_name)
+        else:
+            import_func()
+
+    if skipped_names:
+        log.debug("Import of disabled modules was skipped: {}".format(
+            ", ".join(skipped_names)
+        ))
+        if not any(
+            isinstance(finder, _LazyModulesFinder)
+            for finder in sys.meta_path
+        ):
+            sys.meta_path.append(_LazyModulesFinder())
 
 
 class _OpenPypeInterfaceMeta(ABCMeta):
@@ -477,7 +817,9 @@ class ModulesManager:
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _LazyModulesByName(self._initialize_lazy_module)
+        self._modules_settings = None
+        self._lazy_modules_info = {}
         # For report of time consumption
         self._report = {}
 
@@ -486,24 +828,25 @@ class ModulesManager:
 
     def initialize_modules(self):
         """Import and initialize modules."""
-        # Make sure modules are loaded
-        load_modules()
-
-        import openpype_modules
-
         self.log.debug("*** Pype modules initialization.")
         # Prepare settings for modules
         system_settings = getattr(self, "_system_settings", None)
         if system_settings is None:
             system_settings = get_system_settings()
         modules_settings = system_settings["modules"]
+        self._modules_settings = modules_settings
+
+        # Make sure modules are loaded
+        load_modules(modules_settings=modules_settings)
+
+        import openpype_modules
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
+        for python_module_name, module in openpype_modules.items():
             # Go through globals in `pype.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -535,17 +878,24 @@ class ModulesManager:
                         " Missing implementations: {}"
                     ).format(name, ", ".join(not_implemented)))
                     continue
-                module_classes.append(modules_item)
-
-        for modules_item in module_classes:
+                module_classes.append((python_module_name, modules_item))
+
+        classes_info = collections.defaultdict(list)
+        for python_module_name, modules_item in module_classes:
+            name = modules_item.__name__
+            class_info = {
+                "class_name": name,
+                "name": None,
+                "settings_key": None,
+                "interfaces": []
+            }
+            classes_info[python_module_name].append(class_info)
             try:
-                name = modules_item.__name__
                 # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
+                module = self._initialize_module(modules_item)
+                class_info.update(
+                    self._get_module_class_info(module, modules_settings)
+                )
                 enabled_str = "X"
                 if not module.enabled:
                     enabled_str = " "
@@ -561,10 +911,134 @@ class ModulesManager:
                     exc_info=True
                 )
 
+        if _LoadCache.manifest_modules is None:
+            for python_module_name, settings_def in _find_settings_defs(
+                openpype_modules.items()
+            ):
+                classes_info[python_module_name].append({
+                    "class_name": settings_def.__name__,
+                    "name": None,
+                    "settings_key": None,
+                    "interfaces": []
+                })
+
+            # Create manifest only when all modules were imported
+            manifest_modules = {
+                python_module_name: classes_info.get(python_module_name, [])
+                for python_module_name in openpype_modules.keys()
+            }
+            _save_modules_manifest(_LoadCache.manifest_key, manifest_modules)
+            _LoadCache.manifest_modules = manifest_modules
+
+        # Modules which were not imported are initialized on access by name
+        self._lazy_modules_info = {}
+        for python_module_name, classes_info in (
+            _LoadCache.manifest_modules.items()
+        ):
+            if not openpype_modules.is_lazy(python_module_name):
+                continue
+            for class_info in classes_info:
+                module_name = class_info["name"]
+                if module_name:
+                    self._lazy_modules_info[module_name] = (
+                        python_module_name, class_info["class_name"]
+                    )
+        self.modules_by_name.lazy_names = set(self._lazy_modules_info)
+
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
+            self._report["Import"] = self._get_import_report(module_classes)
             self._report["Initialization"] = report
 
+    def _initialize_module(self, modules_item):
+        module = modules_item(self, self._modules_settings)
+        # Store initialized object
+        self.modules.append(module)
+        self.modules_by_id[module.id] = module
+        self.modules_by_name[module.name] = module
+        return module
+
+    def _initialize_lazy_module(self, module_name):
+        """Import and initialize module which was skipped on initialization.
+
+        Returns:
+            Union[OpenPypeModule, None]: Initialized module or None if
+                initialization failed.
+        """
+        self.modules_by_name.lazy_names.discard(module_name)
+        lazy_info = self._lazy_modules_info.pop(module_name, None)
+        if lazy_info is None:
+            return None
+
+        import openpype_modules
+
+        python_module_name, class_name = lazy_info
+        python_module = openpype_modules.import_lazy_module(
+            python_module_name
+        )
+        modules_item = getattr(python_module, class_name, None)
+        if modules_item is None:
+            self.log.warning((
+                "Module class \"{}\" was not found in \"{}\"."
+            ).format(class_name, python_module_name))
+            return None
+
+        try:
+            return self._initialize_module(modules_item)
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(class_name),
+                exc_info=True
+            )
+        return None
+
+    @staticmethod
+    def _get_module_class_info(module, modules_settings):
+        """Information about initialized module stored to modules manifest.
+
+        Settings key is stored only if module is disabled when is disabled
+        in settings under key matching module's name. Module without
+        settings key is always imported.
+        """
+        settings_key = None
+        module_settings = modules_settings.get(module.name)
+        if (
+            isinstance(module_settings, dict)
+            and isinstance(module_settings.get("enabled"), bool)
+            and (module_settings["enabled"] or not module.enabled)
+        ):
+            settings_key = module.name
+
+        interfaces = [
+            cls.__name__
+            for cls in inspect.getmro(module.__class__)
+            if (
+                cls is not OpenPypeInterface
+                and issubclass(cls, OpenPypeInterface)
+                and not issubclass(cls, OpenPypeModule)
+            )
+        ]
+        return {
+            "name": module.name,
+            "settings_key": settings_key,
+            "interfaces": interfaces
+        }
+
+    def _get_import_report(self, module_classes):
+        """Time of python modules import reported by module classes."""
+        report = {}
+        total = 0
+        for python_module_name, modules_item in module_classes:
+            import_time = _LoadCache.import_times.get(python_module_name)
+            if import_time is None:
+                continue
+            # Time is reported only for first class of python module
+            if modules_item.__name__ not in report:
+                report[modules_item.__name__] = import_time
+                total += import_time
+        report[self._report_total_key] = total
+        return report
+
     def connect_modules(self):
         """Trigger connection with other enabled modules.
 
@@ -859,7 +1333,9 @@ class TrayModulesManager(ModulesManager):
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _LazyModulesByName(self._initialize_lazy_module)
+        self._modules_settings = None
+        self._lazy_modules_info = {}
         self._report = {}
 
         self.tray_manager = None
@@ -1013,6 +1489,28 @@ class TrayModulesManager(ModulesManager):
                     )
 
 
+def _find_settings_defs(python_modules):
+    """Settings definition classes in passed python modules.
+
+    Args:
+        python_modules (Iterable[tuple]): Name and python module pairs.
+
+    Returns:
+        list: Name of python module and settings definition class pairs.
+    """
+    output = []
+    for python_module_name, raw_module in python_modules:
+        for attr_name in dir(raw_module):
+            attr = getattr(raw_module, attr_name)
+            if (
+                inspect.isclass(attr)
+                and attr is not ModuleSettingsDef
+                and issubclass(attr, ModuleSettingsDef)
+            ):
+                output.append((python_module_name, attr))
+    return output
+
+
 def get_module_settings_defs():
     """Check loaded addons/modules for existence of thei settings definition.
 
@@ -1029,41 +1527,42 @@ def get_module_settings_defs():
 
     import openpype_modules
 
+    # Settings definitions are needed also for disabled modules
+    # - valid manifest marks python modules with settings definitions so
+    #   they're never imported lazily
+    if _LoadCache.manifest_modules is None:
+        openpype_modules.import_lazy_modules()
+
     settings_defs = []
 
     log = PypeLogger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
-        for attr_name in dir(raw_module):
-            attr = getattr(raw_module, attr_name)
-            if (
-                not inspect.isclass(attr)
-                or attr is ModuleSettingsDef
-                or not issubclass(attr, ModuleSettingsDef)
-            ):
-                continue
+    for python_module_name, settings_def in _find_settings_defs(
+        openpype_modules.items()
+    ):
+        if inspect.isabstract(settings_def):
+            # Find missing implementations by convetion on `abc` module
+            not_implemented = []
+            for attr_name in dir(settings_def):
+                attr = getattr(settings_def, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
 
-            if inspect.isabstract(attr):
-                # Find missing implementations by convetion on `abc` module
-                not_implemented = []
-                for attr_name in dir(attr):
-                    attr = getattr(attr, attr_name, None)
-                    abs_method = getattr(
-                        attr, "__isabstractmethod__", None
-                    )
-                    if attr and abs_method:
-                        not_implemented.append(attr_name)
-
-                # Log missing implementations
-                log.warning((
-                    "Skipping abstract Class: {} in module {}."
-                    " Missing implementations: {}"
-                ).format(
-                    attr_name, raw_module.__name__, ", ".join(not_implemented)
-                ))
-                continue
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {} in module {}."
+                " Missing implementations: {}"
+            ).format(
+                settings_def.__name__,
+                python_module_name,
+                ", ".join(not_implemented)
+            ))
+            continue
 
-            settings_defs.append(attr)
+        settings_defs.append(settings_def)
 
     return settings_defs
 
@@ -15,6 +15,12 @@ def get_openpype_executable():
     return config.GetConfigEntryWithDefault("OpenPypeExecutable", "")
 
 
+def get_environments_cache_dir():
+    """Return shared directory for environments from Plug-in Settings"""
+    config = RepositoryUtils.GetPluginConfig("OpenPype")
+    return config.GetConfigEntryWithDefault("EnvironmentsCacheDir", "")
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -62,6 +68,11 @@ def inject_openpype_environment(deadlinePlugin):
             for key, value in add_args.items():
                 args.append("--{}".format(key))
                 args.append(value)
+            # Reuse environments computed by other tasks of the context
+            cache_dir = get_environments_cache_dir()
+            if cache_dir:
+                args.append("--cache-dir")
+                args.append(cache_dir)
         else:
             msg = "Required env vars: AVALON_PROJECT, AVALON_ASSET, " + \
                   "AVALON_TASK, AVALON_APP_NAME"
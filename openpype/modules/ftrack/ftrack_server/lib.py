@@ -130,15 +130,47 @@ class StorerEventHub(SocketBaseEventHub):
 
 
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by storer.
+
+    Not processed events are loaded in pages ordered by stored date. Next
+    page continues after last loaded event (resume token), full sweep of
+    not processed events is done only once per `full_scan_interval` to
+    catch events stored out of order. Processed events are acknowledged
+    with single update per batch. Removing of old processed events and
+    logging of metrics run periodically.
+    """
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger().get_logger("Session Processor")
 
+    # Count of events loaded from database at once
+    page_size = 100
+    # Max seconds before processed events are acknowledged in database
+    ack_interval = 1
+    # Seconds between full sweeps of not processed events
+    full_scan_interval = 60
+    # Seconds between removing of old processed events
+    cleanup_interval = 3600
+    # Processed events older than this count of days are removed
+    retention_days = 3
+    # Seconds between logged metrics
+    metrics_interval = 60
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._resume_token = None
+        # Stored date of loaded events which were not processed yet
+        self._pending_events = {}
+        self._processed_ids = []
+        self._last_ack = time.time()
+        self._last_full_scan = time.time()
+        self._last_cleanup = None
+        self._last_metrics = time.time()
+        self._metrics = self._new_metrics()
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -163,79 +195,193 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+        try:
+            self.dbcon.create_index([
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ])
+        except pymongo.errors.OperationFailure:
+            self.pypelog.warning(
+                "Index of events could not be created.", exc_info=True
+            )
+
     def wait(self, duration=None):
         """Overridden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty. Handled events
+        are set as processed in Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
         while True:
             try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+                self._run_periodic_tasks()
                 try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self.acknowledge_processed()
+                    if not self.load_events():
+                        time.sleep(0.5)
+                else:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["AVALON_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+                    if mongo_id is not None:
+                        self._event_processed(mongo_id)
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        self.acknowledge_processed()
+                        break
+
+            except pymongo.errors.AutoReconnect:
+                self.pypelog.error((
+                    "Mongo server \"{}\" is not responding, exiting."
+                ).format(os.environ["AVALON_MONGO"]))
+                sys.exit(0)
 
             if duration is not None:
                 if (time.time() - started) > duration:
+                    self.acknowledge_processed()
                     break
 
     def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        )
+        """Load next page of not processed events sorted by stored date"""
+        query = {"pype_data.is_processed": False}
+        if self._resume_token is not None:
+            stored, mongo_id = self._resume_token
+            query["$or"] = [
+                {"pype_data.stored": {"$gt": stored}},
+                {"pype_data.stored": stored, "_id": {"$gt": mongo_id}}
+            ]
+
+        not_processed_events = self.dbcon.find(query).sort([
+            ("pype_data.stored", pymongo.ASCENDING),
+            ("_id", pymongo.ASCENDING)
+        ]).limit(self.page_size)
 
         found = False
         for event_data in not_processed_events:
+            mongo_id = event_data["_id"]
+            stored = event_data["pype_data"]["stored"]
+            self._resume_token = (stored, mongo_id)
+            # Event is already in queue
+            if mongo_id in self._pending_events:
+                continue
+
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
             }
             try:
                 event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
+                event["data"]["_event_mongo_id"] = mongo_id
             except Exception:
                 self.logger.exception(L(
                     'Failed to convert payload into event: {0}',
                     event_data
                 ))
+                # Event can't be processed, don't load it again
+                self._processed_ids.append(mongo_id)
                 continue
             found = True
+            self._pending_events[mongo_id] = stored
             self._event_queue.put(event)
 
         return found
 
+    def acknowledge_processed(self):
+        """Set processed events as processed in database."""
+        self._last_ack = time.time()
+        if not self._processed_ids:
+            return
+
+        processed_ids, self._processed_ids = self._processed_ids, []
+        self.dbcon.update_many(
+            {"_id": {"$in": processed_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def remove_old_events(self):
+        """Remove processed events older than `retention_days`."""
+        ago_date = (
+            datetime.datetime.utcnow()
+            - datetime.timedelta(days=self.retention_days)
+        )
+        self.dbcon.delete_many({
+            "pype_data.stored": {"$lte": ago_date},
+            "pype_data.is_processed": True
+        })
+
+    def get_metrics(self):
+        """Metrics of processing since last logged metrics.
+
+        Returns:
+            dict: Count of processed events, average and max latency in
+                seconds (time between storing and processing of event) and
+                count of events waiting in queue.
+        """
+        metrics = self._metrics
+        latency_avg = 0
+        if metrics["processed"]:
+            latency_avg = metrics["latency_sum"] / metrics["processed"]
+        return {
+            "processed": metrics["processed"],
+            "latency_avg": latency_avg,
+            "latency_max": metrics["latency_max"],
+            "queue_depth": self._event_queue.qsize(),
+            "not_processed": self.dbcon.count_documents(
+                {"pype_data.is_processed": False}
+            )
+        }
+
+    def _new_metrics(self):
+        return {
+            "processed": 0,
+            "latency_sum": 0,
+            "latency_max": 0
+        }
+
+    def _event_processed(self, mongo_id):
+        self._processed_ids.append(mongo_id)
+        stored = self._pending_events.pop(mongo_id, None)
+        if stored is not None:
+            latency = (datetime.datetime.utcnow() - stored).total_seconds()
+            self._metrics["processed"] += 1
+            self._metrics["latency_sum"] += latency
+            self._metrics["latency_max"] = max(
+                latency, self._metrics["latency_max"]
+            )
+
+        if (
+            len(self._processed_ids) >= self.page_size
+            or time.time() - self._last_ack >= self.ack_interval
+        ):
+            self.acknowledge_processed()
+
+    def _run_periodic_tasks(self):
+        now = time.time()
+        if now - self._last_full_scan >= self.full_scan_interval:
+            self._last_full_scan = now
+            self._resume_token = None
+
+        if (
+            self._last_cleanup is None
+            or now - self._last_cleanup >= self.cleanup_interval
+        ):
+            self._last_cleanup = now
+            self.remove_old_events()
+
+        if now - self._last_metrics >= self.metrics_interval:
+            self._last_metrics = now
+            metrics = self.get_metrics()
+            self._metrics = self._new_metrics()
+            self.pypelog.debug((
+                "Processed {processed} events, latency avg {latency_avg:.2f}s"
+                " max {latency_max:.2f}s, {queue_depth} in queue"
+                ", {not_processed} not processed in database."
+            ).format(**metrics))
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -0,0 +1,360 @@
+"""Chunked, resumable transfer of single file by parallel streams.
+
+File is split into chunks of same size which are transferred by one or more
+streams. Data are written to partial file next to the target which is
+renamed to target path when all chunks are transferred.
+
+Checksums of transferred chunks are stored to a local journal. Interrupted
+transfer continues from the partial file, transferred chunks are verified
+against their checksums in journal and only missing chunks are transferred.
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+
+import six
+from six.moves import queue
+import appdirs
+
+from openpype.api import Logger
+
+log = Logger().get_logger("SyncServer")
+
+PARTIAL_EXT = ".oppart"
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+# Size of blocks read from source while transferring chunk
+BLOCK_SIZE = 1024 * 1024
+
+
+class LocalFileEndpoint(object):
+    """File on local (or mounted) disk."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def stat(self):
+        """Size and modification time or None if file does not exist."""
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return None
+        return stat_result.st_size, int(stat_result.st_mtime)
+
+    def open_read(self):
+        return open(self.path, "rb")
+
+    def open_write(self):
+        return open(self.path, "r+b")
+
+    def create(self):
+        """Create empty file or truncate existing."""
+        with open(self.path, "wb"):
+            pass
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def move_to(self, path):
+        os.replace(self.path, path)
+
+
+class ProgressReporter(object):
+    """Thread safe progress of transferred bytes stored to DB.
+
+    Progress is sent to server at most once per 'server.LOG_PROGRESS_SEC'.
+
+    Args:
+        server (SyncServerModule): server instance to call update_db on
+        collection (str): name of collection
+        file (dict): info about transferred file
+        representation (dict): complete repre containing 'file'
+        site (str): site name
+        total_size (int): size of transferred file
+        direction (str): 'Upload' or 'Download' used in log
+    """
+
+    def __init__(self, server, collection, file, representation, site,
+                 total_size, direction="Upload"):
+        self.server = server
+        self.collection = collection
+        self.file = file
+        self.representation = representation
+        self.site = site
+        self.total_size = total_size
+        self.direction = direction
+
+        self._transferred = 0
+        self._last_tick = None
+        self._lock = threading.Lock()
+
+    def add(self, size):
+        """Add count of transferred bytes."""
+        with self._lock:
+            self._transferred += size
+            now = time.time()
+            if (
+                self._last_tick is not None
+                and now - self._last_tick < self.server.LOG_PROGRESS_SEC
+            ):
+                return
+            self._last_tick = now
+            progress = 1.0
+            if self.total_size:
+                progress = float(self._transferred) / self.total_size
+
+        log.debug("{}ed {}%.".format(self.direction, int(progress * 100)))
+        self.server.update_db(collection=self.collection,
+                              new_file_id=None,
+                              file=self.file,
+                              representation=self.representation,
+                              site=self.site,
+                              progress=progress)
+
+
+class ChunkedTransfer(object):
+    """Transfer of single file in chunks with resume.
+
+    Args:
+        source (LocalFileEndpoint): Source file endpoint.
+        target (LocalFileEndpoint): Target file endpoint, partial file
+            endpoint with same interface is created by 'partial_factory'.
+        partial_factory (callable): Creates endpoint for path of partial
+            file.
+        chunk_size (int): Size of chunks in bytes.
+        streams (int): Max count of parallel streams.
+        progress (ProgressReporter): Receives count of transferred bytes.
+        verify_resumed (str): Which chunks of partial file are verified on
+            resume, 'all' or 'last' (when reading target back is
+            expensive, e.g. remote target).
+        journal_dir (str): Directory where journals are stored.
+        rate_limiter (RateLimiter): Limits bandwidth of all streams.
+    """
+
+    def __init__(self, source, target, partial_factory,
+                 chunk_size=DEFAULT_CHUNK_SIZE, streams=1, progress=None,
+                 verify_resumed="all", journal_dir=None, rate_limiter=None):
+        if journal_dir is None:
+            journal_dir = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "sync_server",
+                "transfers"
+            )
+        self.source = source
+        self.target = target
+        self.partial = partial_factory(target.path + PARTIAL_EXT)
+        self.chunk_size = chunk_size
+        self.streams = max(1, streams)
+        self.progress = progress
+        self.verify_resumed = verify_resumed
+        self.journal_dir = journal_dir
+        self.rate_limiter = rate_limiter
+
+        key = "{}|{}".format(source.path, target.path)
+        self.journal_path = os.path.join(
+            journal_dir,
+            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+        self._journal = None
+        self._journal_lock = threading.Lock()
+
+    def transfer(self):
+        """Transfer missing chunks and move partial file to target.
+
+        Returns:
+            int: Count of bytes transferred by this call.
+        """
+        source_stat = self.source.stat()
+        if source_stat is None:
+            raise FileNotFoundError(
+                "Source file {} doesn't exist.".format(self.source.path)
+            )
+        size, mtime = source_stat
+
+        done_chunks = self._resumed_chunks(size, mtime)
+        if done_chunks:
+            log.info("Resuming transfer of {} from {} chunks".format(
+                self.source.path, len(done_chunks)
+            ))
+        else:
+            self.partial.create()
+
+        self._journal = {
+            "source": self.source.path,
+            "target": self.target.path,
+            "size": size,
+            "mtime": mtime,
+            "chunk_size": self.chunk_size,
+            "chunks": done_chunks
+        }
+        self._save_journal()
+
+        chunk_count = max(1, (size + self.chunk_size - 1) // self.chunk_size)
+        missing = [
+            idx
+            for idx in range(chunk_count)
+            if str(idx) not in done_chunks
+        ]
+        if self.progress is not None:
+            self.progress.add(size - self._chunks_size(missing, size))
+
+        self._transfer_chunks(missing, size)
+
+        self.partial.move_to(self.target.path)
+        self._remove_journal()
+        return self._chunks_size(missing, size)
+
+    def _chunks_size(self, chunk_indexes, size):
+        return sum(
+            min(self.chunk_size, size - idx * self.chunk_size)
+            for idx in chunk_indexes
+        )
+
+    def _transfer_chunks(self, chunk_indexes, size):
+        if not chunk_indexes:
+            return
+
+        chunk_queue = queue.Queue()
+        for idx in chunk_indexes:
+            chunk_queue.put(idx)
+
+        errors = []
+        stop_event = threading.Event()
+        streams_count = min(self.streams, len(chunk_indexes))
+        if streams_count == 1:
+            self._stream_worker(chunk_queue, size, stop_event, errors)
+        else:
+            threads = [
+                threading.Thread(
+                    target=self._stream_worker,
+                    args=(chunk_queue, size, stop_event, errors)
+                )
+                for _ in range(streams_count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            six.reraise(*errors[0])
+
+    def _stream_worker(self, chunk_queue, size, stop_event, errors):
+        try:
+            with self.source.open_read() as src_stream:
+                with self.partial.open_write() as dst_stream:
+                    while not stop_event.is_set():
+                        try:
+                            idx = chunk_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        checksum = self._transfer_chunk(
+                            src_stream, dst_stream, idx, size
+                        )
+                        self._chunk_done(idx, checksum)
+
+        except Exception:
+            stop_event.set()
+            errors.append(sys.exc_info())
+
+    def _transfer_chunk(self, src_stream, dst_stream, idx, size):
+        offset = idx * self.chunk_size
+        remainder = min(self.chunk_size, size - offset)
+        hasher = hashlib.sha1()
+        src_stream.seek(offset)
+        dst_stream.seek(offset)
+        while remainder > 0:
+            data = src_stream.read(min(BLOCK_SIZE, remainder))
+            if not data:
+                raise IOError("Unexpected end of file {}".format(
+                    self.source.path
+                ))
+            if self.rate_limiter is not None:
+                self.rate_limiter.consume(len(data))
+            dst_stream.write(data)
+            hasher.update(data)
+            remainder -= len(data)
+            if self.progress is not None:
+                self.progress.add(len(data))
+        dst_stream.flush()
+        return hasher.hexdigest()
+
+    def _chunk_done(self, idx, checksum):
+        with self._journal_lock:
+            self._journal["chunks"][str(idx)] = checksum
+            self._save_journal()
+
+    def _resumed_chunks(self, size, mtime):
+        """Chunks from journal of previous transfer which can be reused."""
+        journal = self._load_journal()
+        if (
+            not journal
+            or journal.get("size") != size
+            or journal.get("mtime") != mtime
+            or journal.get("chunk_size") != self.chunk_size
+        ):
+            return {}
+
+        chunks = journal.get("chunks") or {}
+        partial_stat = self.partial.stat()
+        if not chunks or partial_stat is None:
+            return {}
+
+        # Chunks out of range of partial file can't be valid
+        partial_size = partial_stat[0]
+        chunks = {
+            idx: checksum
+            for idx, checksum in chunks.items()
+            if int(idx) * self.chunk_size < partial_size
+        }
+        to_verify = sorted(chunks.keys(), key=int)
+        if self.verify_resumed != "all":
+            to_verify = to_verify[-1:]
+
+        with self.partial.open_read() as stream:
+            for idx in to_verify:
+                if self._chunk_checksum(stream, int(idx), size) != chunks[idx]:
+                    log.info((
+                        "Partial file of {} doesn't match, transfer"
+                        " starts from beginning"
+                    ).format(self.target.path))
+                    return {}
+        return chunks
+
+    def _chunk_checksum(self, stream, idx, size):
+        offset = idx * self.chunk_size
+        remainder = min(self.chunk_size, size - offset)
+        hasher = hashlib.sha1()
+        stream.seek(offset)
+        while remainder > 0:
+            data = stream.read(min(BLOCK_SIZE, remainder))
+            if not data:
+                return None
+            hasher.update(data)
+            remainder -= len(data)
+        return hasher.hexdigest()
+
+    def _load_journal(self):
+        if not os.path.exists(self.journal_path):
+            return None
+        try:
+            with open(self.journal_path, "r") as stream:
+                return json.load(stream)
+        except ValueError:
+            return None
+
+    def _save_journal(self):
+        if not os.path.exists(self.journal_dir):
+            os.makedirs(self.journal_dir)
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, "w") as stream:
+            json.dump(self._journal, stream)
+        os.replace(tmp_path, self.journal_path)
+
+    def _remove_journal(self):
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
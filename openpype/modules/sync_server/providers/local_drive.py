@@ -1,11 +1,14 @@
 from __future__ import print_function
 import os.path
 import shutil
-import threading
-import time
 
 from openpype.api import Logger, Anatomy
 from .abstract_provider import AbstractProvider
+from .chunked_transfer import (
+    ChunkedTransfer,
+    LocalFileEndpoint,
+    ProgressReporter
+)
 
 log = Logger().get_logger("SyncServer")
 
@@ -13,6 +16,8 @@ log = Logger().get_logger("SyncServer")
 class LocalDriveHandler(AbstractProvider):
     CODE = 'local_drive'
     LABEL = 'Local drive'
+    CHUNK_SIZE = 64 * 1024 * 1024  # size of resumable parts of file
+    TRANSFER_STREAMS = 4  # max parallel streams for single file
 
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
@@ -85,21 +90,36 @@ class LocalDriveHandler(AbstractProvider):
                     overwrite=False, direction="Upload"):
         """
             Copies file from 'source_path' to 'target_path'
+
+            Large files are copied in chunks by parallel streams, interrupted
+            copy is resumed from partial file.
         """
         if not os.path.isfile(source_path):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
 
-        if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(collection, file, representation, server,
-                                site, source_path, target_path, direction)
-        else:
-            if os.path.exists(target_path):
-                raise ValueError("File {} exists, set overwrite".
-                                 format(target_path))
+        if not overwrite and os.path.exists(target_path):
+            raise ValueError("File {} exists, set overwrite".
+                             format(target_path))
+
+        if os.path.exists(target_path) and \
+                os.path.samefile(source_path, target_path):
+            print("same files, skipping")
+            return os.path.basename(target_path)
+
+        progress = ProgressReporter(server, collection, file, representation,
+                                    site, os.path.getsize(source_path),
+                                    direction)
+        transfer = ChunkedTransfer(LocalFileEndpoint(source_path),
+                                   LocalFileEndpoint(target_path),
+                                   LocalFileEndpoint,
+                                   chunk_size=self.CHUNK_SIZE,
+                                   streams=self.TRANSFER_STREAMS,
+                                   progress=progress,
+                                   rate_limiter=server.get_rate_limiter(
+                                       self.site_name))
+        transfer.transfer()
+        shutil.copymode(source_path, target_path)
 
         return os.path.basename(target_path)
 
@@ -180,42 +200,6 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
-            print("same files, skipping")
-
-    def _mark_progress(self, collection, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(collection=collection,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
-
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
         if site_name != 'studio':
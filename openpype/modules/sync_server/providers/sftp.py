@@ -1,12 +1,15 @@
 import os
 import os.path
-import time
-import threading
 import platform
 
 from openpype.api import Logger
 from openpype.api import get_system_settings
 from .abstract_provider import AbstractProvider
+from .chunked_transfer import (
+    ChunkedTransfer,
+    LocalFileEndpoint,
+    ProgressReporter
+)
 log = Logger().get_logger("SyncServer")
 
 pysftp = None
@@ -33,6 +36,8 @@ class SFTPHandler(AbstractProvider):
     """
     CODE = 'sftp'
     LABEL = 'SFTP'
+    CHUNK_SIZE = 64 * 1024 * 1024  # size of resumable parts of file
+    TRANSFER_STREAMS = 4  # max parallel streams (connections) for file
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -253,19 +258,14 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(collection, file, representation, server,
-                            site, source_path, target_path, "upload")
+        self._transfer(LocalFileEndpoint(source_path),
+                       SFTPFileEndpoint(self, target_path),
+                       lambda path: SFTPFileEndpoint(self, path),
+                       server, collection, file, representation, site,
+                       "Upload", verify_resumed="last")
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.put(source_path, target_path)
-
     def download_file(self, source_path, target_path,
                       server, collection, file, representation, site,
                       overwrite=False):
@@ -299,18 +299,38 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(collection, file, representation, server,
-                            site, source_path, target_path, "download")
+        self._transfer(SFTPFileEndpoint(self, source_path),
+                       LocalFileEndpoint(target_path),
+                       LocalFileEndpoint,
+                       server, collection, file, representation, site,
+                       "Download")
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
-        print("downloading {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.get(source_path, target_path)
+    def _transfer(self, source, target, partial_factory,
+                  server, collection, file, representation, site,
+                  direction, verify_resumed="all"):
+        """
+            Transfer file in chunks with resume and progress.
+
+            Each stream uses its own connection.
+        """
+        print("{}ing {}->{}".format(direction, source.path, target.path))
+        source_stat = source.stat()
+        if source_stat is None:
+            raise FileNotFoundError("Source file {} doesn't exist."
+                                    .format(source.path))
+
+        progress = ProgressReporter(server, collection, file, representation,
+                                    site, source_stat[0], direction)
+        transfer = ChunkedTransfer(source, target, partial_factory,
+                                   chunk_size=self.CHUNK_SIZE,
+                                   streams=self.TRANSFER_STREAMS,
+                                   progress=progress,
+                                   verify_resumed=verify_resumed,
+                                   rate_limiter=server.get_rate_limiter(
+                                       self.site_name))
+        transfer.transfer()
 
     def delete_file(self, path):
         """
@@ -425,39 +445,86 @@ class SFTPHandler(AbstractProvider):
                 pysftp.exceptions.ConnectionException):
             log.warning("Couldn't connect", exc_info=True)
 
-    def _mark_progress(self, collection, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
 
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(collection=collection,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+class SFTPFileEndpoint(object):
+    """File on SFTP used by 'ChunkedTransfer'.
+
+    Args:
+        handler (SFTPHandler): Provider creating connections.
+        path (str): Path of file on SFTP.
+    """
+
+    def __init__(self, handler, path):
+        self.handler = handler
+        self.path = path
+
+    def stat(self):
+        """Size and modification time or None if file does not exist."""
+        try:
+            stat_result = self.handler.conn.stat(self.path)
+        except IOError:
+            return None
+        return stat_result.st_size, int(stat_result.st_mtime)
+
+    def open_read(self):
+        return self._open("rb")
+
+    def open_write(self):
+        return self._open("r+b")
+
+    def create(self):
+        """Create empty file or truncate existing."""
+        with self._open("wb"):
+            pass
+
+    def remove(self):
+        if self.handler.conn.isfile(self.path):
+            self.handler.conn.remove(self.path)
+
+    def move_to(self, path):
+        sftp_client = self.handler.conn.sftp_client
+        try:
+            sftp_client.posix_rename(self.path, path)
+        except IOError:
+            # server without posix-rename extension
+            if self.handler.conn.isfile(path):
+                self.handler.conn.remove(path)
+            sftp_client.rename(self.path, path)
+
+    def _open(self, mode):
+        conn = self.handler._get_conn()
+        if conn is None:
+            raise ConnectionError("Couldn't connect to {}".format(
+                self.handler.sftp_host
+            ))
+        try:
+            stream = conn.open(self.path, mode)
+        except Exception:
+            conn.close()
+            raise
+        # don't wait for server acknowledgement of each written block
+        stream.set_pipelined(True)
+        return _SFTPStream(conn, stream)
+
+
+class _SFTPStream(object):
+    """Remote file which closes its own connection."""
+
+    def __init__(self, conn, stream):
+        self._conn = conn
+        self._stream = stream
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._conn.close()
@@ -0,0 +1,240 @@
+"""Python 3 only implementation."""
+import time
+import heapq
+import asyncio
+import threading
+import contextlib
+import concurrent.futures
+from collections import deque
+
+from openpype.lib import PypeLogger
+
+
+log = PypeLogger().get_logger("SyncServer")
+
+
+class RateLimiter:
+    """Token bucket limiting transferred bytes per second.
+
+    Shared by all transfer threads of one site.
+
+    Args:
+        bytes_per_sec (int): Bandwidth limit, 0 means unlimited.
+    """
+    def __init__(self, bytes_per_sec=0):
+        self.bytes_per_sec = bytes_per_sec
+        self._tokens = 0.0
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def consume(self, size):
+        """Block calling thread until 'size' bytes can be transferred."""
+        if not self.bytes_per_sec:
+            return
+
+        with self._lock:
+            now = time.time()
+            # Allow burst of at most one second
+            self._tokens = min(
+                self.bytes_per_sec,
+                self._tokens + (now - self._last) * self.bytes_per_sec
+            )
+            self._last = now
+            self._tokens -= size
+            wait = 0
+            if self._tokens < 0:
+                wait = -self._tokens / self.bytes_per_sec
+
+        if wait:
+            time.sleep(wait)
+
+
+class SiteLane:
+    """Concurrency control of transfers of one site.
+
+    Waiting transfers are started by priority. Count of concurrent
+    transfers adapts to observed results (AIMD): each error halves it,
+    successful transfers raise it by one per current limit of transfers
+    while throughput of site does not drop.
+
+    Args:
+        site_name (str): Name of site.
+        max_concurrency (int): Max count of concurrent transfers.
+        bytes_per_sec (int): Bandwidth limit, 0 means unlimited.
+    """
+    # Seconds of finished transfers used to measure throughput
+    THROUGHPUT_WINDOW = 30
+    # Tolerated drop of throughput to keep raising concurrency
+    THROUGHPUT_TOLERANCE = 0.9
+
+    def __init__(self, site_name, max_concurrency, bytes_per_sec=0):
+        self.site_name = site_name
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(min(2, self.max_concurrency))
+        self.rate_limiter = RateLimiter(bytes_per_sec)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency
+        )
+
+        self.active = 0
+        self._waiting = []
+        self._counter = 0
+        self._finished = deque()
+        self._best_throughput = 0
+
+    def configure(self, max_concurrency, bytes_per_sec):
+        max_concurrency = max(1, max_concurrency)
+        if max_concurrency != self.max_concurrency:
+            self.max_concurrency = max_concurrency
+            self.limit = min(self.limit, float(max_concurrency))
+            # Running transfers finish in previous executor
+            self.executor.shutdown(wait=False)
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_concurrency
+            )
+        self.rate_limiter.bytes_per_sec = bytes_per_sec
+        self._wake_up()
+
+    async def acquire(self, priority):
+        """Wait until transfer with 'priority' can start."""
+        if self.active < int(self.limit) and not self._waiting:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._counter += 1
+        # Higher priority first, then in order of arrival
+        heapq.heappush(self._waiting, (-priority, self._counter, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # slot was already given to this transfer
+                self.release()
+            raise
+
+    def release(self):
+        self.active -= 1
+        self._wake_up()
+
+    def _wake_up(self):
+        while self._waiting and self.active < int(self.limit):
+            _, _, future = heapq.heappop(self._waiting)
+            if future.done():
+                continue
+            self.active += 1
+            future.set_result(None)
+
+    def transfer_finished(self, size, error=None):
+        """Adapt concurrency to result of transfer."""
+        if error is not None:
+            self.limit = max(1.0, self.limit / 2)
+            log.debug("Site {} concurrency decreased to {}".format(
+                self.site_name, int(self.limit)
+            ))
+            return
+
+        now = time.time()
+        self._finished.append((now, size or 0))
+        while self._finished[0][0] < now - self.THROUGHPUT_WINDOW:
+            self._finished.popleft()
+        throughput = (
+            sum(item[1] for item in self._finished) / self.THROUGHPUT_WINDOW
+        )
+
+        if throughput >= self._best_throughput * self.THROUGHPUT_TOLERANCE:
+            self.limit = min(
+                float(self.max_concurrency), self.limit + 1 / self.limit
+            )
+        else:
+            self.limit = max(1.0, self.limit - 1 / self.limit)
+        self._best_throughput = max(throughput, self._best_throughput * 0.99)
+        self._wake_up()
+
+    def shutdown(self):
+        for _, _, future in self._waiting:
+            future.cancel()
+        self._waiting = []
+        self.executor.shutdown(wait=False)
+
+
+class TransferScheduler:
+    """Schedules transfers of sync server per site.
+
+    Each site has its own 'SiteLane' with executor, so transfers of one
+    site don't block transfers of another site. Scheduled transfers are
+    tracked so next loop of sync server does not schedule them again and
+    can add transfers with higher priority while previous are running.
+    Transfer stays scheduled until 'finish' is called with its key, which
+    should happen when its result is stored to database.
+    """
+    def __init__(self):
+        self._lanes = {}
+        self._scheduled = set()
+
+    def configure_site(self, site_name, max_concurrency, bytes_per_sec=0):
+        """Set limits of site, lane of site is created if does not exist."""
+        lane = self._lanes.get(site_name)
+        if lane is None:
+            self._lanes[site_name] = SiteLane(
+                site_name, max_concurrency, bytes_per_sec
+            )
+        else:
+            lane.configure(max_concurrency, bytes_per_sec)
+
+    def get_rate_limiter(self, site_name):
+        lane = self._lanes.get(site_name)
+        if lane is not None:
+            return lane.rate_limiter
+        return None
+
+    def is_scheduled(self, key):
+        return key in self._scheduled
+
+    def schedule(self, key, coro):
+        """Run transfer coroutine as task tracked by 'key'.
+
+        Args:
+            key (tuple): Identifier of transfer.
+            coro (coroutine): Transfer which uses 'slot' of its site.
+
+        Returns:
+            asyncio.Task: Task of transfer.
+        """
+        self._scheduled.add(key)
+        return asyncio.create_task(coro)
+
+    def finish(self, key):
+        """Transfer tracked by 'key' can be scheduled again."""
+        self._scheduled.discard(key)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, site_name, priority, size=None):
+        """Wait for free transfer slot of site.
+
+        Yields executor of site where blocking transfer should run.
+        Result of transfer is used to adapt concurrency of site.
+
+        Args:
+            site_name (str): Site which limits are used, must be configured.
+            priority (int): Higher priority transfers start first.
+            size (int): Size of transferred data.
+        """
+        lane = self._lanes[site_name]
+        await lane.acquire(priority)
+        try:
+            yield lane.executor
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            lane.transfer_finished(size, exc)
+            raise
+        else:
+            lane.transfer_finished(size)
+        finally:
+            lane.release()
+
+    def shutdown(self):
+        for lane in self._lanes.values():
+            lane.shutdown()
+        self._lanes = {}
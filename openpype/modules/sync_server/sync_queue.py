@@ -0,0 +1,366 @@
+"""Python 3 only implementation."""
+import time
+import heapq
+import threading
+from datetime import timedelta
+
+from bson.objectid import ObjectId
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError, OperationFailure
+
+from openpype.lib import PypeLogger
+
+
+log = PypeLogger().get_logger("SyncServer")
+
+
+class ProjectSyncQueue:
+    """Pending representations of one project for pair of sites.
+
+    Full scan of representations (aggregation over all representations of
+    project) is done only on start and then once per 'full_scan_interval'.
+    Between full scans queue is updated incrementally with representations
+    which changed since last loop. Changes are taken from change stream of
+    project collection when database supports it (replica set), otherwise
+    representations are polled by their 'last_modified' field. The field is
+    set by all writes changing synchronization state of representation
+    (sync server, add or remove site, publishing). Representations processed
+    by sync server are marked directly with 'mark_dirty' when their state is
+    stored to database.
+
+    Args:
+        module (SyncServerModule): Module used to query representations.
+        project_name (str): Name of project (collection).
+        local_site (str): Name of active site.
+        remote_site (str): Name of remote site.
+    """
+    # Max changes drained from change stream in one loop, full scan is
+    #   triggered when exceeded
+    MAX_CHANGES = 10000
+    # Error code of unsupported change stream (standalone mongod)
+    CHANGE_STREAM_NOT_SUPPORTED = 40573
+    # Publishing clients set 'last_modified' of new representations with
+    #   their own clock, polling looks this far back to tolerate clock skew
+    POLL_MARGIN = timedelta(seconds=60)
+
+    def __init__(self, module, project_name, local_site, remote_site):
+        self.module = module
+        self.project_name = project_name
+        self.local_site = local_site
+        self.remote_site = remote_site
+
+        self._pending = {}
+        # Marked from threads storing results of transfers
+        self._dirty_ids = set()
+        self._dirty_lock = threading.Lock()
+        self._last_full_scan = None
+
+        self._change_stream = None
+        self._change_stream_supported = True
+
+        # Polling of 'last_modified' used without change stream
+        self._last_modified = None
+        self._modified_by_id = {}
+
+    @property
+    def collection(self):
+        return self.module.connection.database[self.project_name]
+
+    def mark_dirty(self, representation_ids):
+        """Representations which should be checked again in next loop."""
+        representation_ids = [
+            ObjectId(representation_id)
+            for representation_id in representation_ids
+        ]
+        with self._dirty_lock:
+            self._dirty_ids.update(representation_ids)
+
+    def _pop_dirty_ids(self):
+        with self._dirty_lock:
+            dirty_ids = self._dirty_ids
+            self._dirty_ids = set()
+        return dirty_ids
+
+    def invalidate(self):
+        """Force full scan in next loop."""
+        self._last_full_scan = None
+
+    def close(self):
+        if self._change_stream is not None:
+            try:
+                self._change_stream.close()
+            except PyMongoError:
+                pass
+            self._change_stream = None
+
+    def get_representations(self, full_scan_interval):
+        """Pending representations sorted by priority.
+
+        Args:
+            full_scan_interval (int): Seconds between full scans. Full scan
+                is done in every call if is 0.
+
+        Returns:
+            list: Representations in same format as returned by
+                'SyncServerModule.get_sync_representations'.
+        """
+        now = time.time()
+        if (
+            not full_scan_interval
+            or self._last_full_scan is None
+            or now - self._last_full_scan >= full_scan_interval
+        ):
+            self._full_scan(bool(full_scan_interval))
+        else:
+            self._update()
+
+        # Heap keeps representations ordered by priority and '_id' in the
+        #   same way as sort in aggregation
+        heap = [
+            (-(repre.get("priority") or 0), repre["_id"], repre)
+            for repre in self._pending.values()
+        ]
+        heapq.heapify(heap)
+        return [
+            heapq.heappop(heap)[-1]
+            for _ in range(len(heap))
+        ]
+
+    def _full_scan(self, incremental):
+        log.debug("Full scan of representations in {}".format(
+            self.project_name
+        ))
+        scan_start = time.time()
+        # Open change stream before scan so no change is missed
+        if incremental:
+            self._open_change_stream()
+            if self._change_stream is None:
+                self._start_polling()
+        else:
+            self.close()
+
+        # Representations marked during scan are checked in next loop
+        self._pop_dirty_ids()
+        representations = self.module.get_sync_representations(
+            self.project_name, self.local_site, self.remote_site
+        )
+        self._pending = {
+            repre["_id"]: repre
+            for repre in representations
+        }
+        self._last_full_scan = scan_start
+
+    def _update(self):
+        changed_ids = self._pop_dirty_ids()
+
+        try:
+            new_ids = self._changed_ids()
+        except _FullScanRequired:
+            self._full_scan(True)
+            return
+
+        changed_ids |= new_ids
+        if not changed_ids:
+            return
+
+        log.debug("Checking {} changed representations in {}".format(
+            len(changed_ids), self.project_name
+        ))
+        representations = self.module.get_sync_representations(
+            self.project_name,
+            self.local_site,
+            self.remote_site,
+            representation_ids=list(changed_ids)
+        )
+        for repre_id in changed_ids:
+            self._pending.pop(repre_id, None)
+        for repre in representations:
+            self._pending[repre["_id"]] = repre
+
+    def _changed_ids(self):
+        if self._change_stream is not None:
+            return self._drain_change_stream()
+        return self._poll_modified_representations()
+
+    def _open_change_stream(self):
+        self.close()
+        if not self._change_stream_supported:
+            return
+
+        pipeline = [
+            {"$match": {"operationType": {
+                "$in": ["insert", "update", "replace", "delete"]
+            }}}
+        ]
+        try:
+            self._change_stream = self.collection.watch(
+                pipeline, max_await_time_ms=10
+            )
+        except OperationFailure as exc:
+            if exc.code == self.CHANGE_STREAM_NOT_SUPPORTED:
+                log.info((
+                    "Change streams are not supported by database."
+                    " Polling modified representations of {} instead."
+                ).format(self.project_name))
+                self._change_stream_supported = False
+            else:
+                log.warning("Change stream could not be opened", exc_info=True)
+        except PyMongoError:
+            log.warning("Change stream could not be opened", exc_info=True)
+
+    def _drain_change_stream(self):
+        changed_ids = set()
+        try:
+            while True:
+                if not self._change_stream.alive:
+                    # Changes after the stream was closed would be missed
+                    raise _FullScanRequired()
+
+                change = self._change_stream.try_next()
+                if change is None:
+                    break
+
+                document_key = change.get("documentKey") or {}
+                doc_id = document_key.get("_id")
+                if doc_id is None:
+                    continue
+
+                if change["operationType"] == "delete":
+                    self._pending.pop(doc_id, None)
+                else:
+                    changed_ids.add(doc_id)
+
+                if len(changed_ids) > self.MAX_CHANGES:
+                    raise _FullScanRequired()
+
+        except PyMongoError:
+            log.warning(
+                "Change stream of {} failed".format(self.project_name),
+                exc_info=True
+            )
+            raise _FullScanRequired()
+        return changed_ids
+
+    def _start_polling(self):
+        """Start polling of representations modified after full scan."""
+        self._modified_by_id = {}
+        self._last_modified = None
+        try:
+            self.collection.create_index(
+                [("last_modified", ASCENDING)], sparse=True
+            )
+            for doc in self.collection.find(
+                {"last_modified": {"$exists": True}},
+                {"last_modified": 1}
+            ).sort("last_modified", -1).limit(1):
+                self._last_modified = doc["last_modified"]
+
+        except PyMongoError:
+            log.warning(
+                "Last modified representation of {} was not found".format(
+                    self.project_name
+                ),
+                exc_info=True
+            )
+
+    def _poll_modified_representations(self):
+        query = {"last_modified": {"$exists": True}}
+        since = None
+        if self._last_modified is not None:
+            since = self._last_modified - self.POLL_MARGIN
+            query["last_modified"] = {"$gt": since}
+
+        changed_ids = set()
+        modified_by_id = {}
+        try:
+            for doc in self.collection.find(
+                query, {"last_modified": 1}
+            ).sort("last_modified", ASCENDING):
+                doc_id = doc["_id"]
+                last_modified = doc["last_modified"]
+                modified_by_id[doc_id] = last_modified
+                # Already found in previous loop
+                if self._modified_by_id.get(doc_id) != last_modified:
+                    changed_ids.add(doc_id)
+                if len(changed_ids) > self.MAX_CHANGES:
+                    raise _FullScanRequired()
+
+            # Deleted representations are not found by polling
+            if self._pending:
+                existing_ids = {
+                    doc["_id"]
+                    for doc in self.collection.find(
+                        {"_id": {"$in": list(self._pending.keys())}},
+                        {"_id": 1}
+                    )
+                }
+                for repre_id in set(self._pending.keys()) - existing_ids:
+                    self._pending.pop(repre_id)
+
+        except PyMongoError:
+            log.warning(
+                "Polling of {} failed".format(self.project_name),
+                exc_info=True
+            )
+            raise _FullScanRequired()
+
+        if modified_by_id:
+            newest = max(modified_by_id.values())
+            if self._last_modified is None or newest > self._last_modified:
+                self._last_modified = newest
+        self._modified_by_id = modified_by_id
+        return changed_ids
+
+
+class SyncQueue:
+    """Pending representations of all synchronized projects.
+
+    Holds 'ProjectSyncQueue' for each project. Queue of project is recreated
+    when its sites change.
+    """
+    def __init__(self, module):
+        self.module = module
+        self._project_queues = {}
+
+    def get_representations(self, project_name, local_site, remote_site):
+        project_queue = self._project_queues.get(project_name)
+        if (
+            project_queue is None
+            or project_queue.local_site != local_site
+            or project_queue.remote_site != remote_site
+        ):
+            if project_queue is not None:
+                project_queue.close()
+            project_queue = ProjectSyncQueue(
+                self.module, project_name, local_site, remote_site
+            )
+            self._project_queues[project_name] = project_queue
+
+        return project_queue.get_representations(
+            self.module.get_full_scan_interval(project_name)
+        )
+
+    def mark_dirty(self, project_name, representation_ids):
+        project_queue = self._project_queues.get(project_name)
+        if project_queue is not None:
+            project_queue.mark_dirty(representation_ids)
+
+    def invalidate(self, project_name=None):
+        """Force full scan of project or all projects in next loop."""
+        if project_name is None:
+            project_queues = self._project_queues.values()
+        else:
+            project_queues = [self._project_queues.get(project_name)]
+
+        for project_queue in project_queues:
+            if project_queue is not None:
+                project_queue.invalidate()
+
+    def close(self):
+        for project_queue in self._project_queues.values():
+            project_queue.close()
+        self._project_queues = {}
+
+
+class _FullScanRequired(Exception):
+    pass
@@ -15,7 +15,7 @@ log = PypeLogger().get_logger("SyncServer")
 
 
 async def upload(module, collection, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, priority=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -39,56 +39,60 @@ async def upload(module, collection, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        priority (int): higher priority transfers start first
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
-        # this part modifies structure on 'remote_site', only single
-        # thread can do that at a time, upload/download to prepared
-        # structure should be run in parallel
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  collection,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        try:
-            local_file_path, remote_file_path = resolve_paths(module,
-                file_path, collection, remote_site_name, remote_handler
-            )
-        except Exception as exp:
-            print(exp)
-
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
-
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
-
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.upload_file,
-                                         local_file_path,
-                                         remote_file_path,
-                                         module,
-                                         collection,
-                                         file,
-                                         representation,
-                                         remote_site_name,
-                                         True
-                                         )
-
-    module.handle_alternate_site(collection, representation, remote_site_name,
-                                 file["_id"], file_id)
-
-    return file_id
+    async with module.transfer_scheduler.slot(
+            remote_site_name, priority, file.get("size")
+    ) as executor:
+        # create ids sequentially, upload file in parallel later
+        with module.lock:
+            # this part modifies structure on 'remote_site', only single
+            # thread can do that at a time, upload/download to prepared
+            # structure should be run in parallel
+            remote_handler = lib.factory.get_provider(provider_name,
+                                                      collection,
+                                                      remote_site_name,
+                                                      tree=tree,
+                                                      presets=preset)
+
+            file_path = file.get("path", "")
+            try:
+                local_file_path, remote_file_path = resolve_paths(module,
+                    file_path, collection, remote_site_name, remote_handler
+                )
+            except Exception as exp:
+                print(exp)
+
+            target_folder = os.path.dirname(remote_file_path)
+            folder_id = remote_handler.create_folder(target_folder)
+
+            if not folder_id:
+                err = "Folder {} wasn't created. Check permissions.". \
+                    format(target_folder)
+                raise NotADirectoryError(err)
+
+        loop = asyncio.get_running_loop()
+        file_id = await loop.run_in_executor(executor,
+                                             remote_handler.upload_file,
+                                             local_file_path,
+                                             remote_file_path,
+                                             module,
+                                             collection,
+                                             file,
+                                             representation,
+                                             remote_site_name,
+                                             True
+                                             )
+
+        module.handle_alternate_site(collection, representation,
+                                     remote_site_name, file["_id"], file_id)
+
+        return file_id
 
 
 async def download(module, collection, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, priority=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -102,44 +106,48 @@ async def download(module, collection, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        priority (int): higher priority transfers start first
 
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  collection,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, collection, remote_site_name, remote_handler
-        )
-
-        local_folder = os.path.dirname(local_file_path)
-        os.makedirs(local_folder, exist_ok=True)
-
-    local_site = module.get_active_site(collection)
-
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.download_file,
-                                         remote_file_path,
-                                         local_file_path,
-                                         module,
-                                         collection,
-                                         file,
-                                         representation,
-                                         local_site,
-                                         True
-                                         )
-
-    module.handle_alternate_site(collection, representation, local_site,
-                                 file["_id"], file_id)
-
-    return file_id
+    async with module.transfer_scheduler.slot(
+            remote_site_name, priority, file.get("size")
+    ) as executor:
+        with module.lock:
+            remote_handler = lib.factory.get_provider(provider_name,
+                                                      collection,
+                                                      remote_site_name,
+                                                      tree=tree,
+                                                      presets=preset)
+
+            file_path = file.get("path", "")
+            local_file_path, remote_file_path = resolve_paths(
+                module, file_path, collection, remote_site_name, remote_handler
+            )
+
+            local_folder = os.path.dirname(local_file_path)
+            os.makedirs(local_folder, exist_ok=True)
+
+        local_site = module.get_active_site(collection)
+
+        loop = asyncio.get_running_loop()
+        file_id = await loop.run_in_executor(executor,
+                                             remote_handler.download_file,
+                                             remote_file_path,
+                                             local_file_path,
+                                             module,
+                                             collection,
+                                             file,
+                                             representation,
+                                             local_site,
+                                             True
+                                             )
+
+        module.handle_alternate_site(collection, representation, local_site,
+                                     file["_id"], file_id)
+
+        return file_id
 
 
 def resolve_paths(module, file_path, collection,
@@ -242,6 +250,9 @@ class SyncServerThread(threading.Thread):
         self.is_running = False
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
         self.timer = None
+        # results of finished transfers waiting to be stored to DB
+        self._results = []
+        self._results_event = None
 
     def run(self):
         self.is_running = True
@@ -253,6 +264,7 @@ class SyncServerThread(threading.Thread):
             self.loop.set_default_executor(self.executor)
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
+            asyncio.ensure_future(self.store_results(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
             log.info("Sync Server Started")
             self.loop.run_forever()
@@ -282,24 +294,32 @@ class SyncServerThread(threading.Thread):
                 import time
                 start_time = None
                 self.module.set_sync_project_settings()  # clean cache
+                enabled_projects = self.module.get_enabled_projects()
+                sites_by_project = {}
+                for collection in self.module.sync_project_settings.keys():
+                    if collection not in enabled_projects:
+                        continue
+                    local_site, remote_site = self._working_sites(collection)
+                    if all([local_site, remote_site]):
+                        sites_by_project[collection] = (local_site,
+                                                        remote_site)
+                self._configure_sites(sites_by_project)
+
                 for collection, preset in self.module.sync_project_settings.\
                         items():
-                    if collection not in self.module.get_enabled_projects():
+                    if collection not in sites_by_project:
                         continue
 
                     start_time = time.time()
-                    local_site, remote_site = self._working_sites(collection)
-                    if not all([local_site, remote_site]):
-                        continue
+                    local_site, remote_site = sites_by_project[collection]
 
-                    sync_repres = self.module.get_sync_representations(
+                    sync_repres = self.module.sync_queue.get_representations(
                         collection,
                         local_site,
                         remote_site
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
+                    scheduled_count = 0
                     # process only unique file paths in one batch
                     # multiple representation could have same file path
                     # (textures),
@@ -316,6 +336,7 @@ class SyncServerThread(threading.Thread):
                                                        presets=site_preset)
                     limit = lib.factory.get_provider_batch_limit(
                         remote_provider)
+                    scheduler = self.module.transfer_scheduler
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
@@ -325,6 +346,8 @@ class SyncServerThread(threading.Thread):
                             continue
                         if limit <= 0:
                             continue
+                        priority = sync.get("priority") or \
+                            self.module.DEFAULT_PRIORITY
                         files = sync.get("files") or []
                         if files:
                             for file in files:
@@ -338,9 +361,14 @@ class SyncServerThread(threading.Thread):
                                     remote_site,
                                     preset.get('config'))
                                 if status == SyncStatus.DO_UPLOAD:
+                                    key = (collection, file["_id"],
+                                           remote_site)
+                                    if scheduler.is_scheduled(key):
+                                        continue
                                     tree = handler.get_tree()
                                     limit -= 1
-                                    task = asyncio.create_task(
+                                    task = scheduler.schedule(
+                                        key,
                                         upload(self.module,
                                                collection,
                                                file,
@@ -348,19 +376,24 @@ class SyncServerThread(threading.Thread):
                                                remote_provider,
                                                remote_site,
                                                tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
+                                               site_preset,
+                                               priority))
                                     # store info for exception handlingy
-                                    files_processed_info.append((file,
+                                    self._watch_task(task, key, (file,
                                                                  sync,
                                                                  remote_site,
-                                                                 collection
-                                                                 ))
+                                                                 collection))
+                                    scheduled_count += 1
                                     processed_file_path.add(file_path)
                                 if status == SyncStatus.DO_DOWNLOAD:
+                                    key = (collection, file["_id"],
+                                           local_site)
+                                    if scheduler.is_scheduled(key):
+                                        continue
                                     tree = handler.get_tree()
                                     limit -= 1
-                                    task = asyncio.create_task(
+                                    task = scheduler.schedule(
+                                        key,
                                         download(self.module,
                                                  collection,
                                                  file,
@@ -368,34 +401,16 @@ class SyncServerThread(threading.Thread):
                                                  remote_provider,
                                                  remote_site,
                                                  tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
+                                                 site_preset,
+                                                 priority))
+                                    self._watch_task(task, key, (file,
                                                                  sync,
                                                                  local_site,
-                                                                 collection
-                                                                 ))
+                                                                 collection))
+                                    scheduled_count += 1
                                     processed_file_path.add(file_path)
 
-                    log.debug("Sync tasks count {}".
-                              format(len(task_files_to_process)))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, collection = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(collection,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                    log.debug("Sync tasks count {}".format(scheduled_count))
 
                 duration = time.time() - start_time
                 log.debug("One loop took {:.2f}s".format(duration))
@@ -421,6 +436,106 @@ class SyncServerThread(threading.Thread):
                 log.warning("Unhandled except. in sync loop, stopping server",
                             exc_info=True)
 
+    def _configure_sites(self, sites_by_project):
+        """Set transfer limits of remote sites from settings of projects.
+
+        Site used by multiple projects gets the highest limits of the
+        projects, so its limits don't change with each processed project.
+        """
+        limits_by_site = {}
+        for collection, (_, site_name) in sites_by_project.items():
+            provider = self.module.get_provider_for_site(site=site_name)
+            batch_limit = lib.factory.get_provider_batch_limit(provider)
+            max_concurrency, bandwidth_limit = self.module.get_site_limits(
+                collection, site_name)
+            max_concurrency = max_concurrency or batch_limit
+
+            if site_name in limits_by_site:
+                _max_concurrency, _bandwidth_limit = (
+                    limits_by_site[site_name])
+                max_concurrency = max(max_concurrency, _max_concurrency)
+                # 0 is unlimited bandwidth
+                if not _bandwidth_limit or not bandwidth_limit:
+                    bandwidth_limit = 0
+                else:
+                    bandwidth_limit = max(bandwidth_limit, _bandwidth_limit)
+            limits_by_site[site_name] = (max_concurrency, bandwidth_limit)
+
+        for site_name, limits in limits_by_site.items():
+            max_concurrency, bandwidth_limit = limits
+            self.module.transfer_scheduler.configure_site(
+                site_name,
+                max_concurrency,
+                int(bandwidth_limit * 1024 * 1024)
+            )
+
+    def _watch_task(self, task, key, info):
+        """Collect result of transfer 'task' to be stored to DB.
+
+        Transfer stays scheduled under 'key' until its result is stored.
+        """
+        def _task_done(_task):
+            if _task.cancelled():
+                self.module.transfer_scheduler.finish(key)
+                return
+            file, representation, site, collection = info
+            error = None
+            file_id = None
+            if _task.exception() is not None:
+                error = str(_task.exception())
+            else:
+                file_id = _task.result()
+            self._results.append(
+                (collection, key,
+                 (file_id, file, representation, site, error))
+            )
+            self._results_event.set()
+
+        task.add_done_callback(_task_done)
+
+    async def store_results(self):
+        """
+            Stores results of finished transfers to DB.
+
+            Transfers finishing close to each other are stored together with
+            single bulk write per project.
+        """
+        self._results_event = asyncio.Event()
+        while self.is_running:
+            await self._results_event.wait()
+            # let other transfers finish to store them together
+            await asyncio.sleep(0.5)
+            self._results_event.clear()
+            self._store_results()
+
+    def _store_results(self):
+        """Write collected results of transfers with bulk write per project.
+
+        Progress of files in write buffer is flushed first so it does not
+        override stored results.
+        """
+        results, self._results = self._results, []
+
+        results_by_collection = {}
+        keys_by_collection = {}
+        for collection, key, result in results:
+            results_by_collection.setdefault(collection, []).append(result)
+            keys_by_collection.setdefault(collection, []).append(key)
+
+        scheduler = self.module.transfer_scheduler
+        for collection, _results in results_by_collection.items():
+            try:
+                self.module.write_buffer.flush(collection)
+                self.module.update_db_results(collection, _results)
+            except Exception:
+                log.warning("Results of {} transfers in {} were not "
+                            "stored".format(len(_results), collection),
+                            exc_info=True)
+            # status of files in DB is up to date, next loop can schedule
+            #   them again if needed
+            for key in keys_by_collection[collection]:
+                scheduler.finish(key)
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -444,7 +559,13 @@ class SyncServerThread(threading.Thread):
         log.debug(f'Finished awaiting cancelled tasks, results: {results}...')
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
+        self.module.transfer_scheduler.shutdown()
         self.executor.shutdown(wait=True)
+        # results of finished transfers not stored by cancelled
+        #   'store_results' would be transferred again on next start
+        self._store_results()
+        self.module.write_buffer.flush()
+        self.module.sync_queue.close()
         await asyncio.sleep(0.07)
         self.loop.stop()
 
@@ -1,5 +1,6 @@
 import os
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 from datetime import datetime
 import threading
 import platform
@@ -122,6 +123,13 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         self._connection = None
 
+        # pending representations of synchronized projects
+        self.sync_queue = None
+        # buffered database writes of sync server
+        self.write_buffer = None
+        # concurrency of transfers per site
+        self.transfer_scheduler = None
+
         # list of long blocking tasks
         self.long_running_tasks = deque()
         # projects that long tasks are running on
@@ -866,6 +874,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         """Actual initialization of Sync Server."""
         # import only in tray or Python3, because of Python2 hosts
         from .sync_server import SyncServerThread
+        from .sync_queue import SyncQueue
+        from .write_buffer import SyncWriteBuffer
+        from .scheduler import TransferScheduler
 
         if not self.enabled:
             return
@@ -877,6 +888,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         self.lock = threading.Lock()
 
+        self.sync_queue = SyncQueue(self)
+        self.write_buffer = SyncWriteBuffer(self)
+        self.transfer_scheduler = TransferScheduler()
         self.sync_server_thread = SyncServerThread(self)
 
     def tray_start(self):
@@ -1118,7 +1132,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, collection, active_site, remote_site):
+    def get_sync_representations(self, collection, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1135,6 +1150,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (list): check only these representations,
+                used for incremental updates of sync queue
 
         Returns:
             (list) of dictionaries
@@ -1181,6 +1198,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                 ]}
             ]
         }
+        if representation_ids is not None:
+            match["_id"] = {"$in": representation_ids}
 
         aggr = [
             {"$match": match},
@@ -1285,6 +1304,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
 
+            Progress updates are buffered when sync server is running and
+            written together once per 'progress_flush_interval'.
+
         Args:
             collection (string): name of project - force to db connection as
               each file might come from different collection
@@ -1299,6 +1321,72 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         Returns:
             None
         """
+        key, operation = self._get_update_operation(
+            new_file_id, file, representation, site,
+            error, progress, priority
+        )
+        if progress is not None and self.write_buffer is not None:
+            self.write_buffer.add_progress(collection, key, operation)
+            return
+
+        self.connection.database[collection].bulk_write([operation])
+
+        if progress is not None:
+            return
+
+        if self.sync_queue is not None:
+            self.sync_queue.mark_dirty(collection, [representation.get("_id")])
+
+        if priority is not None:
+            return
+
+        self._log_result(new_file_id, file, representation, error)
+
+    def update_db_results(self, collection, results):
+        """
+            Store results of processed files with single bulk write.
+
+        Args:
+            collection (string): name of project
+            results (list): of tuples (new_file_id, file, representation,
+                site, error) - same meaning as arguments of 'update_db'
+
+        Returns:
+            None
+        """
+        items = [
+            self._get_update_operation(
+                new_file_id, file, representation, site, error
+            )
+            for new_file_id, file, representation, site, error in results
+        ]
+        if not items:
+            return
+
+        if self.write_buffer is not None:
+            self.write_buffer.write(collection, items)
+        else:
+            self.connection.database[collection].bulk_write(
+                [operation for _, operation in items], ordered=False
+            )
+
+        if self.sync_queue is not None:
+            self.sync_queue.mark_dirty(collection, {
+                representation.get("_id")
+                for _, _, representation, _, _ in results
+            })
+
+        for new_file_id, file, representation, _, error in results:
+            self._log_result(new_file_id, file, representation, error)
+
+    def _get_update_operation(self, new_file_id, file, representation, site,
+                              error=None, progress=None, priority=None):
+        """
+            Prepare database operation for 'update_db'.
+
+        Returns:
+            (tuple): key of file site and UpdateOne operation
+        """
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1323,22 +1411,25 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
             update["$set"] = self._get_error_dict(error, tries)
 
+        if progress is None:
+            # used by sync queue to find changed representations
+            update["$currentDate"] = {"last_modified": True}
+
         arr_filter = [
             {'s.name': site}
         ]
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[collection].update_one(
+        operation = UpdateOne(
             query,
             update,
             upsert=True,
             array_filters=arr_filter
         )
+        return (representation_id, file_id, site), operation
 
-        if progress is not None or priority is not None:
-            return
-
+    def _log_result(self, new_file_id, file, representation, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1347,7 +1438,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         source_file = file.get("path", "")
         log.debug("File for {} - {source_file} process {status} {error_str}".
-                  format(representation_id,
+                  format(representation.get("_id"),
                          status=status,
                          source_file=source_file,
                          error_str=error_str))
@@ -1429,6 +1520,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if not representation:
             raise ValueError("Representation {} not found in {}".
                              format(representation_id, collection))
+
+        if self.sync_queue is not None:
+            self.sync_queue.mark_dirty(collection, [representation_id])
         if side and site_name:
             raise ValueError("Misconfiguration, only one of side and " +
                              "site_name arguments should be passed.")
@@ -1464,6 +1558,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
             Used for refactoring ugly reset_provider_for_file
         """
+        update = dict(update)
+        # used by sync queue to find changed representations
+        update["$currentDate"] = {"last_modified": True}
         self.connection.database[collection].update_one(
             query,
             update,
@@ -1680,6 +1777,54 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         ld = self.sync_project_settings[project_name]["config"]["loop_delay"]
         return int(ld)
 
+    def get_full_scan_interval(self, project_name):
+        """
+            Return count of seconds between full scans of representations
+            which should be synchronized. Changed representations are
+            checked between full scans.
+        Returns:
+            (int): in seconds, 0 means full scan in each loop
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        return int(config.get("full_scan_interval") or 0)
+
+    def get_progress_flush_interval(self, project_name):
+        """
+            Return count of seconds between writes of buffered progress of
+            transferred files to DB.
+        Returns:
+            (int): in seconds
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        interval = config.get("progress_flush_interval")
+        if not interval:
+            return self.LOG_PROGRESS_SEC
+        return int(interval)
+
+    def get_site_limits(self, project_name, site_name):
+        """
+            Return transfer limits of 'site_name' set for project.
+        Returns:
+            (int, float): max count of concurrent transfers (0 - provider
+                default) and bandwidth limit in MB/s (0 - unlimited)
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        site_limits = (config.get("site_limits") or {}).get(site_name) or {}
+        return (
+            int(site_limits.get("max_concurrency") or 0),
+            float(site_limits.get("bandwidth_limit") or 0)
+        )
+
+    def get_rate_limiter(self, site_name):
+        """
+            Return bandwidth limiter of 'site_name' used by providers.
+        Returns:
+            (RateLimiter or None)
+        """
+        if self.transfer_scheduler is None:
+            return None
+        return self.transfer_scheduler.get_rate_limiter(site_name)
+
     def show_widget(self):
         """Show dialog for Sync Queue"""
         no_errors = False
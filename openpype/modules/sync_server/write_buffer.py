@@ -0,0 +1,106 @@
+"""Python 3 only implementation."""
+import time
+import threading
+
+from pymongo.errors import PyMongoError
+
+from openpype.lib import PypeLogger
+
+
+log = PypeLogger().get_logger("SyncServer")
+
+
+class SyncWriteBuffer:
+    """Write-behind buffer of synchronization state of files.
+
+    Progress of transferred files is reported by providers from multiple
+    threads. Only last progress of each file site is kept and all buffered
+    progress updates of project are written with single bulk write once per
+    'progress_flush_interval' of project.
+
+    Results (success or error) of files processed in one loop are written
+    with single bulk write. Buffered progress of these files is dropped as
+    the result overrides it.
+
+    Args:
+        module (SyncServerModule): Module used to access database and
+            project settings.
+    """
+    def __init__(self, module):
+        self.module = module
+        # Guards buffered operations
+        self._lock = threading.Lock()
+        # Serializes writes so older progress never overrides newer state
+        self._write_lock = threading.Lock()
+        self._progress_ops = {}
+        self._last_flush = {}
+
+    def add_progress(self, collection, key, operation):
+        """Buffer progress update of file site.
+
+        Args:
+            collection (str): Name of project.
+            key (tuple): Identifier of file site, previously buffered
+                operation with same key is replaced.
+            operation (UpdateOne): Database operation.
+        """
+        now = time.time()
+        with self._lock:
+            self._progress_ops.setdefault(collection, {})[key] = operation
+            last_flush = self._last_flush.setdefault(collection, now)
+
+        interval = self.module.get_progress_flush_interval(collection)
+        if now - last_flush >= interval:
+            self.flush(collection)
+
+    def write(self, collection, items):
+        """Write results of processed files.
+
+        Args:
+            collection (str): Name of project.
+            items (list): Tuples of key of file site and operation.
+        """
+        with self._write_lock:
+            with self._lock:
+                pending = self._progress_ops.get(collection) or {}
+                for key, _ in items:
+                    pending.pop(key, None)
+
+            operations = [operation for _, operation in items]
+            if operations:
+                self.module.connection.database[collection].bulk_write(
+                    operations, ordered=False
+                )
+
+    def flush(self, collection=None):
+        """Write buffered progress of project or all projects."""
+        with self._write_lock:
+            now = time.time()
+            with self._lock:
+                if collection is None:
+                    collections = list(self._progress_ops.keys())
+                else:
+                    collections = [collection]
+
+                operations_by_collection = {}
+                for _collection in collections:
+                    self._last_flush[_collection] = now
+                    pending = self._progress_ops.pop(_collection, None)
+                    if pending:
+                        operations_by_collection[_collection] = list(
+                            pending.values()
+                        )
+
+            for _collection, operations in operations_by_collection.items():
+                try:
+                    self.module.connection.database[_collection].bulk_write(
+                        operations, ordered=False
+                    )
+                except PyMongoError:
+                    # progress is informative only, next update will follow
+                    log.warning(
+                        "Progress of {} files in {} was not stored".format(
+                            len(operations), _collection
+                        ),
+                        exc_info=True
+                    )
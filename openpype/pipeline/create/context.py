@@ -817,10 +817,10 @@ class CreateContext:
         plugins_with_defs = []
         plugins_by_targets = []
         if discover_publish_plugins:
-            discover_result = publish_plugins_discover()
+            targets = pyblish.logic.registered_targets() or ["default"]
+            discover_result = publish_plugins_discover(targets=targets)
             publish_plugins = discover_result.plugins
 
-            targets = pyblish.logic.registered_targets() or ["default"]
             plugins_by_targets = pyblish.logic.plugins_by_targets(
                 publish_plugins, targets
             )
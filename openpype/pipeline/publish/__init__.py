@@ -8,10 +8,13 @@ from .publish_plugins import (
 from .lib import (
     DiscoverResult,
     publish_plugins_discover,
+    reset_publish_plugins_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 )
 
+from .transaction import PublishTransaction
+
 
 __all__ = (
     "PublishValidationError",
@@ -21,6 +24,9 @@ __all__ = (
 
     "DiscoverResult",
     "publish_plugins_discover",
+    "reset_publish_plugins_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
+
+    "PublishTransaction",
 )
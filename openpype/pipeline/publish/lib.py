@@ -1,11 +1,16 @@
 import os
 import sys
+import json
 import types
 import inspect
+import tempfile
+import threading
 import xml.etree.ElementTree
 
 import six
+import appdirs
 import pyblish.plugin
+import pyblish.logic
 
 
 class DiscoverResult:
@@ -84,15 +89,187 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+class _PublishPluginsCache:
+    # Executed plugin files by path with key of file state
+    modules = {}
+    # Information about plugins in files persisted between processes
+    manifest = None
+    manifest_changed = False
+    lock = threading.Lock()
+
+
+def get_publish_plugins_manifest_path():
+    """Path to json file with cached manifest of publish plugin files."""
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "publish_plugins_manifest.json"
+    )
+
+
+def _get_openpype_version():
+    from openpype.version import __version__
+
+    return __version__
+
+
+def _get_plugins_manifest():
+    """Manifest of publish plugin files by their path.
+
+    Manifest is loaded only once per process and is invalidated by different
+    OpenPype version.
+    """
+    if _PublishPluginsCache.manifest is not None:
+        return _PublishPluginsCache.manifest
+
+    manifest = {}
+    manifest_path = get_publish_plugins_manifest_path()
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r") as stream:
+                data = json.load(stream)
+            if data.get("version") == _get_openpype_version():
+                manifest = data.get("files") or {}
+        except (IOError, OSError, ValueError):
+            pass
+    _PublishPluginsCache.manifest = manifest
+    return manifest
+
+
+def _save_plugins_manifest():
+    manifest_path = get_publish_plugins_manifest_path()
+    manifest_dir = os.path.dirname(manifest_path)
+    try:
+        if not os.path.exists(manifest_dir):
+            os.makedirs(manifest_dir)
+
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".json")
+        with os.fdopen(fd, "w") as stream:
+            json.dump(
+                {
+                    "version": _get_openpype_version(),
+                    "files": _PublishPluginsCache.manifest
+                },
+                stream,
+                indent=4
+            )
+        # Windows does not allow to rename to existing file
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        os.rename(tmp_path, manifest_path)
+        _PublishPluginsCache.manifest_changed = False
+
+    except (IOError, OSError):
+        pyblish.plugin.log.warning(
+            "Failed to store publish plugins manifest \"{}\"".format(
+                manifest_path
+            ),
+            exc_info=True
+        )
+
+
+def _get_file_key(filepath):
+    """Key of file state which invalidates cached module of the file."""
+    try:
+        stat_result = os.stat(filepath)
+    except OSError:
+        return None
+    return [stat_result.st_mtime, stat_result.st_size]
+
+
+def _get_module_plugins_info(module):
+    """Information about all pyblish plugins in module.
+
+    Host compatibility is not checked so manifest can be used in any host.
+    """
+    output = []
+    for name in dir(module):
+        if name.startswith("_"):
+            continue
+
+        obj = getattr(module, name)
+        if (
+            not inspect.isclass(obj)
+            or not issubclass(obj, pyblish.plugin.Plugin)
+        ):
+            continue
+
+        output.append({
+            "name": obj.__name__,
+            "order": obj.order,
+            "families": list(obj.families or []),
+            "hosts": list(obj.hosts or []),
+            "targets": list(obj.targets or []),
+            "match": obj.match
+        })
+    return output
+
+
+def _plugins_match_targets(plugins_info, targets):
+    """Any of plugins from manifest can be used with targets."""
+    if not plugins_info:
+        return True
+
+    for plugin_info in plugins_info:
+        algorithm = pyblish.logic._algorithms.get(plugin_info["match"])
+        if algorithm is None or algorithm(plugin_info["targets"], targets):
+            return True
+    return False
+
+
+def _load_plugins_module(abspath, mod_name):
+    """Module of plugin file executed only once until file changes.
+
+    Raises:
+        Exception: Any exception raised on execution of file.
+    """
+    file_key = _get_file_key(abspath)
+    cached = _PublishPluginsCache.modules.get(abspath)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+
+    module = types.ModuleType(mod_name)
+    module.__file__ = abspath
+
+    with open(abspath, "rb") as f:
+        six.exec_(f.read(), module.__dict__)
+
+    # Store reference to original module, to avoid
+    # garbage collection from collecting it's global
+    # imports, such as `import os`.
+    sys.modules[abspath] = module
+    _PublishPluginsCache.modules[abspath] = (file_key, module)
+
+    manifest = _get_plugins_manifest()
+    manifest[abspath] = {
+        "key": file_key,
+        "plugins": _get_module_plugins_info(module)
+    }
+    _PublishPluginsCache.manifest_changed = True
+    return module
+
+
+def reset_publish_plugins_cache():
+    """Force execution of plugin files on next discovery."""
+    with _PublishPluginsCache.lock:
+        _PublishPluginsCache.modules.clear()
+
+
+def publish_plugins_discover(paths=None, targets=None):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able collect crashed files
     and reason of their crash.
 
+    Plugin files are executed only once per process until they're changed.
+    Information about plugins in files is stored to manifest shared between
+    processes. When targets are passed, files with plugins that can't be
+    used with the targets are not executed if manifest of the file is valid.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        targets (list, optional): Targets of publishing. Plugins that are
+            not compatible with targets may be not discovered.
 
     """
 
@@ -109,6 +286,44 @@ def publish_plugins_discover(paths=None):
     if not paths:
         paths = pyblish.plugin.plugin_paths()
 
+    with _PublishPluginsCache.lock:
+        _discover_plugins_from_paths(
+            paths, targets, result, plugins, plugin_names
+        )
+        if _PublishPluginsCache.manifest_changed:
+            _save_plugins_manifest()
+
+    # Include plug-ins from registration.
+    # Directly registered plug-ins take precedence.
+    for plugin in pyblish.plugin.registered_plugins():
+        if not allow_duplicates and plugin.__name__ in plugin_names:
+            result.duplicated_plugins.append(plugin)
+            log.debug("Duplicate plug-in found: %s", plugin)
+            continue
+
+        plugin_names.append(plugin.__name__)
+
+        plugins[plugin.__name__] = plugin
+
+    plugins = list(plugins.values())
+    pyblish.plugin.sort(plugins)  # In-place
+
+    # In-place user-defined filter
+    for filter_ in pyblish.plugin._registered_plugin_filters:
+        filter_(plugins)
+
+    result.plugins = plugins
+
+    return result
+
+
+def _discover_plugins_from_paths(
+    paths, targets, result, plugins, plugin_names
+):
+    allow_duplicates = pyblish.plugin.ALLOW_DUPLICATES
+    log = pyblish.plugin.log
+    manifest = _get_plugins_manifest()
+
     for path in paths:
         path = os.path.normpath(path)
         if not os.path.isdir(path):
@@ -128,17 +343,27 @@ def publish_plugins_discover(paths=None):
             if not mod_ext == ".py":
                 continue
 
-            module = types.ModuleType(mod_name)
-            module.__file__ = abspath
+            # Skip files with plugins which can't be used with targets
+            file_info = manifest.get(abspath)
+            if (
+                targets
+                and abspath not in _PublishPluginsCache.modules
+                and file_info
+                and file_info.get("key") == _get_file_key(abspath)
+                and not _plugins_match_targets(
+                    file_info.get("plugins"), targets
+                )
+            ):
+                log.debug("Skipped: \"%s\" (targets)", mod_name)
+                # Names are still used for duplicates validation
+                plugin_names.extend(
+                    plugin_info["name"]
+                    for plugin_info in file_info["plugins"]
+                )
+                continue
 
             try:
-                with open(abspath, "rb") as f:
-                    six.exec_(f.read(), module.__dict__)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
+                module = _load_plugins_module(abspath, mod_name)
 
             except Exception as err:
                 result.crashed_file_paths[abspath] = sys.exc_info()
@@ -157,26 +382,3 @@ def publish_plugins_discover(paths=None):
                 plugin.__module__ = module.__file__
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
-
-    # Include plug-ins from registration.
-    # Directly registered plug-ins take precedence.
-    for plugin in pyblish.plugin.registered_plugins():
-        if not allow_duplicates and plugin.__name__ in plugin_names:
-            result.duplicated_plugins.append(plugin)
-            log.debug("Duplicate plug-in found: %s", plugin)
-            continue
-
-        plugin_names.append(plugin.__name__)
-
-        plugins[plugin.__name__] = plugin
-
-    plugins = list(plugins.values())
-    pyblish.plugin.sort(plugins)  # In-place
-
-    # In-place user-defined filter
-    for filter_ in pyblish.plugin._registered_plugin_filters:
-        filter_(plugins)
-
-    result.plugins = plugins
-
-    return result
@@ -0,0 +1,353 @@
+"""Publish runner processing instances of a plugin concurrently.
+
+Runner follows logic of 'pyblish.util.publish_iter'. Plugins are processed
+in order one by one and plugin's instances are processed sequentially
+unless the plugin has set 'concurrent_instances' class attribute to True.
+Instances of such plugin are processed in a pool of threads. Next plugin
+is processed when all instances of previous plugin are processed, so
+ordering between plugins and stop on failed validation is kept.
+
+Results have the same format as results of 'pyblish.util.publish_iter'.
+Plugin object processing an instance has its own logger so records logged
+from threads started by the plugin are also added to result of the
+instance. Plugins which start their own pool of processes should size it
+by 'cpu_budget' attribute. When the attribute is 0 it's set to a share of
+cpu cores for each concurrently processed instance.
+"""
+import os
+import time
+import logging
+import contextlib
+import threading
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import pyblish.api
+import pyblish.lib
+import pyblish.logic
+import pyblish.plugin
+
+log = logging.getLogger(__name__)
+
+PUBLISH_WORKERS_ENV = "OPENPYPE_PUBLISH_WORKERS"
+
+
+def get_publish_workers():
+    """Count of threads used to process instances of concurrent plugins.
+
+    Count can be defined with 'OPENPYPE_PUBLISH_WORKERS' environment
+    variable. Count of cpu cores is used if is not set.
+    """
+    try:
+        workers = int(os.environ.get(PUBLISH_WORKERS_ENV) or 0)
+    except ValueError:
+        workers = 0
+
+    if workers < 1:
+        workers = _get_cpu_count()
+    return workers
+
+
+def _get_cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def is_plugin_concurrent(plugin):
+    """Instances of plugin can be processed concurrently."""
+    return (
+        issubclass(plugin, pyblish.api.InstancePlugin)
+        and getattr(plugin, "concurrent_instances", False) is True
+    )
+
+
+class _InstanceRecordsHandler(logging.Handler):
+    """Collect records logged by plugin object processing an instance."""
+
+    def __init__(self, records):
+        logging.Handler.__init__(self)
+        self.records = records
+
+    def emit(self, record):
+        # Record is not collected again by '_ThreadRecordsHandler'
+        record.publish_instance_record = True
+        self.records.append(record)
+
+
+class _ThreadRecordsHandler(logging.Handler):
+    """Collect other pyblish log records of worker threads.
+
+    Records logged from worker thread processing an instance which were not
+    logged by logger of the plugin object.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self._records_by_thread = {}
+
+    def emit(self, record):
+        if (
+            record.name.startswith("pyblish")
+            and not getattr(record, "publish_instance_record", False)
+        ):
+            records = self._records_by_thread.get(record.thread)
+            if records is not None:
+                records.append(record)
+
+    @contextlib.contextmanager
+    def collect(self, records):
+        """Collect records of current thread into passed list."""
+        thread_id = threading.current_thread().ident
+        self._records_by_thread[thread_id] = records
+        try:
+            yield
+        finally:
+            self._records_by_thread.pop(thread_id, None)
+
+
+def _create_instance_logger(plugin, records):
+    """Logger of plugin object collecting records of processed instance.
+
+    Logger is not registered in logging manager. Records are propagated to
+    logger of plugin class so they are handled same way as records of
+    sequentially processed plugins.
+    """
+    instance_log = logging.Logger(plugin.log.name, logging.DEBUG)
+    instance_log.parent = plugin.log
+    instance_log.addHandler(_InstanceRecordsHandler(records))
+    return instance_log
+
+
+def _process_instance(plugin, context, instance, handler, cpu_budget):
+    """Process instance plugin in a worker thread.
+
+    Mirror of 'pyblish.plugin.process' which can't be used in threads
+    because it changes handlers and level of root logger.
+    """
+    result = {
+        "success": False,
+        "plugin": plugin,
+        "instance": instance,
+        "action": None,
+        "error": None,
+        "records": list(),
+        "duration": None,
+        "progress": 0,
+        "context": context,
+    }
+    records = result["records"]
+    plugin_obj = plugin()
+    plugin_obj.log = _create_instance_logger(plugin, records)
+    if getattr(plugin_obj, "cpu_budget", None) == 0:
+        plugin_obj.cpu_budget = cpu_budget
+
+    start = time.time()
+    try:
+        with handler.collect(records):
+            plugin_obj.process(instance)
+        result["success"] = True
+
+    except Exception as error:
+        pyblish.lib.emit(
+            "pluginFailed", plugin=plugin, context=context,
+            instance=instance, error=error
+        )
+        pyblish.lib.extract_traceback(error, plugin.__module__)
+        result["error"] = error
+        pyblish.plugin.log.exception(error.formatted_traceback)
+
+    result["duration"] = (time.time() - start) * 1000  # ms
+    context.data.setdefault("results", []).append(result)
+
+    pyblish.lib.emit("pluginProcessed", result=result)
+    return result
+
+
+def _process_instances_concurrently(
+    plugin, context, instances, pool, workers
+):
+    handler = _ThreadRecordsHandler()
+    root_logger = logging.getLogger()
+    old_level = root_logger.level
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.DEBUG)
+
+    # Share cpu cores between instances processed at the same time
+    cpu_budget = max(
+        1, _get_cpu_count() // min(workers, len(instances))
+    )
+    async_results = [
+        pool.apply_async(
+            _process_instance,
+            (plugin, context, instance, handler, cpu_budget)
+        )
+        for instance in instances
+    ]
+    try:
+        # Results are returned in order of instances
+        for async_result in async_results:
+            yield async_result.get()
+
+    finally:
+        # Wait for running instances if iteration was stopped
+        for async_result in async_results:
+            async_result.wait()
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(old_level)
+
+
+def _iter_plugin_instances(plugins, context, state, targets):
+    """Plugins with instances to process.
+
+    Same as 'pyblish.logic.Iterator' but instances of plugin are yielded
+    all at once.
+
+    Yields:
+        tuple: Plugin and list of instances. List contains only None for
+            context plugins.
+    """
+    test = pyblish.logic.registered_test()
+
+    if not targets:
+        targets = ["default"] + pyblish.logic.registered_targets()
+
+    for plugin in pyblish.logic.plugins_by_targets(plugins, targets):
+        if not plugin.active:
+            log.debug("%s was inactive, skipping.." % plugin)
+            continue
+
+        state["nextOrder"] = plugin.order
+
+        message = test(**state)
+        if message:
+            log.error("Stopped due to %s" % message)
+            return
+
+        if not plugin.__instanceEnabled__:
+            yield plugin, [None]
+            continue
+
+        instances = []
+        for instance in pyblish.logic.instances_by_plugin(context, plugin):
+            if instance.data.get("publish") is False:
+                log.debug("%s was inactive, skipping.." % instance)
+                continue
+            instances.append(instance)
+
+        if instances:
+            yield plugin, instances
+
+
+def publish_iter(context=None, plugins=None, targets=None, workers=None):
+    """Publish iterator processing instances of plugins concurrently.
+
+    Replacement of 'pyblish.util.publish_iter'. Instances of plugins with
+    'concurrent_instances' set to True are processed in a pool of threads.
+
+    Arguments:
+        context (Context, optional): Context, defaults to
+            creating a new context
+        plugins (list, optional): Plug-ins to include,
+            defaults to results of discover()
+        targets (list, optional): Targets to include for publish session.
+        workers (int, optional): Count of threads processing instances,
+            defaults to 'get_publish_workers'.
+
+    Yields:
+        dict: Result of processed plugin with instance in format of
+            'pyblish.plugin.process'.
+    """
+    context = pyblish.api.Context() if context is None else context
+    plugins = pyblish.api.discover() if plugins is None else plugins
+    if workers is None:
+        workers = get_publish_workers()
+
+    # Do not consider inactive plug-ins
+    plugins = [plugin for plugin in plugins if plugin.active]
+    collectors = [
+        plugin
+        for plugin in plugins
+        if pyblish.lib.inrange(
+            number=plugin.order, base=pyblish.api.CollectorOrder
+        )
+    ]
+
+    # Compute an approximation of all future tasks
+    task_count = len(list(
+        pyblish.logic.Iterator(plugins, context, targets=targets)
+    ))
+
+    # First pass, collection
+    tasks_processed_count = 1
+    for plugin, instance in pyblish.logic.Iterator(
+        collectors, context, targets=targets
+    ):
+        result = pyblish.plugin.process(plugin, context, instance)
+        result["progress"] = float(tasks_processed_count) / task_count
+        tasks_processed_count += 1
+        yield result
+
+    # Exclude collectors and plug-ins that do not have at
+    # least one compatible instance.
+    plugins = [
+        plugin
+        for plugin in plugins
+        if plugin not in collectors
+        and (
+            not plugin.__instanceEnabled__
+            or pyblish.logic.instances_by_plugin(context, plugin)
+        )
+    ]
+
+    # Mutable state, used in iterator
+    state = {
+        "nextOrder": None,
+        "ordersWithError": set()
+    }
+    pool = None
+    try:
+        # Second pass, the remainder
+        for plugin, instances in _iter_plugin_instances(
+            plugins, context, state, targets
+        ):
+            if (
+                workers > 1
+                and len(instances) > 1
+                and is_plugin_concurrent(plugin)
+            ):
+                if pool is None:
+                    pool = ThreadPool(workers)
+                results = _process_instances_concurrently(
+                    plugin, context, instances, pool, workers
+                )
+            else:
+                results = (
+                    pyblish.plugin.process(plugin, context, instance)
+                    for instance in instances
+                )
+
+            try:
+                for result in results:
+                    result["progress"] = (
+                        float(tasks_processed_count) / task_count
+                    )
+                    tasks_processed_count += 1
+
+                    # Make note of the order at which the
+                    # potential error error occured.
+                    if result["error"]:
+                        state["ordersWithError"].add(plugin.order)
+                        print(result["error"])
+
+                    yield result
+            finally:
+                results.close()
+
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    pyblish.api.emit("published", context=context)
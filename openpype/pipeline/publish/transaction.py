@@ -0,0 +1,662 @@
+"""Batched database writes of publishing.
+
+Integration of instances does not write documents to database directly but
+collects write operations into `PublishTransaction`. All operations are
+written with single `bulk_write` into project collection on commit. Files
+integrated with temporary suffix are renamed to final names only when
+database writes succeeded, otherwise they're removed.
+
+Write is done in database transaction if server supports it (replica set or
+sharded cluster). Otherwise operations which were applied before failed
+operation are reverted using state of documents before the transaction.
+
+Transaction also holds cache of documents queried during integration so
+lookups of assets, subsets, versions and representations for all instances
+can be prefetched with few queries.
+"""
+import os
+import re
+import sys
+import copy
+import shutil
+import logging
+import datetime
+
+import six
+from bson.objectid import ObjectId
+from pymongo import (
+    InsertOne,
+    UpdateOne,
+    ReplaceOne,
+    DeleteOne,
+    DeleteMany
+)
+from pymongo.errors import (
+    BulkWriteError,
+    ConfigurationError,
+    OperationFailure
+)
+
+log = logging.getLogger(__name__)
+
+# Error code of standalone server which can't use transactions
+TRANSACTIONS_NOT_SUPPORTED = 20
+
+
+def handle_destination_files(file_urls, mode, tmp_file_ext, logger=None):
+    """Finalize or remove integrated files.
+
+    Args:
+        file_urls (Iterable[str]): Paths to integrated files with temporary
+            suffix.
+        mode (str): 'remove' - clean files,
+            'finalize' - rename files, remove `tmp_file_ext` suffix
+        tmp_file_ext (str): Suffix of temporary files (without dot).
+        logger (logging.Logger): Logger used for messages.
+    """
+    if logger is None:
+        logger = log
+
+    for file_url in file_urls:
+        if not os.path.exists(file_url):
+            logger.debug("File {} was not found.".format(file_url))
+            continue
+
+        try:
+            if mode == "remove":
+                logger.debug("Removing file {}".format(file_url))
+                os.remove(file_url)
+
+            if mode == "finalize":
+                new_name = re.sub(
+                    r"\.{}$".format(tmp_file_ext), "", file_url
+                )
+                if os.path.exists(new_name):
+                    logger.debug("Overwriting file {} to {}".format(
+                        file_url, new_name
+                    ))
+                    shutil.copy(file_url, new_name)
+                    os.remove(file_url)
+                else:
+                    logger.debug("Renaming file {} to {}".format(
+                        file_url, new_name
+                    ))
+                    os.rename(file_url, new_name)
+        except OSError:
+            logger.error(
+                "Cannot {} file {}".format(mode, file_url), exc_info=True
+            )
+            six.reraise(*sys.exc_info())
+
+
+def _set_value_by_key(doc, key, value):
+    """Apply '$set' of dotted key to document."""
+    keys = key.split(".")
+    last_key = keys.pop(-1)
+    for subkey in keys:
+        if not isinstance(doc.get(subkey), dict):
+            doc[subkey] = {}
+        doc = doc[subkey]
+    doc[last_key] = value
+
+
+class _RevertFailed(Exception):
+    """Operations applied before failed write could not be reverted.
+
+    Holds information about the write error.
+    """
+    def __init__(self, exc_info):
+        super(_RevertFailed, self).__init__(str(exc_info[1]))
+        self.exc_info = exc_info
+
+
+class PublishTransaction(object):
+    """Collect database writes and integrated files of publishing.
+
+    Args:
+        dbcon (AvalonMongoDB): Connection to avalon database with installed
+            project. Used for queries.
+        project_name (str): Name of project where documents are written.
+        tmp_file_ext (str): Suffix of integrated temporary files.
+        logger (logging.Logger): Logger used for messages.
+    """
+
+    def __init__(self, dbcon, project_name, tmp_file_ext, logger=None):
+        self.dbcon = dbcon
+        self.project_name = project_name
+        self.tmp_file_ext = tmp_file_ext
+        self.log = logger or log
+
+        self._operations = []
+        # Ids of documents changed by operation on the same index
+        self._operation_doc_ids = []
+        self._file_urls = []
+        # Inserted representations with index of their operation
+        self._inserted_repres = []
+        # State of changed documents before transaction
+        #   - None for inserted documents
+        self._original_docs = {}
+        self._unknown_original_ids = set()
+
+        self._docs_by_id = {}
+        self._assets_by_name = {}
+        self._subset_ids = {}
+        self._version_ids = {}
+        self._prefetched_asset_names = set()
+        self._prefetched_subset_parents = set()
+        self._prefetched_version_parents = set()
+        self._prefetched_repre_parents = set()
+
+        self._group_start = None
+        self._group_backup = {}
+        self._group_file_urls = []
+
+        self._rolled_back = False
+
+    @property
+    def operations(self):
+        return list(self._operations)
+
+    @property
+    def file_urls(self):
+        return list(self._file_urls)
+
+    @property
+    def rolled_back(self):
+        """Transaction was rolled back and should not be used anymore."""
+        return self._rolled_back
+
+    def _cache_doc(self, doc):
+        doc_id = doc["_id"]
+        self._docs_by_id[doc_id] = doc
+        doc_type = doc.get("type")
+        if doc_type == "asset":
+            self._assets_by_name[doc["name"]] = doc
+        elif doc_type == "subset":
+            self._subset_ids[(doc["parent"], doc["name"])] = doc_id
+        elif doc_type == "version":
+            self._version_ids[(doc["parent"], doc["name"])] = doc_id
+
+    def _uncache_doc(self, doc_id):
+        doc = self._docs_by_id.pop(doc_id, None)
+        if doc is None:
+            return
+        doc_type = doc.get("type")
+        if doc_type == "asset":
+            self._assets_by_name.pop(doc["name"], None)
+        elif doc_type == "subset":
+            self._subset_ids.pop((doc["parent"], doc["name"]), None)
+        elif doc_type == "version":
+            self._version_ids.pop((doc["parent"], doc["name"]), None)
+
+    def _add_operation(self, operation, doc_ids):
+        for doc_id in doc_ids:
+            if (
+                doc_id in self._original_docs
+                or doc_id in self._unknown_original_ids
+            ):
+                continue
+            doc = self._docs_by_id.get(doc_id)
+            if doc is not None:
+                self._original_docs[doc_id] = copy.deepcopy(doc)
+            elif isinstance(operation, InsertOne):
+                self._original_docs[doc_id] = None
+            else:
+                # Is queried from database only if is needed
+                self._unknown_original_ids.add(doc_id)
+
+        self._operations.append(operation)
+        self._operation_doc_ids.append(doc_ids)
+
+    def _backup_doc(self, doc_id):
+        """Store state of document before first change in group."""
+        if self._group_start is None or doc_id in self._group_backup:
+            return
+        doc = self._docs_by_id.get(doc_id)
+        if doc is not None:
+            doc = copy.deepcopy(doc)
+        self._group_backup[doc_id] = doc
+
+    # --- Queries ---
+    def prefetch(
+        self, project_id, asset_names, subset_names, version_names,
+        asset_docs=None
+    ):
+        """Query documents of all integrated instances at once.
+
+        Args:
+            project_id (ObjectId): Id of project document.
+            asset_names (Iterable[str]): Names of assets to query.
+            subset_names (Iterable[str]): Names of subsets under the assets.
+            version_names (Iterable[int]): Version numbers of the subsets.
+            asset_docs (Iterable[dict]): Already queried asset documents.
+        """
+        asset_names = set(asset_names)
+        for asset_doc in asset_docs or []:
+            self._cache_doc(asset_doc)
+            asset_names.discard(asset_doc["name"])
+
+        if asset_names:
+            for asset_doc in self.dbcon.find({
+                "type": "asset",
+                "name": {"$in": list(asset_names)},
+                "parent": project_id
+            }):
+                self._cache_doc(asset_doc)
+            self._prefetched_asset_names |= asset_names
+
+        asset_ids = [doc["_id"] for doc in self._assets_by_name.values()]
+        subset_names = list(set(subset_names))
+        if not asset_ids or not subset_names:
+            return
+
+        subset_ids = []
+        for subset_doc in self.dbcon.find({
+            "type": "subset",
+            "parent": {"$in": asset_ids},
+            "name": {"$in": subset_names}
+        }):
+            self._cache_doc(subset_doc)
+            subset_ids.append(subset_doc["_id"])
+        # Subsets of these assets are fully known now
+        self._prefetched_subset_parents |= set(
+            (asset_id, subset_name)
+            for asset_id in asset_ids
+            for subset_name in subset_names
+        )
+
+        version_names = list(set(version_names))
+        if not subset_ids or not version_names:
+            return
+
+        version_ids = []
+        for version_doc in self.dbcon.find({
+            "type": "version",
+            "parent": {"$in": subset_ids},
+            "name": {"$in": version_names}
+        }):
+            self._cache_doc(version_doc)
+            version_ids.append(version_doc["_id"])
+        self._prefetched_version_parents |= set(
+            (subset_id, version_name)
+            for subset_id in subset_ids
+            for version_name in version_names
+        )
+
+        if not version_ids:
+            return
+
+        for repre_doc in self.dbcon.find({
+            "type": {"$in": ["representation", "archived_representation"]},
+            "parent": {"$in": version_ids}
+        }):
+            self._cache_doc(repre_doc)
+        self._prefetched_repre_parents |= set(version_ids)
+
+    def get_document(self, doc_id):
+        """Document by id from cache or from database."""
+        doc = self._docs_by_id.get(doc_id)
+        if doc is None:
+            doc = self.dbcon.find_one({"_id": doc_id})
+            if doc is not None:
+                self._cache_doc(doc)
+        return doc
+
+    def get_asset(self, project_id, asset_name):
+        asset_doc = self._assets_by_name.get(asset_name)
+        if (
+            asset_doc is None
+            and asset_name not in self._prefetched_asset_names
+        ):
+            asset_doc = self.dbcon.find_one({
+                "type": "asset",
+                "name": asset_name,
+                "parent": project_id
+            })
+            if asset_doc is not None:
+                self._cache_doc(asset_doc)
+        return asset_doc
+
+    def get_subset(self, asset_id, subset_name):
+        key = (asset_id, subset_name)
+        subset_id = self._subset_ids.get(key)
+        if subset_id is not None:
+            return self._docs_by_id[subset_id]
+
+        if key in self._prefetched_subset_parents:
+            return None
+
+        subset_doc = self.dbcon.find_one({
+            "type": "subset",
+            "parent": asset_id,
+            "name": subset_name
+        })
+        if subset_doc is not None:
+            self._cache_doc(subset_doc)
+        return subset_doc
+
+    def get_version(self, subset_id, version_name):
+        key = (subset_id, version_name)
+        version_id = self._version_ids.get(key)
+        if version_id is not None:
+            return self._docs_by_id[version_id]
+
+        if key in self._prefetched_version_parents:
+            return None
+
+        version_doc = self.dbcon.find_one({
+            "type": "version",
+            "parent": subset_id,
+            "name": version_name
+        })
+        if version_doc is not None:
+            self._cache_doc(version_doc)
+        return version_doc
+
+    def get_representations(self, version_id, repre_type="representation"):
+        if version_id not in self._prefetched_repre_parents:
+            for repre_doc in self.dbcon.find({
+                "type": {"$in": [
+                    "representation", "archived_representation"
+                ]},
+                "parent": version_id
+            }):
+                # Do not override documents changed in transaction
+                if repre_doc["_id"] not in self._docs_by_id:
+                    self._cache_doc(repre_doc)
+            self._prefetched_repre_parents.add(version_id)
+
+        return [
+            doc
+            for doc in self._docs_by_id.values()
+            if doc.get("parent") == version_id
+            and doc.get("type") == repre_type
+        ]
+
+    # --- Writes ---
+    def insert_one(self, doc):
+        """Add insert of document.
+
+        Document gets new id if does not have any.
+
+        Returns:
+            ObjectId: Id of inserted document.
+        """
+        doc = copy.deepcopy(doc)
+        if "_id" not in doc:
+            doc["_id"] = ObjectId()
+        self._backup_doc(doc["_id"])
+        if doc.get("type") == "representation":
+            self._inserted_repres.append((len(self._operations), doc))
+        self._add_operation(InsertOne(doc), [doc["_id"]])
+        self._cache_doc(doc)
+        return doc["_id"]
+
+    def insert_many(self, docs):
+        return [self.insert_one(doc) for doc in docs]
+
+    def update_one(self, doc_id, update_data):
+        """Add '$set' update of document.
+
+        Args:
+            doc_id (ObjectId): Id of updated document.
+            update_data (dict): Values to set by (dotted) keys.
+        """
+        self._backup_doc(doc_id)
+        self._add_operation(
+            UpdateOne({"_id": doc_id}, {"$set": update_data}), [doc_id]
+        )
+        doc = self._docs_by_id.get(doc_id)
+        if doc is not None:
+            for key, value in update_data.items():
+                _set_value_by_key(doc, key, copy.deepcopy(value))
+            # Keep lookup keys in sync with changed document
+            self._cache_doc(doc)
+
+    def delete_one(self, doc_id):
+        self._backup_doc(doc_id)
+        self._add_operation(DeleteOne({"_id": doc_id}), [doc_id])
+        self._uncache_doc(doc_id)
+
+    def delete_many(self, doc_ids):
+        doc_ids = list(doc_ids)
+        if not doc_ids:
+            return
+        for doc_id in doc_ids:
+            self._backup_doc(doc_id)
+        self._add_operation(DeleteMany({"_id": {"$in": doc_ids}}), doc_ids)
+        for doc_id in doc_ids:
+            self._uncache_doc(doc_id)
+
+    def add_files(self, file_urls):
+        """Integrated temporary files finalized on commit."""
+        for file_url in file_urls:
+            if file_url not in self._file_urls:
+                self._file_urls.append(file_url)
+                self._group_file_urls.append(file_url)
+
+    # --- Groups ---
+    def start_group(self):
+        """Start group of operations which can be discarded together.
+
+        Used to discard operations of single instance which failed.
+        """
+        self._group_start = len(self._operations)
+        self._group_backup = {}
+        self._group_file_urls = []
+
+    def discard_group(self):
+        """Discard operations and files added since `start_group`."""
+        if self._group_start is None:
+            return
+
+        self._operations = self._operations[:self._group_start]
+        self._operation_doc_ids = (
+            self._operation_doc_ids[:self._group_start]
+        )
+        self._inserted_repres = [
+            item
+            for item in self._inserted_repres
+            if item[0] < self._group_start
+        ]
+        for file_url in self._group_file_urls:
+            self._file_urls.remove(file_url)
+
+        # Restore cached documents changed by discarded operations
+        for doc_id, doc in self._group_backup.items():
+            self._uncache_doc(doc_id)
+            if doc is not None:
+                self._cache_doc(doc)
+
+        self._group_start = None
+        self._group_backup = {}
+        self._group_file_urls = []
+
+    # --- Commit ---
+    def _get_collection(self):
+        database = getattr(self.dbcon, "database", None)
+        if database is None:
+            # 'avalon.io' has database only as private attribute
+            database = self.dbcon._database
+        return database[self.project_name]
+
+    def _write_in_transaction(self, collection, operations):
+        """Write operations in database transaction.
+
+        Returns:
+            bool: Operations were written. False if server does not support
+                transactions and nothing was written.
+        """
+        def write(session):
+            collection.bulk_write(operations, ordered=True, session=session)
+
+        try:
+            with collection.database.client.start_session() as session:
+                session.with_transaction(write)
+
+        except ConfigurationError:
+            return False
+
+        except OperationFailure as exc:
+            if exc.code != TRANSACTIONS_NOT_SUPPORTED:
+                raise
+            return False
+        return True
+
+    def _get_original_docs(self, collection):
+        """State of changed documents before any operation is written."""
+        original_docs = dict(self._original_docs)
+        unknown_ids = [
+            doc_id
+            for doc_id in self._unknown_original_ids
+            if doc_id not in original_docs
+        ]
+        if unknown_ids:
+            for doc in collection.find({"_id": {"$in": unknown_ids}}):
+                original_docs[doc["_id"]] = doc
+        return original_docs
+
+    def _revert(self, collection, doc_ids, original_docs):
+        """Restore state of documents before transaction."""
+        operations = []
+        for doc_id in doc_ids:
+            doc = original_docs.get(doc_id)
+            if doc is None:
+                operations.append(DeleteOne({"_id": doc_id}))
+            else:
+                operations.append(
+                    ReplaceOne({"_id": doc_id}, doc, upsert=True)
+                )
+
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+
+    def _write(self, collection, operations, operation_doc_ids):
+        if self._write_in_transaction(collection, operations):
+            return
+
+        self.log.debug((
+            "Database does not support transactions."
+            " Applied operations will be reverted on failure."
+        ))
+        original_docs = self._get_original_docs(collection)
+        try:
+            collection.bulk_write(operations, ordered=True)
+
+        except BulkWriteError as exc:
+            write_exc_info = sys.exc_info()
+            # Ordered write stops on first failed operation
+            write_errors = exc.details.get("writeErrors")
+            applied_count = len(operations)
+            if write_errors:
+                applied_count = write_errors[0]["index"]
+
+            doc_ids = []
+            for operation_ids in operation_doc_ids[:applied_count]:
+                for doc_id in operation_ids:
+                    if doc_id not in doc_ids:
+                        doc_ids.append(doc_id)
+
+            self.log.warning((
+                "Reverting {} of {} applied operations"
+                " (inserted {}, modified {}, removed {})."
+            ).format(
+                applied_count,
+                len(operations),
+                exc.details.get("nInserted"),
+                exc.details.get("nModified"),
+                exc.details.get("nRemoved")
+            ))
+            try:
+                self._revert(collection, doc_ids, original_docs)
+            except Exception:
+                self.log.critical(
+                    "Failed to revert applied operations", exc_info=True
+                )
+                raise _RevertFailed(write_exc_info)
+            six.reraise(*write_exc_info)
+
+    def commit(self):
+        """Write all operations and finalize integrated files.
+
+        Integrated files are removed if database write failed. If database
+        does not support transactions and applied operations can't be
+        reverted, files are finalized to keep written documents valid.
+        """
+        operations = self._operations
+        operation_doc_ids = self._operation_doc_ids
+        file_urls = self._file_urls
+        inserted_repres = self._inserted_repres
+        self._operations = []
+        self._operation_doc_ids = []
+        self._file_urls = []
+        self._inserted_repres = []
+        self._group_start = None
+        self._group_backup = {}
+
+        # Sync server finds representations by time of their write
+        now = datetime.datetime.utcnow()
+        for _, repre_doc in inserted_repres:
+            repre_doc["last_modified"] = now
+
+        try:
+            if operations:
+                self.log.debug(
+                    "Writing {} operations to project \"{}\"".format(
+                        len(operations), self.project_name
+                    )
+                )
+                self._write(
+                    self._get_collection(), operations, operation_doc_ids
+                )
+
+        except _RevertFailed as exc:
+            self.log.critical(
+                "Error when writing to database", exc_info=exc.exc_info
+            )
+            handle_destination_files(
+                file_urls, "finalize", self.tmp_file_ext, self.log
+            )
+            six.reraise(*exc.exc_info)
+
+        except Exception:
+            self.log.critical(
+                "Error when writing to database", exc_info=True
+            )
+            handle_destination_files(
+                file_urls, "remove", self.tmp_file_ext, self.log
+            )
+            six.reraise(*sys.exc_info())
+
+        finally:
+            self._original_docs = {}
+            self._unknown_original_ids = set()
+
+        handle_destination_files(
+            file_urls, "finalize", self.tmp_file_ext, self.log
+        )
+
+    def rollback(self):
+        """Discard all operations and remove integrated files.
+
+        Already committed operations and files are not affected.
+        """
+        file_urls = self._file_urls
+        if self._operations or file_urls:
+            self.log.info((
+                "Rolling back {} database operations and {} files."
+            ).format(len(self._operations), len(file_urls)))
+
+        self._operations = []
+        self._operation_doc_ids = []
+        self._file_urls = []
+        self._inserted_repres = []
+        self._original_docs = {}
+        self._unknown_original_ids = set()
+        self._group_start = None
+        self._group_backup = {}
+        self._group_file_urls = []
+        self._rolled_back = True
+        handle_destination_files(
+            file_urls, "remove", self.tmp_file_ext, self.log
+        )
@@ -1,5 +1,4 @@
 import os
-import re
 import json
 import copy
 import tempfile
@@ -14,10 +13,14 @@ import openpype
 import openpype.api
 from openpype.lib import (
     run_openpype_process,
+    get_ffprobe_data,
 
     get_transcode_temp_directory,
     convert_for_ffmpeg,
     should_convert_for_ffmpeg,
+    get_sequence_gaps,
+    link_sequence_gaps,
+    filter_profiles,
 
     CREATE_NO_WINDOW
 )
@@ -71,6 +74,8 @@ class ExtractBurnin(openpype.api.Extractor):
     # Preset attributes
     profiles = None
     options = None
+    # Instances are independent and can be processed concurrently
+    concurrent_instances = True
 
     def process(self, instance):
         # QUESTION what is this for and should we raise an exception?
@@ -191,8 +196,15 @@ class ExtractBurnin(openpype.api.Extractor):
                 filename = repre_files
 
             first_input_path = os.path.join(src_repre_staging_dir, filename)
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
+            # Review is encoded together with burnins
+            #   - input is source of review which doesn't need conversion
+            review_encode = repre.get("review_encode")
+            if review_encode:
+                do_convert = False
+            else:
+                # Determine if representation requires pre conversion for
+                #   ffmpeg
+                do_convert = should_convert_for_ffmpeg(first_input_path)
             # If result is None the requirement of conversion can't be
             #   determined
             if do_convert is None:
@@ -236,6 +248,7 @@ class ExtractBurnin(openpype.api.Extractor):
             files_to_delete = []
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
+                new_repre.pop("review_encode", None)
                 new_repre["stagingDir"] = src_repre_staging_dir
 
                 # Keep "ftrackreview" tag only on first output
@@ -271,6 +284,11 @@ class ExtractBurnin(openpype.api.Extractor):
                     repre, new_repre, temp_data, filename_suffix
                 )
 
+                # Fill missing frames of input sequence
+                files_to_delete.extend(link_sequence_gaps(
+                    repre["stagingDir"], temp_data["sequence_gaps"], self.log
+                ))
+
                 # Data for burnin script
                 script_data = {
                     "input": temp_data["full_input_path"],
@@ -280,8 +298,14 @@ class ExtractBurnin(openpype.api.Extractor):
                     "values": burnin_values,
                     "full_input_path": temp_data["full_input_paths"][0],
                     "first_frame": temp_data["first_frame"],
-                    "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
+                    "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", ""),
+                    "review_encode": review_encode
                 }
+                if not review_encode:
+                    # Probe in this process to use cached data
+                    script_data["ffprobe_data"] = get_ffprobe_data(
+                        temp_data["full_input_paths"][0], self.log
+                    )
 
                 self.log.debug(
                     "script_data: {}".format(json.dumps(script_data, indent=4))
@@ -551,7 +575,7 @@ class ExtractBurnin(openpype.api.Extractor):
         "full_output_path" full path to otput with optionally with sequence
         formatting, "full_input_paths" list of all source files which will be
         deleted when burnin script ends, "repre_files" list of output
-        filenames.
+        filenames and "sequence_gaps" missing frames of input sequence.
 
         Args:
             new_repre (dict): Currently processed new representation.
@@ -571,6 +595,7 @@ class ExtractBurnin(openpype.api.Extractor):
         # Sequence must have defined first frame
         # - not used if input is not a sequence
         first_frame = None
+        sequence_gaps = {}
         if is_sequence:
             collections, _ = clique.assemble(input_filenames)
             if not collections:
@@ -579,6 +604,13 @@ class ExtractBurnin(openpype.api.Extractor):
                 input_filename = new_repre["sequence_file"]
                 collection = collections[0]
                 indexes = list(collection.indexes)
+                if len(collections) == 1:
+                    sequence_gaps = get_sequence_gaps(
+                        input_filenames, min(indexes), max(indexes)
+                    )
+                # Missing frames are filled before burnin script is called
+                if sequence_gaps:
+                    indexes = list(range(min(indexes), max(indexes) + 1))
                 padding = len(str(max(indexes)))
                 head = collection.format("{head}")
                 tail = collection.format("{tail}")
@@ -616,6 +648,7 @@ class ExtractBurnin(openpype.api.Extractor):
         temp_data["full_input_path"] = full_input_path
         temp_data["full_output_path"] = full_output_path
         temp_data["first_frame"] = first_frame
+        temp_data["sequence_gaps"] = sequence_gaps
 
         new_repre["files"] = repre_files
 
@@ -696,7 +729,6 @@ class ExtractBurnin(openpype.api.Extractor):
         If key is not find or is empty than it's expected to match.
 
         Args:
-            profiles (list): Profiles definition from presets.
             host_name (str): Current running host name.
             task_name (str): Current context task name.
             family (str): Main family of current Instance.
@@ -705,113 +737,16 @@ class ExtractBurnin(openpype.api.Extractor):
             dict/None: Return most matching profile or None if none of profiles
                 match at least one criteria.
         """
-
-        matching_profiles = None
-        highest_points = -1
-        for profile in self.profiles or tuple():
-            profile_points = 0
-            profile_value = []
-
-            # Host filtering
-            host_names = profile.get("hosts")
-            match = self.validate_value_by_regexes(host_name, host_names)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Task filtering
-            task_names = profile.get("tasks")
-            match = self.validate_value_by_regexes(task_name, task_names)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Family filtering
-            families = profile.get("families")
-            match = self.validate_value_by_regexes(family, families)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            if profile_points > highest_points:
-                matching_profiles = []
-                highest_points = profile_points
-
-            if profile_points == highest_points:
-                profile["__value__"] = profile_value
-                matching_profiles.append(profile)
-
-        if not matching_profiles:
-            return
-
-        if len(matching_profiles) == 1:
-            return matching_profiles[0]
-
-        return self.profile_exclusion(matching_profiles)
-
-    def profile_exclusion(self, matching_profiles):
-        """Find out most matching profile by host, task and family match.
-
-        Profiles are selectivelly filtered. Each profile should have
-        "__value__" key with list of booleans. Each boolean represents
-        existence of filter for specific key (host, taks, family).
-        Profiles are looped in sequence. In each sequence are split into
-        true_list and false_list. For next sequence loop are used profiles in
-        true_list if there are any profiles else false_list is used.
-
-        Filtering ends when only one profile left in true_list. Or when all
-        existence booleans loops passed, in that case first profile from left
-        profiles is returned.
-
-        Args:
-            matching_profiles (list): Profiles with same values.
-
-        Returns:
-            dict: Most matching profile.
-        """
-        self.log.info(
-            "Search for first most matching profile in match order:"
-            " Host name -> Task name -> Family."
+        return filter_profiles(
+            self.profiles,
+            {
+                "hosts": host_name,
+                "tasks": task_name,
+                "families": family
+            },
+            keys_order=["hosts", "tasks", "families"],
+            logger=self.log
         )
-        # Filter all profiles with highest points value. First filter profiles
-        # with matching host if there are any then filter profiles by task
-        # name if there are any and lastly filter by family. Else use first in
-        # list.
-        idx = 0
-        final_profile = None
-        while True:
-            profiles_true = []
-            profiles_false = []
-            for profile in matching_profiles:
-                value = profile["__value__"]
-                # Just use first profile when idx is greater than values.
-                if not idx < len(value):
-                    final_profile = profile
-                    break
-
-                if value[idx]:
-                    profiles_true.append(profile)
-                else:
-                    profiles_false.append(profile)
-
-            if final_profile is not None:
-                break
-
-            if profiles_true:
-                matching_profiles = profiles_true
-            else:
-                matching_profiles = profiles_false
-
-            if len(matching_profiles) == 1:
-                final_profile = matching_profiles[0]
-                break
-            idx += 1
-
-        final_profile.pop("__value__")
-        return final_profile
 
     def filter_burnins_defs(self, profile, instance):
         """Filter outputs by their values from settings.
@@ -905,49 +840,6 @@ class ExtractBurnin(openpype.api.Extractor):
                 return True
         return False
 
-    def compile_list_of_regexes(self, in_list):
-        """Convert strings in entered list to compiled regex objects."""
-        regexes = []
-        if not in_list:
-            return regexes
-
-        for item in in_list:
-            if not item:
-                continue
-
-            try:
-                regexes.append(re.compile(item))
-            except TypeError:
-                self.log.warning((
-                    "Invalid type \"{}\" value \"{}\"."
-                    " Expected string based object. Skipping."
-                ).format(str(type(item)), str(item)))
-
-        return regexes
-
-    def validate_value_by_regexes(self, value, in_list):
-        """Validate in any regexe from list match entered value.
-
-        Args:
-            in_list (list): List with regexes.
-            value (str): String where regexes is checked.
-
-        Returns:
-            int: Returns `0` when list is not set or is empty. Returns `1` when
-                any regex match value and returns `-1` when none of regexes
-                match value entered.
-        """
-        if not in_list:
-            return 0
-
-        output = -1
-        regexes = self.compile_list_of_regexes(in_list)
-        for regex in regexes:
-            if re.match(regex, value):
-                output = 1
-                break
-        return output
-
     def main_family_from_instance(self, instance):
         """Return main family of entered instance."""
         family = instance.data.get("family")
@@ -3,6 +3,8 @@ import re
 import copy
 import json
 import shutil
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 from abc import ABCMeta, abstractmethod
 import six
@@ -19,9 +21,11 @@ from openpype.lib import (
 
     should_convert_for_ffmpeg,
     convert_for_ffmpeg,
-    get_transcode_temp_directory
+    get_transcode_temp_directory,
+    get_sequence_gaps,
+    link_sequence_gaps,
+    filter_profiles
 )
-import speedcopy
 
 
 class ExtractReview(pyblish.api.InstancePlugin):
@@ -66,6 +70,14 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Outputs with same input are encoded by single ffmpeg process
+    shared_decode = True
+    # Max count of parallel ffmpeg processes, all cores are used if is 0
+    cpu_budget = 0
+    # Outputs with burnins are encoded together with burnins by ExtractBurnin
+    fuse_burnins = False
+    # Instances are independent and can be processed concurrently
+    concurrent_instances = True
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -238,9 +250,20 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     new_staging_dir,
                     frame_start,
                     frame_end,
-                    self.log
+                    self.log,
+                    max_workers=self.cpu_budget or None
                 )
 
+            files_to_clean = []
+            if self.input_is_sequence(repre):
+                self.log.info("Filling gaps in sequence.")
+                files_to_clean = self.fill_sequence_gaps(
+                    repre["files"],
+                    repre["stagingDir"],
+                    instance.data["frameStart"],
+                    instance.data["frameEnd"])
+
+            output_jobs = []
             for _output_def in outputs:
                 output_def = copy.deepcopy(_output_def)
                 # Make sure output definition has "tags" key
@@ -284,14 +307,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
                 temp_data = self.prepare_temp_data(
                     instance, repre, output_def)
-                files_to_clean = []
-                if temp_data["input_is_sequence"]:
-                    self.log.info("Filling gaps in sequence.")
-                    files_to_clean = self.fill_sequence_gaps(
-                        temp_data["origin_repre"]["files"],
-                        new_repre["stagingDir"],
-                        temp_data["frame_start"],
-                        temp_data["frame_end"])
 
                 # create or update outputName
                 output_name = new_repre.get("outputName", "")
@@ -309,29 +324,66 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 })
 
                 try:  # temporary until oiiotool is supported cross platform
-                    ffmpeg_args = self._ffmpeg_arguments(
+                    ffmpeg_args_parts = self._ffmpeg_argument_parts(
                         output_def, instance, new_repre, temp_data, fill_data
                     )
                 except ZeroDivisionError:
                     if 'exr' in temp_data["origin_repre"]["ext"]:
                         self.log.debug("Unsupported compression on input " +
                                        "files. Skipping!!!")
+                        for f in files_to_clean:
+                            os.unlink(f)
                         return
                     raise NotImplementedError
 
-                subprcs_cmd = " ".join(ffmpeg_args)
-
-                # run subprocess
-                self.log.debug("Executing: {}".format(subprcs_cmd))
-
-                openpype.api.run_subprocess(
-                    subprcs_cmd, shell=True, logger=self.log
+                input_args, video_filters, audio_filters, output_args = (
+                    ffmpeg_args_parts
                 )
+                subprcs_cmd = " ".join(self.ffmpeg_full_args(
+                    input_args, video_filters, audio_filters, output_args
+                ))
 
-                # delete files added to fill gaps
-                if files_to_clean:
-                    for f in files_to_clean:
-                        os.unlink(f)
+                audio_inputs = 0
+                if (
+                    not temp_data["output_ext_is_image"]
+                    and temp_data["with_audio"]
+                ):
+                    audio_inputs = len(instance.data["audio"])
+
+                # Encoding is left to ExtractBurnin which adds burnin
+                #   filters to the same ffmpeg process
+                #   - converted input and gap links are removed at the end
+                #       of this plugin so they must be encoded here
+                if (
+                    not do_convert
+                    and not files_to_clean
+                    and self._can_fuse_burnins(instance, new_repre, temp_data)
+                ):
+                    self.log.debug((
+                        "Output \"{}\" will be encoded with burnins."
+                    ).format(output_name))
+                    new_repre["review_encode"] = {
+                        "input_args": input_args,
+                        "video_filters": video_filters,
+                        "audio_filters": audio_filters,
+                        # Output path is defined by ExtractBurnin
+                        "output_args": [
+                            arg for arg in output_args[:-1] if arg != "-y"
+                        ],
+                        "width": new_repre["resolutionWidth"],
+                        "height": new_repre["resolutionHeight"],
+                        "fps": temp_data["fps"]
+                    }
+
+                output_jobs.append({
+                    "new_repre": new_repre,
+                    "ffmpeg_cmd": subprcs_cmd,
+                    "input_args": input_args,
+                    "video_filters": video_filters,
+                    "audio_filters": audio_filters,
+                    "output_args": output_args,
+                    "audio_inputs": audio_inputs
+                })
 
                 new_repre.update({
                     "name": "{}_{}".format(output_name, output_ext),
@@ -348,6 +400,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 if "clean_name" in new_repre.get("tags", []):
                     new_repre.pop("outputName")
 
+            try:
+                self.run_output_jobs(output_jobs)
+
+            finally:
+                # delete files added to fill gaps
+                for f in files_to_clean:
+                    os.unlink(f)
+
+            for output_job in output_jobs:
+                new_repre = output_job["new_repre"]
                 # adding representation
                 self.log.debug(
                     "Adding new representation: {}".format(new_repre)
@@ -362,6 +424,164 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 #   value
                 repre["stagingDir"] = src_repre_staging_dir
 
+    def run_output_jobs(self, output_jobs):
+        """Run ffmpeg for prepared outputs of one representation.
+
+        Outputs which can share input (same input arguments) are encoded by
+        single ffmpeg process when `shared_decode` is enabled. Input is then
+        decoded only once and `split` filter feeds encoders of all outputs.
+        Processes run in parallel, their count is limited by `cpu_budget`.
+
+        Args:
+            output_jobs (list): Prepared ffmpeg arguments of outputs.
+        """
+        commands = []
+        groups = {}
+        group_keys = []
+        for output_job in output_jobs:
+            # Encoded by ExtractBurnin
+            if "review_encode" in output_job["new_repre"]:
+                continue
+
+            if not self.shared_decode or not self._can_share_decode(
+                output_job
+            ):
+                commands.append(output_job["ffmpeg_cmd"])
+                continue
+
+            key = tuple(output_job["input_args"])
+            if key not in groups:
+                groups[key] = []
+                group_keys.append(key)
+            groups[key].append(output_job)
+
+        for key in group_keys:
+            group = groups[key]
+            if len(group) == 1:
+                commands.append(group[0]["ffmpeg_cmd"])
+            else:
+                commands.append(" ".join(self.shared_decode_args(group)))
+
+        if not commands:
+            return
+
+        cpu_budget = self.cpu_budget
+        if not cpu_budget:
+            try:
+                cpu_budget = multiprocessing.cpu_count()
+            except NotImplementedError:
+                cpu_budget = 1
+
+        processes = min(len(commands), cpu_budget)
+        if processes < 2:
+            for command in commands:
+                self._run_ffmpeg(command)
+            return
+
+        pool = ThreadPool(processes)
+        try:
+            pool.map(self._run_ffmpeg, commands)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _can_fuse_burnins(self, instance, new_repre, temp_data):
+        """Output can be encoded together with burnins by ExtractBurnin."""
+        if (
+            not self.fuse_burnins
+            or "burnin" not in new_repre["tags"]
+            or temp_data["output_ext_is_image"]
+            or "resolutionWidth" not in new_repre
+        ):
+            return False
+
+        project_settings = instance.context.data.get("project_settings")
+        burnin_settings = (
+            (project_settings or {})
+            .get("global", {})
+            .get("publish", {})
+            .get("ExtractBurnin", {})
+        )
+        return bool(burnin_settings.get("enabled"))
+
+    def _run_ffmpeg(self, subprcs_cmd):
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        openpype.api.run_subprocess(
+            subprcs_cmd, shell=True, logger=self.log
+        )
+
+    def _can_share_decode(self, output_job):
+        """Output can be part of filter graph shared with other outputs."""
+        # Merging of multiple audio inputs uses its own filter graph
+        if output_job["audio_inputs"] > 1:
+            return False
+
+        for arg in output_job["output_args"]:
+            if arg.split(" ")[0] in (
+                "-filter_complex", "-filter_complex_script", "-lavfi", "-map"
+            ):
+                return False
+
+        # Labels of filters would collide in shared filter graph
+        for video_filter in output_job["video_filters"]:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+
+        input_count = len([
+            arg
+            for arg in output_job["input_args"]
+            if arg.startswith("-i ")
+        ])
+        return input_count == 1 + output_job["audio_inputs"]
+
+    def shared_decode_args(self, output_jobs):
+        """Arguments of single ffmpeg process encoding multiple outputs.
+
+        Decoded video input is split to each output and video filters of
+        output are applied to its branch of filter graph.
+
+        Args:
+            output_jobs (list): Outputs with same input arguments.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        split_labels = [
+            "[in{}]".format(idx)
+            for idx in range(len(output_jobs))
+        ]
+        filter_graph = ["[0:v]split={}{}".format(
+            len(output_jobs), "".join(split_labels)
+        )]
+        output_args = []
+        for idx, output_job in enumerate(output_jobs):
+            output_label = "[out{}]".format(idx)
+            filter_graph.append("{}{}{}".format(
+                split_labels[idx],
+                ",".join(output_job["video_filters"]) or "null",
+                output_label
+            ))
+            output_args.append("-map \"{}\"".format(output_label))
+            if output_job["audio_inputs"]:
+                output_args.append("-map 1:a")
+
+            if output_job["audio_filters"]:
+                output_args.append("-filter:a")
+                output_args.append("\"{}\"".format(
+                    ",".join(output_job["audio_filters"])
+                ))
+            output_args.extend(output_job["output_args"])
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(output_jobs[0]["input_args"])
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
+        all_args.extend(output_args)
+        return all_args
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -460,6 +680,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
     ):
         """Prepares ffmpeg arguments for expected extraction.
 
+        Args:
+            output_def (dict): Currently processed output definition.
+            instance (Instance): Currently processed instance.
+            new_repre (dict): Representation representing output of this
+                process.
+            temp_data (dict): Base data for successful process.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _ffmpeg_argument_parts(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepares ffmpeg arguments for expected extraction.
+
         Prepares input and output arguments based on output definition and
         input files.
 
@@ -469,6 +708,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             new_repre (dict): Representation representing output of this
                 process.
             temp_data (dict): Base data for successful process.
+
+        Returns:
+            tuple: Input arguments, video filters, audio filters and output
+                arguments.
         """
 
         # Get FFmpeg arguments from profile presets
@@ -640,7 +883,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self.move_filters_from_output_args(
+            ffmpeg_video_filters, ffmpeg_audio_filters, ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -688,6 +934,40 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self.move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments.
+
+        Args:
+            video_filters (list): Video filters where found video filters
+                are added.
+            audio_filters (list): Audio filters where found audio filters
+                are added.
+            output_args (list): Output arguments.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -704,29 +984,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
-
-        all_args = []
-        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
-        """Fill missing files in sequence by duplicating existing ones.
+        """Fill missing files in sequence by links to existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        Missing frame is filled with nearest previous existing frame. Files
+        are not copied, created files are hardlinks (or symlinks) to
+        existing files.
 
         Args:
             files (list): List of representation files.
@@ -742,68 +1008,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
             AssertionError: if more then one collection is obtained.
 
         """
-        start_frame = int(start_frame)
-        end_frame = int(end_frame)
-        collections = clique.assemble(files)[0]
-        assert len(collections) == 1, "Multiple collections found."
-        col = collections[0]
-        # do nothing if sequence is complete
-        if list(col.indexes)[0] == start_frame and \
-                list(col.indexes)[-1] == end_frame and \
-                col.is_contiguous():
-            return []
-
-        holes = col.holes()
-
-        # generate ideal sequence
-        complete_col = clique.assemble(
-            [("{}{:0" + str(col.padding) + "d}{}").format(
-                col.head, f, col.tail
-            ) for f in range(start_frame, end_frame)]
-        )[0][0]  # type: clique.Collection
-
-        new_files = {}
-        last_existing_file = None
-
-        for idx in holes.indexes:
-            # get previous existing file
-            test_file = os.path.normpath(os.path.join(
-                staging_dir,
-                ("{}{:0" + str(complete_col.padding) + "d}{}").format(
-                    complete_col.head, idx - 1, complete_col.tail)))
-            if os.path.isfile(test_file):
-                new_files[idx] = test_file
-                last_existing_file = test_file
-            else:
-                if not last_existing_file:
-                    # previous file is not found (sequence has a hole
-                    # at the beginning. Use first available frame
-                    # there is.
-                    try:
-                        last_existing_file = list(col)[0]
-                    except IndexError:
-                        # empty collection?
-                        raise AssertionError(
-                            "Invalid sequence collected")
-                new_files[idx] = os.path.normpath(
-                    os.path.join(staging_dir, last_existing_file))
-
-        files_to_clean = []
-        if new_files:
-            # so now new files are dict with missing frame as a key and
-            # existing file as a value.
-            for frame, file in new_files.items():
-                self.log.info(
-                    "Filling gap {} with {}".format(frame, file))
-
-                hole = os.path.join(
-                    staging_dir,
-                    ("{}{:0" + str(col.padding) + "d}{}").format(
-                        col.head, frame, col.tail))
-                speedcopy.copyfile(file, hole)
-                files_to_clean.append(hole)
-
-        return files_to_clean
+        try:
+            gaps = get_sequence_gaps(files, start_frame, end_frame)
+        except ValueError:
+            raise AssertionError("Multiple collections found.")
+        return link_sequence_gaps(staging_dir, gaps, self.log)
 
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
@@ -1419,110 +1628,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 families.append(family)
         return families
 
-    def compile_list_of_regexes(self, in_list):
-        """Convert strings in entered list to compiled regex objects."""
-        regexes = []
-        if not in_list:
-            return regexes
-
-        for item in in_list:
-            if not item:
-                continue
-
-            try:
-                regexes.append(re.compile(item))
-            except TypeError:
-                self.log.warning((
-                    "Invalid type \"{}\" value \"{}\"."
-                    " Expected string based object. Skipping."
-                ).format(str(type(item)), str(item)))
-
-        return regexes
-
-    def validate_value_by_regexes(self, value, in_list):
-        """Validates in any regex from list match entered value.
-
-        Args:
-            in_list (list): List with regexes.
-            value (str): String where regexes is checked.
-
-        Returns:
-            int: Returns `0` when list is not set or is empty. Returns `1` when
-                any regex match value and returns `-1` when none of regexes
-                match value entered.
-        """
-        if not in_list:
-            return 0
-
-        output = -1
-        regexes = self.compile_list_of_regexes(in_list)
-        for regex in regexes:
-            if re.match(regex, value):
-                output = 1
-                break
-        return output
-
-    def profile_exclusion(self, matching_profiles):
-        """Find out most matching profile byt host, task and family match.
-
-        Profiles are selectively filtered. Each profile should have
-        "__value__" key with list of booleans. Each boolean represents
-        existence of filter for specific key (host, tasks, family).
-        Profiles are looped in sequence. In each sequence are split into
-        true_list and false_list. For next sequence loop are used profiles in
-        true_list if there are any profiles else false_list is used.
-
-        Filtering ends when only one profile left in true_list. Or when all
-        existence booleans loops passed, in that case first profile from left
-        profiles is returned.
-
-        Args:
-            matching_profiles (list): Profiles with same values.
-
-        Returns:
-            dict: Most matching profile.
-        """
-        self.log.info(
-            "Search for first most matching profile in match order:"
-            " Host name -> Task name -> Family."
-        )
-        # Filter all profiles with highest points value. First filter profiles
-        # with matching host if there are any then filter profiles by task
-        # name if there are any and lastly filter by family. Else use first in
-        # list.
-        idx = 0
-        final_profile = None
-        while True:
-            profiles_true = []
-            profiles_false = []
-            for profile in matching_profiles:
-                value = profile["__value__"]
-                # Just use first profile when idx is greater than values.
-                if not idx < len(value):
-                    final_profile = profile
-                    break
-
-                if value[idx]:
-                    profiles_true.append(profile)
-                else:
-                    profiles_false.append(profile)
-
-            if final_profile is not None:
-                break
-
-            if profiles_true:
-                matching_profiles = profiles_true
-            else:
-                matching_profiles = profiles_false
-
-            if len(matching_profiles) == 1:
-                final_profile = matching_profiles[0]
-                break
-            idx += 1
-
-        final_profile.pop("__value__")
-        return final_profile
-
     def find_matching_profile(self, host_name, task_name, family):
         """ Filter profiles by Host name, Task name and main Family.
 
@@ -1530,7 +1635,6 @@ class ExtractReview(pyblish.api.InstancePlugin):
         If key is not find or is empty than it's expected to match.
 
         Args:
-            profiles (list): Profiles definition from presets.
             host_name (str): Current running host name.
             task_name (str): Current context task name.
             family (str): Main family of current Instance.
@@ -1539,81 +1643,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
             dict/None: Return most matching profile or None if none of profiles
                 match at least one criteria.
         """
-
-        matching_profiles = None
-        if not self.profiles:
-            return matching_profiles
-
-        highest_profile_points = -1
-        # Each profile get 1 point for each matching filter. Profile with most
-        # points is returned. For cases when more than one profile will match
-        # are also stored ordered lists of matching values.
-        for profile in self.profiles:
-            profile_points = 0
-            profile_value = []
-
-            # Host filtering
-            host_names = profile.get("hosts")
-            match = self.validate_value_by_regexes(host_name, host_names)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(host_name, host_names)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Task filtering
-            task_names = profile.get("tasks")
-            match = self.validate_value_by_regexes(task_name, task_names)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(task_name, task_names)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Family filtering
-            families = profile.get("families")
-            match = self.validate_value_by_regexes(family, families)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(family, families)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            if profile_points < highest_profile_points:
-                continue
-
-            if profile_points > highest_profile_points:
-                matching_profiles = []
-                highest_profile_points = profile_points
-
-            if profile_points == highest_profile_points:
-                profile["__value__"] = profile_value
-                matching_profiles.append(profile)
-
-        if not matching_profiles:
-            self.log.warning((
-                "None of profiles match your setup."
-                " Host \"{}\" | Task: \"{}\" | Family: \"{}\""
-            ).format(host_name, task_name, family))
-            return
-
-        if len(matching_profiles) == 1:
-            # Pop temporary key `__value__`
-            matching_profiles[0].pop("__value__")
-            return matching_profiles[0]
-
-        self.log.warning((
-            "More than one profile match your setup."
-            " Host \"{}\" | Task: \"{}\" | Family: \"{}\""
-        ).format(host_name, task_name, family))
-
-        return self.profile_exclusion(matching_profiles)
+        return filter_profiles(
+            self.profiles,
+            {
+                "hosts": host_name,
+                "tasks": task_name,
+                "families": family
+            },
+            keys_order=["hosts", "tasks", "families"],
+            logger=self.log
+        )
 
     def families_filter_validation(self, families, output_families_filter):
         """Determines if entered families intersect with families filters.
@@ -0,0 +1,31 @@
+import pyblish.api
+import openpype.api
+
+
+class ExtractReviewPending(pyblish.api.InstancePlugin):
+    """Encode review outputs which were left for burnins but not encoded.
+
+    ExtractReview leaves encoding of outputs with burnins to ExtractBurnin
+    when "fuse_burnins" is enabled, so review and burnins are rendered in
+    single pass. Outputs which were not processed by ExtractBurnin (plugin
+    was disabled or none of burnin definitions matched) are encoded here
+    without burnins.
+    """
+
+    label = "Extract Review Pending"
+    order = pyblish.api.ExtractorOrder + 0.0305
+    families = ["review"]
+
+    def process(self, instance):
+        for repre in instance.data.get("representations") or []:
+            if repre.pop("review_encode", None) is None:
+                continue
+
+            self.log.info((
+                "Representation \"{}\" was not encoded with burnins."
+            ).format(repre["name"]))
+            subprcs_cmd = repre["ffmpeg_cmd"]
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            openpype.api.run_subprocess(
+                subprcs_cmd, shell=True, logger=self.log
+            )
@@ -1,5 +1,6 @@
 import os
 import copy
+import datetime
 import clique
 import errno
 import shutil
@@ -174,6 +175,8 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
         # Don't make changes in database until everything is O.K.
         bulk_writes = []
+        # Representations stamped with time of write
+        written_repres = []
 
         if old_version:
             self.log.debug("Replacing old hero version.")
@@ -297,6 +300,7 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                 repre["context"] = repre_context
                 repre["data"] = repre_data
                 repre.pop("_id", None)
+                written_repres.append(repre)
 
                 # Prepare paths of source and destination files
                 if len(published_files) == 1:
@@ -427,6 +431,11 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                     )
 
             if bulk_writes:
+                # Sync server finds representations by time of their write
+                now = datetime.datetime.utcnow()
+                for repre in written_repres:
+                    repre["last_modified"] = now
+
                 io._database[io.Session["AVALON_PROJECT"]].bulk_write(
                     bulk_writes
                 )
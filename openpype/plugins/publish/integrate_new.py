@@ -1,5 +1,4 @@
 import os
-from os.path import getsize
 import logging
 import sys
 import copy
@@ -7,9 +6,7 @@ import clique
 import errno
 import six
 import re
-import shutil
 
-from pymongo import DeleteOne, InsertOne
 import pyblish.api
 from avalon import io
 from avalon.api import format_template_with_optional_keys
@@ -19,14 +16,18 @@ from datetime import datetime
 from openpype.lib.profiles_filtering import filter_profiles
 from openpype.lib import (
     prepare_template_data,
-    create_hard_link
+    create_hard_link,
+    source_hash_from_stat,
+    FileTransferEngine,
+    FileHashIndex
+)
+from openpype.pipeline.publish import (
+    PublishTransaction,
+    KnownPublishError
+)
+from openpype.pipeline.publish.transaction import (
+    handle_destination_files
 )
-
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
 
 log = logging.getLogger(__name__)
 
@@ -117,36 +118,115 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
     # file_url : file_size of all published and uploaded files
     integrated_file_sizes = {}
+    # file_url : checksum of published files (if checksum is enabled)
+    integrated_file_checksums = {}
+    # file_url : stat of published file captured after transfer
+    integrated_file_stats = {}
+
+    # Engine used to copy and hardlink files
+    transfer_engine_class = FileTransferEngine
 
     # Attributes set by settings
     template_name_profiles = None
     subset_grouping_profiles = None
+    transfer_max_workers = 4
+    transfer_retries = 3
+    transfer_checksum = ""
+    transfer_dedupe = False
+    batch_db_writes = True
 
     def process(self, instance):
         self.integrated_file_sizes = {}
+        self.integrated_file_checksums = {}
+        self.integrated_file_stats = {}
         if [ef for ef in self.exclude_families
                 if instance.data["family"] in ef]:
             return
 
+        transaction = self.get_publish_transaction(instance)
+        if self.batch_db_writes and transaction.rolled_back:
+            raise KnownPublishError((
+                "Integration of other instance failed. Instance \"{}\""
+                " was not integrated."
+            ).format(instance.data.get("name")))
+
+        transaction.start_group()
         try:
             self.register(instance)
+            transaction.add_files(self.integrated_file_sizes.keys())
             self.log.info("Integrated Asset in to the database ...")
             self.log.info("instance.data: {}".format(instance.data))
-            self.handle_destination_files(self.integrated_file_sizes,
-                                          'finalize')
         except Exception:
             # clean destination
             self.log.critical("Error when registering", exc_info=True)
+            # Files and documents of all instances integrated so far are
+            #   discarded, publishing is not partially written
+            transaction.rollback()
             self.handle_destination_files(self.integrated_file_sizes, 'remove')
             six.reraise(*sys.exc_info())
 
+        # Documents and files are written by 'IntegratePublishTransaction'
+        #   when batching is enabled
+        if not self.batch_db_writes:
+            transaction.commit()
+
+    def get_publish_transaction(self, instance):
+        """Publish transaction shared by all instances of the context.
+
+        Transaction is created on first call and documents of all instances
+        processed by this plugin are prefetched at that moment.
+        """
+        context = instance.context
+        transaction = context.data.get("publishTransaction")
+        if transaction is not None:
+            return transaction
+
+        io.install()
+        transaction = PublishTransaction(
+            io, io.Session["AVALON_PROJECT"], self.TMP_FILE_EXT, self.log
+        )
+        context.data["publishTransaction"] = transaction
+
+        context_asset_name = None
+        context_asset_doc = context.data.get("assetEntity")
+        if context_asset_doc:
+            context_asset_name = context_asset_doc["name"]
+
+        asset_names = set()
+        asset_docs = []
+        subset_names = set()
+        version_names = set()
+        for _instance in pyblish.api.instances_by_plugin(context, self):
+            if not _instance.data.get("publish", True):
+                continue
+
+            asset_name = _instance.data.get("asset")
+            asset_doc = _instance.data.get("assetEntity")
+            if asset_doc and asset_doc["name"] == context_asset_name:
+                asset_docs.append(asset_doc)
+            elif asset_name:
+                asset_names.add(asset_name)
+
+            if "subset" in _instance.data:
+                subset_names.add(_instance.data["subset"])
+            if "version" in _instance.data:
+                version_names.add(_instance.data["version"])
+
+        transaction.prefetch(
+            context.data["projectEntity"]["_id"],
+            asset_names,
+            subset_names,
+            version_names,
+            asset_docs
+        )
+        return transaction
+
     def register(self, instance):
         # Required environment variables
         anatomy_data = instance.data["anatomyData"]
 
-        io.install()
-
         context = instance.context
+        transaction = self.get_publish_transaction(instance)
 
         project_entity = instance.data["projectEntity"]
 
@@ -158,11 +238,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         asset_name = instance.data["asset"]
         asset_entity = instance.data.get("assetEntity")
         if not asset_entity or asset_entity["name"] != context_asset_name:
-            asset_entity = io.find_one({
-                "type": "asset",
-                "name": asset_name,
-                "parent": project_entity["_id"]
-            })
+            asset_entity = transaction.get_asset(
+                project_entity["_id"], asset_name
+            )
             assert asset_entity, (
                 "No asset found by the name \"{0}\" in project \"{1}\""
             ).format(asset_name, project_entity["name"])
@@ -251,36 +329,23 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         new_repre_names_low = [_repre["name"].lower() for _repre in repres]
 
-        existing_version = io.find_one({
-            'type': 'version',
-            'parent': subset["_id"],
-            'name': version_number
-        })
+        existing_version = transaction.get_version(
+            subset["_id"], version_number
+        )
 
         if existing_version is None:
-            version_id = io.insert_one(version).inserted_id
+            version_id = transaction.insert_one(version)
         else:
             # Check if instance have set `append` mode which cause that
             # only replicated representations are set to archive
             append_repres = instance.data.get("append", False)
 
             # Update version data
-            # TODO query by _id and
-            io.update_many({
-                'type': 'version',
-                'parent': subset["_id"],
-                'name': version_number
-            }, {
-                '$set': version
-            })
             version_id = existing_version['_id']
+            transaction.update_one(version_id, version)
 
             # Find representations of existing version and archive them
-            current_repres = list(io.find({
-                "type": "representation",
-                "parent": version_id
-            }))
-            bulk_writes = []
+            current_repres = transaction.get_representations(version_id)
             for repre in current_repres:
                 if append_repres:
                     # archive only duplicated representations
@@ -290,26 +355,20 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 # `_id` must be stored to other key and replaced with new
                 # - that is because new representations should have same ID
                 repre_id = repre["_id"]
-                bulk_writes.append(DeleteOne({"_id": repre_id}))
+                transaction.delete_one(repre_id)
 
+                repre = copy.deepcopy(repre)
                 repre["orig_id"] = repre_id
                 repre["_id"] = io.ObjectId()
                 repre["type"] = "archived_representation"
-                bulk_writes.append(InsertOne(repre))
+                transaction.insert_one(repre)
 
-            # bulk updates
-            if bulk_writes:
-                io._database[io.Session["AVALON_PROJECT"]].bulk_write(
-                    bulk_writes
-                )
-
-        version = io.find_one({"_id": version_id})
+        version = transaction.get_document(version_id)
         instance.data["versionEntity"] = version
 
-        existing_repres = list(io.find({
-            "parent": version_id,
-            "type": "archived_representation"
-        }))
+        existing_repres = transaction.get_representations(
+            version_id, "archived_representation"
+        )
 
         instance.data['version'] = version['name']
 
@@ -633,12 +692,12 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             repre_ids_to_remove = []
             for repre in existing_repres:
                 repre_ids_to_remove.append(repre["_id"])
-            io.delete_many({"_id": {"$in": repre_ids_to_remove}})
+            transaction.delete_many(repre_ids_to_remove)
 
         for rep in instance.data["representations"]:
             self.log.debug("__ rep: {}".format(rep))
 
-        io.insert_many(representations)
+        transaction.insert_many(representations)
         instance.data["published_representations"] = (
             published_representations
         )
@@ -648,7 +707,8 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
     def integrate(self, instance):
         """ Move the files.
 
-            Through `instance.data["transfers"]`
+            Through `instance.data["transfers"]` and
+            `instance.data["hardlinks"]`.
 
             Args:
                 instance: the instance to integrate
@@ -656,15 +716,21 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 integrated_file_sizes: dictionary of destination file url and
                 its size in bytes
         """
-        # store destination url and size for reporting and rollback
-        integrated_file_sizes = {}
+        transfer_engine = self.get_transfer_engine(instance)
+        hash_index = self.get_file_hash_index()
+
         transfers = list(instance.data.get("transfers", list()))
         for src, dest in transfers:
             if os.path.normpath(src) != os.path.normpath(dest):
+                link_src = checksum = None
+                if hash_index is not None:
+                    link_src, checksum = self._find_published_duplicate(
+                        hash_index, src, dest
+                    )
                 dest = self.get_dest_temp_url(dest)
-                self.copy_file(src, dest)
-                # TODO needs to be updated during site implementation
-                integrated_file_sizes[dest] = os.path.getsize(dest)
+                transfer_engine.add_transfer(
+                    src, dest, link_src=link_src, checksum=checksum
+                )
 
         # Produce hardlinked copies
         # Note: hardlink can only be produced between two files on the same
@@ -674,14 +740,116 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         hardlinks = instance.data.get("hardlinks", list())
         for src, dest in hardlinks:
             dest = self.get_dest_temp_url(dest)
-            self.log.debug("Hardlinking file ... {} -> {}".format(src, dest))
-            if not os.path.exists(dest):
-                self.hardlink_file(src, dest)
+            transfer_engine.add_transfer(src, dest, mode="hardlink")
+
+        report = transfer_engine.process()
+        report.log_summary(self.log)
+
+        self.integrated_file_checksums.update(report.get_checksums())
+        for result in report.results:
+            self.integrated_file_stats[result.dst] = result.stat
+
+        if hash_index is not None:
+            self._store_file_hashes(hash_index, report)
+
+        # store destination url and size for reporting and rollback
+        # TODO needs to be updated during site implementation
+        return report.get_file_sizes()
+
+    def get_file_hash_index(self):
+        """Index of content hashes used to skip copy of duplicated files.
+
+        Returns:
+            Union[FileHashIndex, None]: Index or None if deduplication is
+                disabled or checksum is not calculated.
+        """
+        if not self.transfer_dedupe or not self.transfer_checksum:
+            return None
+        return FileHashIndex()
 
-            # TODO needs to be updated during site implementation
-            integrated_file_sizes[dest] = os.path.getsize(dest)
+    def _find_published_duplicate(self, hash_index, src, dest):
+        """Find already published file with same content as source.
 
-        return integrated_file_sizes
+        Source content hash is known only if the same unchanged file was
+        already transferred from this machine.
+
+        Returns:
+            tuple: Path to published file and checksum of its content. Both
+                are None if duplicate was not found.
+        """
+        try:
+            src_stat = os.stat(src)
+        except OSError:
+            return None, None
+
+        checksum = hash_index.get_checksum(
+            src, self.transfer_checksum, src_stat
+        )
+        if not checksum:
+            return None, None
+
+        published_path = hash_index.find_published_file(
+            checksum, src_stat.st_size, self.transfer_checksum
+        )
+        if (
+            not published_path
+            or os.path.normpath(published_path) == os.path.normpath(dest)
+        ):
+            return None, None
+
+        self.log.debug("Found published duplicate of {} in {}".format(
+            src, published_path
+        ))
+        return published_path, checksum
+
+    def _store_file_hashes(self, hash_index, report):
+        """Store content hashes of transferred sources and published files.
+
+        Published files are stored with final path. Stat of the temporary
+        file is the same as of the final file after rename.
+        """
+        source_items = []
+        published_items = []
+        tmp_ext_regex = re.compile(r"\.{}$".format(self.TMP_FILE_EXT))
+        for result in report.results:
+            if not result.checksum or result.stat is None:
+                continue
+
+            if result.mode == "copy":
+                source_items.append((result.src, result.checksum))
+
+            final_path = tmp_ext_regex.sub("", result.dst)
+            source_items.append((final_path, result.checksum, result.stat))
+            published_items.append(
+                (final_path, result.checksum, result.size)
+            )
+
+        hash_index.store_checksums(source_items, self.transfer_checksum)
+        hash_index.add_published_files(
+            published_items, self.transfer_checksum
+        )
+
+    def get_transfer_engine(self, instance):
+        """Create engine used to transfer files of the instance.
+
+        Engine is configured by settings of the plugin and reports
+        transfer speed per root of project anatomy.
+        """
+        roots = {}
+        anatomy = instance.context.data.get("anatomy")
+        if anatomy is not None:
+            for root_name, root in anatomy.roots.items():
+                # Skip nested root definitions
+                if hasattr(root, "value"):
+                    roots[root_name] = root.value
+
+        return self.transfer_engine_class(
+            max_workers=self.transfer_max_workers,
+            retries=self.transfer_retries,
+            checksum_algorithm=self.transfer_checksum or None,
+            roots=roots,
+            logger=self.log
+        )
 
     def copy_file(self, src, dst):
         """ Copy given source to destination
@@ -692,37 +860,11 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         Returns:
             None
         """
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        self.log.debug("Copying file ... {} -> {}".format(src, dst))
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                six.reraise(*sys.exc_info())
-
-        # copy file with speedcopy and check if size of files are simetrical
-        while True:
-            if not shutil._samefile(src, dst):
-                copyfile(src, dst)
-            else:
-                self.log.critical(
-                    "files are the same {} to {}".format(src, dst)
-                )
-                os.remove(dst)
-                try:
-                    shutil.copyfile(src, dst)
-                    self.log.debug("Copying files with shutil...")
-                except OSError as e:
-                    self.log.critical("Cannot copy {} to {}".format(src, dst))
-                    self.log.critical(e)
-                    six.reraise(*sys.exc_info())
-            if str(getsize(src)) in str(getsize(dst)):
-                break
+        transfer_engine = self.transfer_engine_class(
+            retries=self.transfer_retries, logger=self.log
+        )
+        transfer_engine.add_transfer(src, dst)
+        transfer_engine.process()
 
     def hardlink_file(self, src, dst):
         dirname = os.path.dirname(dst)
@@ -739,12 +881,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         create_hard_link(src, dst)
 
     def get_subset(self, asset, instance):
+        transaction = self.get_publish_transaction(instance)
         subset_name = instance.data["subset"]
-        subset = io.find_one({
-            "type": "subset",
-            "parent": asset["_id"],
-            "name": subset_name
-        })
+        subset = transaction.get_subset(asset["_id"], subset_name)
 
         if subset is None:
             self.log.info("Subset '%s' not found, creating ..." % subset_name)
@@ -761,7 +900,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 if _family not in families:
                     families.append(_family)
 
-            _id = io.insert_one({
+            _id = transaction.insert_one({
                 "schema": "openpype:subset-3.0",
                 "type": "subset",
                 "name": subset_name,
@@ -769,9 +908,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                     "families": families
                 },
                 "parent": asset["_id"]
-            }).inserted_id
+            })
 
-            subset = io.find_one({"_id": _id})
+            subset = transaction.get_document(_id)
 
         # QUESTION Why is changing of group and updating it's
         #   families in 'get_subset'?
@@ -780,9 +919,8 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         # Update families on subset.
         families = [instance.data["family"]]
         families.extend(instance.data.get("families", []))
-        io.update_many(
-            {"type": "subset", "_id": io.ObjectId(subset["_id"])},
-            {"$set": {"data.families": families}}
+        transaction.update_one(
+            subset["_id"], {"data.families": families}
         )
 
         return subset
@@ -804,10 +942,10 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             subset_group = self._get_subset_group(instance)
 
         if subset_group:
-            io.update_many({
-                'type': 'subset',
-                '_id': io.ObjectId(subset_id)
-            }, {'$set': {'data.subsetGroup': subset_group}})
+            transaction = self.get_publish_transaction(instance)
+            transaction.update_one(
+                subset_id, {"data.subsetGroup": subset_group}
+            )
 
     def _get_subset_group(self, instance):
         """Look into subset group profiles set by settings.
@@ -1001,17 +1139,28 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         anatomy = instance.context.data["anatomy"]
         for _src, dest in resources:
             path = self.get_rootless_path(anatomy, dest)
-            dest = self.get_dest_temp_url(dest)
-            file_hash = openpype.api.source_hash(dest)
-            if self.TMP_FILE_EXT and \
-               ',{}'.format(self.TMP_FILE_EXT) in file_hash:
-                file_hash = file_hash.replace(',{}'.format(self.TMP_FILE_EXT),
-                                              '')
+            dest = os.path.normpath(self.get_dest_temp_url(dest))
+            dest_stat = self.integrated_file_stats.get(dest)
+            if dest_stat is not None:
+                # Use stat captured during transfer with final file name
+                file_hash = source_hash_from_stat(path, dest_stat)
+            else:
+                file_hash = openpype.api.source_hash(dest)
+                if self.TMP_FILE_EXT and \
+                   ',{}'.format(self.TMP_FILE_EXT) in file_hash:
+                    file_hash = file_hash.replace(
+                        ',{}'.format(self.TMP_FILE_EXT), ''
+                    )
 
             file_info = self.prepare_file_info(path,
                                                integrated_file_sizes[dest],
                                                file_hash,
                                                instance=instance)
+            checksum = self.integrated_file_checksums.get(dest)
+            if checksum:
+                file_info["checksum"] = "{}:{}".format(
+                    self.transfer_checksum, checksum
+                )
             output_resources.append(file_info)
 
         return output_resources
@@ -1168,40 +1317,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                                remove TMP_FILE_EXT suffix denoting temp file
         """
         if integrated_file_sizes:
-            for file_url, _file_size in integrated_file_sizes.items():
-                if not os.path.exists(file_url):
-                    self.log.debug(
-                        "File {} was not found.".format(file_url)
-                    )
-                    continue
-
-                try:
-                    if mode == 'remove':
-                        self.log.debug("Removing file {}".format(file_url))
-                        os.remove(file_url)
-                    if mode == 'finalize':
-                        new_name = re.sub(
-                            r'\.{}$'.format(self.TMP_FILE_EXT),
-                            '',
-                            file_url
-                        )
-
-                        if os.path.exists(new_name):
-                            self.log.debug(
-                                "Overwriting file {} to {}".format(
-                                    file_url, new_name
-                                )
-                            )
-                            shutil.copy(file_url, new_name)
-                            os.remove(file_url)
-                        else:
-                            self.log.debug(
-                                "Renaming file {} to {}".format(
-                                    file_url, new_name
-                                )
-                            )
-                            os.rename(file_url, new_name)
-                except OSError:
-                    self.log.error("Cannot {} file {}".format(mode, file_url),
-                                   exc_info=True)
-                    six.reraise(*sys.exc_info())
+            handle_destination_files(
+                integrated_file_sizes.keys(),
+                mode,
+                self.TMP_FILE_EXT,
+                self.log
+            )
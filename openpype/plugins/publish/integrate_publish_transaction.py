@@ -0,0 +1,36 @@
+import pyblish.api
+
+
+class IntegratePublishTransaction(pyblish.api.ContextPlugin):
+    """Write documents of integrated instances to database.
+
+    `IntegrateAssetNew` collects database writes of all instances into
+    publish transaction stored in context data. Transaction is written with
+    single bulk write and temporary files of integrated instances are
+    renamed to final names. Integrated files are removed when the write
+    fails.
+
+    Must run before plugins which query integrated documents from database
+    (e.g. `IntegrateThumbnails`).
+    """
+
+    label = "Commit Publish Transaction"
+    order = pyblish.api.IntegratorOrder + 0.005
+
+    def process(self, context):
+        transaction = context.data.get("publishTransaction")
+        if transaction is None:
+            self.log.debug("Nothing to commit.")
+            return
+
+        if transaction.rolled_back:
+            self.log.info(
+                "Transaction was rolled back because integration failed."
+            )
+            return
+
+        operations_count = len(transaction.operations)
+        transaction.commit()
+        self.log.info(
+            "Committed {} database operations.".format(operations_count)
+        )
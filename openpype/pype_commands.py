@@ -105,10 +105,11 @@ class PypeCommands:
         from openpype.api import Logger
         from openpype.tools.utils.host_tools import show_publish
         from openpype.tools.utils.lib import qt_app_context
+        from openpype.pipeline.publish import publish_plugins_discover
+        from openpype.pipeline.publish.runner import publish_iter
 
         # Register target and host
         import pyblish.api
-        import pyblish.util
 
         log = Logger.get_logger()
 
@@ -145,7 +146,15 @@ class PypeCommands:
 
         log.info("Running publish ...")
 
-        plugins = pyblish.api.discover()
+        # Discover plugins only once and pass them to publishing
+        publish_targets = ["default"] + pyblish.api.registered_targets()
+        discover_result = publish_plugins_discover(targets=publish_targets)
+        for filepath, exc_info in discover_result.crashed_file_paths.items():
+            log.error(
+                "Failed to load plugins from \"{}\"".format(filepath),
+                exc_info=exc_info
+            )
+        plugins = discover_result.plugins
         print("Using plugins:")
         for plugin in plugins:
             print(plugin)
@@ -158,9 +167,16 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
+            # Instances of concurrent plugins are processed in parallel
+            for result in publish_iter(plugins=plugins):
                 if result["error"]:
                     log.error(error_format.format(**result))
+                    # Remove files and documents of uncommitted integration
+                    transaction = result["context"].data.get(
+                        "publishTransaction"
+                    )
+                    if transaction is not None:
+                        transaction.rollback()
                     # uninstall()
                     sys.exit(1)
 
@@ -329,12 +345,13 @@ class PypeCommands:
 
     @staticmethod
     def extractenvironments(
-        output_json_path, project, asset, task, app, env_group
+        output_json_path, project, asset, task, app, env_group,
+        cache_dir=None
     ):
         if all((project, asset, task, app)):
-            from openpype.api import get_app_environments_for_context
-            env = get_app_environments_for_context(
-                project, asset, task, app, env_group
+            from openpype.lib import get_cached_app_environments_for_context
+            env = get_cached_app_environments_for_context(
+                project, asset, task, app, env_group, cache_dir=cache_dir
             )
         else:
             env = os.environ.copy()
@@ -445,10 +462,10 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath):
+    def pack_project(self, project_name, dirpath, workers=None):
         from openpype.lib.project_backpack import pack_project
 
-        pack_project(project_name, dirpath)
+        pack_project(project_name, dirpath, workers)
 
     def unpack_project(self, zip_filepath, new_root):
         from openpype.lib.project_backpack import unpack_project
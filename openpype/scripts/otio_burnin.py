@@ -4,23 +4,19 @@ import re
 import subprocess
 import platform
 import json
+from fractions import Fraction
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
 import openpype.lib
 from openpype.lib.vendor_bin_utils import get_fps
 
 
 ffmpeg_path = openpype.lib.get_ffmpeg_tool_path("ffmpeg")
-ffprobe_path = openpype.lib.get_ffmpeg_tool_path("ffprobe")
 
 
 FFMPEG = (
     '"{}"%(input_args)s -i "%(input)s" %(filters)s %(args)s%(output)s'
 ).format(ffmpeg_path)
 
-FFPROBE = (
-    '"{}" -v quiet -print_format json -show_format -show_streams "%(source)s"'
-).format(ffprobe_path)
-
 DRAWTEXT = (
     "drawtext=fontfile='%(font)s':text=\\'%(text)s\\':"
     "x=%(x)s:y=%(y)s:fontcolor=%(color)s@%(opacity).1f:fontsize=%(size)d"
@@ -40,15 +36,14 @@ SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 def _get_ffprobe_data(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
+    and cached probe data shared with publish plugins.
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = FFPROBE % {'source': source}
-    proc = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)
+    ffprobe_data = openpype.lib.get_ffprobe_data(source)
+    if "streams" not in ffprobe_data:
+        raise RuntimeError("Failed to probe: %s" % source)
+    return ffprobe_data
 
 
 def _prores_codec_args(stream_data, source_ffmpeg_cmd):
@@ -254,13 +249,15 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
     }
 
     def __init__(
-        self, source, ffprobe_data=None, options_init=None, first_frame=None
+        self, source, ffprobe_data=None, options_init=None, first_frame=None,
+        review_encode=None
     ):
         if not ffprobe_data:
             ffprobe_data = _get_ffprobe_data(source)
 
         self.ffprobe_data = ffprobe_data
         self.first_frame = first_frame
+        self.review_encode = review_encode
         self.input_args = []
 
         super().__init__(source, ffprobe_data["streams"])
@@ -415,6 +412,9 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         :returns: completed command
         :rtype: str
         """
+        if self.review_encode:
+            return self._review_command(output, overwrite)
+
         output = '"{}"'.format(output or '')
         if overwrite:
             output = '-y {}'.format(output)
@@ -444,6 +444,34 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             'filters': filters
         }).strip()
 
+    def _review_command(self, output, overwrite):
+        """Command encoding review from its source with burnins.
+
+        Burnin filters are added after video filters of review so review and
+        burnins are rendered by single ffmpeg process.
+        """
+        review_encode = self.review_encode
+        video_filters = list(review_encode["video_filters"])
+        if self.filter_string:
+            video_filters.append(self.filter_string)
+
+        args = ['"{}"'.format(ffmpeg_path)]
+        args.extend(review_encode["input_args"])
+        if video_filters:
+            args.extend(["-filter:v", '"{}"'.format(",".join(video_filters))])
+
+        if review_encode["audio_filters"]:
+            args.extend([
+                "-filter:a",
+                '"{}"'.format(",".join(review_encode["audio_filters"]))
+            ])
+
+        args.extend(review_encode["output_args"])
+        if overwrite:
+            args.append("-y")
+        args.append('"{}"'.format(output))
+        return " ".join(args)
+
     def render(self, output, args=None, overwrite=False, **kwargs):
         """
         Render the media to a specified destination.
@@ -517,7 +545,8 @@ def example(input_path, output_path):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    ffprobe_data=None, review_encode=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -533,6 +562,11 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        ffprobe_data (dict): Probed data of input, input is probed if not
+            passed.
+        review_encode (dict): Arguments of review encoding from
+            ExtractReview. Review is encoded from its source together with
+            burnins when passed, input path does not have to exist.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...(more info: ModifiedBurnins doc)
@@ -574,11 +608,27 @@ def burnins_from_data(
         "shot": "sh0010"
     }
     """
-    ffprobe_data = None
-    if full_input_path:
+    if review_encode:
+        # Review output does not exist yet, use its expected properties
+        frame_rate = Fraction(review_encode["fps"]).limit_denominator(1001)
+        ffprobe_data = {
+            "streams": [{
+                "codec_type": "video",
+                "width": review_encode["width"],
+                "height": review_encode["height"],
+                "r_frame_rate": "{}/{}".format(
+                    frame_rate.numerator, frame_rate.denominator
+                )
+            }],
+            "format": {}
+        }
+
+    elif not ffprobe_data and full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
-    burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
+    burnin = ModifiedBurnins(
+        input_path, ffprobe_data, options, first_frame, review_encode
+    )
 
     frame_start = data.get("frame_start")
     frame_end = data.get("frame_end")
@@ -740,6 +790,8 @@ if __name__ == "__main__":
         burnin_values=in_data.get("values"),
         full_input_path=in_data.get("full_input_path"),
         first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd"),
+        ffprobe_data=in_data.get("ffprobe_data"),
+        review_encode=in_data.get("review_encode")
     )
     print("* Burnin script has finished")
@@ -1,6 +1,6 @@
 import os
 import json
-import copy
+import uuid
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -276,22 +276,61 @@ class LocalSettingsHandler:
         pass
 
 
+def copy_settings_data(data):
+    """Copy of json serializable settings data.
+
+    Much faster than 'copy.deepcopy' as values can be only dictionaries,
+    lists and immutable values.
+    """
+    if isinstance(data, dict):
+        return {
+            key: copy_settings_data(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [copy_settings_data(item) for item in data]
+    return data
+
+
+def new_settings_revision():
+    """Unique revision of settings document stored on each save."""
+    return uuid.uuid4().hex
+
+
 class CacheValues:
+    """Cached data of settings documents.
+
+    Cached data are validated once per 'cache_lifetime' seconds. Validation
+    compares revisions of source documents (see 'set_revisions') which is
+    much cheaper than loading the documents again. Data must be loaded
+    again if revisions are not known or changed.
+    """
     cache_lifetime = 10
 
+    # Revision of existing document which was saved without revision
+    NO_REVISION = "__no_revision__"
+
     def __init__(self):
         self.data = None
         self.creation_time = None
         self.version = None
 
+        self.revision_filters = None
+        self.revisions = None
+
+        self.hits = 0
+        self.misses = 0
+
     def data_copy(self):
         if not self.data:
             return {}
-        return copy.deepcopy(self.data)
+        return copy_settings_data(self.data)
 
     def update_data(self, data, version=None):
         self.data = data
         self.creation_time = datetime.datetime.now()
+        self.revision_filters = None
+        self.revisions = None
         if version is not None:
             self.version = version
 
@@ -304,9 +343,36 @@ class CacheValues:
                 value = document["value"]
                 if value:
                     data = json.loads(value)
-        self.data = data
-        if version is not None:
-            self.version = version
+        self.update_data(data, version)
+
+    def set_revisions(self, filters, documents):
+        """Store revisions of documents used to validate cache.
+
+        Args:
+            filters (list): Mongo filters of source documents.
+            documents (list): Documents found by filters (or None).
+        """
+        self.revision_filters = filters
+        self.revisions = tuple(
+            self.document_revision(document)
+            for document in documents
+        )
+
+    @classmethod
+    def document_revision(cls, document):
+        if not document:
+            return None
+        return document.get("revision", cls.NO_REVISION)
+
+    def mark_valid(self):
+        self.creation_time = datetime.datetime.now()
+
+    @property
+    def can_validate_revisions(self):
+        return (
+            self.revision_filters is not None
+            and self.NO_REVISION not in self.revisions
+        )
 
     def to_json_string(self):
         return json.dumps(self.data or {})
@@ -527,7 +593,8 @@ class MongoSettingsHandler(SettingsHandler):
             {
                 "type": self._system_settings_key,
                 "data": system_settings_data,
-                "version": self._current_version
+                "version": self._current_version,
+                "revision": new_settings_revision()
             },
             upsert=True
         )
@@ -539,7 +606,8 @@ class MongoSettingsHandler(SettingsHandler):
             },
             {
                 "type": GLOBAL_SETTINGS_KEY,
-                "data": global_settings
+                "data": global_settings,
+                "revision": new_settings_revision()
             },
             upsert=True
         )
@@ -677,7 +745,8 @@ class MongoSettingsHandler(SettingsHandler):
             "type": doc_type,
             "data": data_cache.data,
             "is_default": is_default,
-            "version": self._current_version
+            "version": self._current_version,
+            "revision": new_settings_revision()
         }
         if not is_default:
             replace_filter["project_name"] = project_name
@@ -689,6 +758,64 @@ class MongoSettingsHandler(SettingsHandler):
             upsert=True
         )
 
+    def _is_cache_valid(self, cache):
+        """Cached data can be used without loading documents again.
+
+        Outdated cache is validated by comparing revisions of its source
+        documents.
+        """
+        valid = False
+        if not cache.is_outdated:
+            valid = True
+
+        elif cache.can_validate_revisions:
+            revisions = tuple(
+                cache.document_revision(
+                    self.collection.find_one(doc_filter, {"revision": True})
+                )
+                for doc_filter in cache.revision_filters
+            )
+            if revisions == cache.revisions:
+                cache.mark_valid()
+                valid = True
+
+        if valid:
+            cache.hits += 1
+        else:
+            cache.misses += 1
+        return valid
+
+    def get_cache_stats(self):
+        """Hits and misses of settings caches.
+
+        Returns:
+            dict: Count of hits and misses by cache name.
+        """
+        caches = [("system_settings", self.system_settings_cache)]
+        for project_name, cache in self.project_settings_cache.items():
+            caches.append(
+                ("project_settings/{}".format(project_name), cache)
+            )
+        for project_name, cache in self.project_anatomy_cache.items():
+            caches.append(
+                ("project_anatomy/{}".format(project_name), cache)
+            )
+        return {
+            name: {"hits": cache.hits, "misses": cache.misses}
+            for name, cache in caches
+        }
+
+    def _project_settings_filter(self, project_name):
+        document_filter = {
+            "type": self._project_settings_key,
+            "version": self._current_version
+        }
+        if project_name is None:
+            document_filter["is_default"] = True
+        else:
+            document_filter["project_name"] = project_name
+        return document_filter
+
     def _get_versions_order_doc(self, projection=None):
         # TODO cache
         return self.collection.find_one(
@@ -1010,15 +1137,23 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
-        if self.system_settings_cache.is_outdated:
-            globals_document = self.collection.find_one({
-                "type": GLOBAL_SETTINGS_KEY
-            })
+        if not self._is_cache_valid(self.system_settings_cache):
+            globals_filter = {"type": GLOBAL_SETTINGS_KEY}
+            version_filter = {
+                "type": self._system_settings_key,
+                "version": self._current_version
+            }
+            globals_document = self.collection.find_one(globals_filter)
             document = (
                 self._get_studio_system_settings_overrides_for_version()
             )
+            revision_filters = [globals_filter, version_filter]
+            revision_documents = [globals_document, document]
             if document is None:
                 document = self._find_closest_system_settings()
+                if document:
+                    revision_filters.append({"_id": document["_id"]})
+                    revision_documents.append(document)
 
             version = None
             if document:
@@ -1034,6 +1169,9 @@ class MongoSettingsHandler(SettingsHandler):
             self.system_settings_cache.update_from_document(
                 merged_document, version
             )
+            self.system_settings_cache.set_revisions(
+                revision_filters, revision_documents
+            )
 
         cache = self.system_settings_cache
         data = cache.data_copy()
@@ -1042,12 +1180,19 @@ class MongoSettingsHandler(SettingsHandler):
         return data
 
     def _get_project_settings_overrides(self, project_name, return_version):
-        if self.project_settings_cache[project_name].is_outdated:
+        if not self._is_cache_valid(self.project_settings_cache[project_name]):
             document = self._get_project_settings_overrides_for_version(
                 project_name
             )
+            revision_filters = [
+                self._project_settings_filter(project_name)
+            ]
+            revision_documents = [document]
             if document is None:
                 document = self._find_closest_project_settings(project_name)
+                if document:
+                    revision_filters.append({"_id": document["_id"]})
+                    revision_documents.append(document)
 
             version = None
             if document:
@@ -1059,6 +1204,9 @@ class MongoSettingsHandler(SettingsHandler):
             self.project_settings_cache[project_name].update_from_document(
                 document, version
             )
+            self.project_settings_cache[project_name].set_revisions(
+                revision_filters, revision_documents
+            )
 
         cache = self.project_settings_cache[project_name]
         data = cache.data_copy()
@@ -1128,11 +1276,20 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name, return_version):
-        if self.project_anatomy_cache[project_name].is_outdated:
+        if not self._is_cache_valid(self.project_anatomy_cache[project_name]):
             if project_name is None:
                 document = self._get_project_anatomy_overrides_for_version()
+                revision_filters = [{
+                    "type": self._project_anatomy_key,
+                    "is_default": True,
+                    "version": self._current_version
+                }]
+                revision_documents = [document]
                 if document is None:
                     document = self._find_closest_project_anatomy()
+                    if document:
+                        revision_filters.append({"_id": document["_id"]})
+                        revision_documents.append(document)
 
                 version = None
                 if document:
@@ -1143,6 +1300,9 @@ class MongoSettingsHandler(SettingsHandler):
                 self.project_anatomy_cache[project_name].update_from_document(
                     document, version
                 )
+                self.project_anatomy_cache[project_name].set_revisions(
+                    revision_filters, revision_documents
+                )
             else:
                 collection = self.avalon_db.database[project_name]
                 project_doc = collection.find_one({"type": "project"})
@@ -1419,19 +1579,35 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id,
-                "data": self.local_settings_cache.data
+                "data": self.local_settings_cache.data,
+                "revision": new_settings_revision()
             },
             upsert=True
         )
 
     def get_local_settings(self):
         """Local settings for local site id."""
-        if self.local_settings_cache.is_outdated:
-            document = self.collection.find_one({
+        cache = self.local_settings_cache
+        if cache.is_outdated:
+            document_filter = {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id
-            })
-
-            self.local_settings_cache.update_from_document(document)
+            }
+            revision = None
+            if cache.can_validate_revisions:
+                revision = cache.document_revision(self.collection.find_one(
+                    document_filter, {"revision": True}
+                ))
+
+            if revision is not None and cache.revisions == (revision, ):
+                cache.mark_valid()
+                cache.hits += 1
+            else:
+                cache.misses += 1
+                document = self.collection.find_one(document_filter)
+                cache.update_from_document(document)
+                cache.set_revisions([document_filter], [document])
+        else:
+            cache.hits += 1
 
         return self.local_settings_cache.data_copy()
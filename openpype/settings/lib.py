@@ -1,12 +1,15 @@
 import os
 import json
+import hashlib
 import functools
 import logging
 import platform
 import copy
+import collections
 from .exceptions import (
     SaveWarningExc
 )
+from .handlers import copy_settings_data
 from .constants import (
     M_OVERRIDDEN_KEY,
     M_ENVIRONMENT_KEY,
@@ -33,6 +36,8 @@ DEFAULTS_DIR = os.path.join(
 
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
+# Changed each time default settings are loaded
+_DEFAULT_SETTINGS_REVISION = 0
 
 # Handler of studio overrides
 _SETTINGS_HANDLER = None
@@ -415,6 +420,12 @@ def clear_project_settings_overrides_for_version(
     )
 
 
+@require_handler
+def get_settings_cache_stats():
+    """Hits and misses of settings caches in current process."""
+    return _SETTINGS_HANDLER.get_cache_stats()
+
+
 @require_local_handler
 def save_local_settings(data):
     return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
@@ -452,6 +463,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _SETTINGS_LAYERS.clear()
 
 
 def _get_default_settings():
@@ -502,10 +514,123 @@ def get_default_settings():
     Returns:
         dict: Loaded default settings.
     """
+    return copy.deepcopy(_get_default_settings_data())
+
+
+def _get_default_settings_data():
+    """Cached default settings which must not be modified."""
     global _DEFAULT_SETTINGS
+    global _DEFAULT_SETTINGS_REVISION
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+        _DEFAULT_SETTINGS_REVISION += 1
+    return _DEFAULT_SETTINGS
+
+
+class SettingsLayersCache(object):
+    """Resolved settings layers.
+
+    Settings are resolved in layers: defaults, studio overrides, project
+    overrides and local settings. Each resolved layer is stored under key
+    created from key of its parent layer and hash of data applied on the
+    parent. Resolving of other project can reuse cached studio layer and
+    only merge small project overrides.
+
+    Stored values are shared and must not be modified.
+    """
+    max_items = 32
+
+    def __init__(self):
+        self._items = collections.OrderedDict()
+
+    def get(self, key):
+        value = self._items.pop(key, None)
+        if value is not None:
+            self._items[key] = value
+        return value
+
+    def set(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+_SETTINGS_LAYERS = SettingsLayersCache()
+
+
+def _settings_hash(data):
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_defaults_layer(settings_key):
+    defaults = _get_default_settings_data()[settings_key]
+    return ("defaults", settings_key, _DEFAULT_SETTINGS_REVISION), defaults
+
+
+def _get_overrides_layer(parent_layer, overrides, merge_func=None):
+    """Parent layer with applied overrides.
+
+    Args:
+        parent_layer (tuple): Key and value of parent layer.
+        overrides (dict): Overrides applied on parent layer, may be modified.
+        merge_func (callable): Function applying overrides on copy of
+            parent value. 'merge_overrides' is used by default.
+
+    Returns:
+        tuple: Key and value of layer.
+    """
+    parent_key, parent_value = parent_layer
+    key = (parent_key, _settings_hash(overrides))
+    value = _SETTINGS_LAYERS.get(key)
+    if value is None:
+        value = parent_value
+        if overrides:
+            if merge_func is None:
+                merge_func = merge_overrides
+            value = merge_func(copy_settings_data(parent_value), overrides)
+        _SETTINGS_LAYERS.set(key, value)
+    return key, value
+
+
+def _get_output_settings(
+    layer, clear_metadata, exclude_locals, apply_locals_func
+):
+    """Copy of resolved layer with cleared metadata and applied locals.
+
+    Args:
+        layer (tuple): Key and value of resolved layer.
+        clear_metadata (bool): Remove metadata keys.
+        exclude_locals (bool): Skip local settings, default behavior is
+            based on 'clear_metadata'.
+        apply_locals_func (callable): Applies local settings on settings.
+    """
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    local_settings = None
+    if not exclude_locals:
+        local_settings = get_local_settings()
+
+    parent_key, parent_value = layer
+    key = (parent_key, clear_metadata, _settings_hash(local_settings))
+    value = _SETTINGS_LAYERS.get(key)
+    if value is None:
+        value = copy_settings_data(parent_value)
+        # Clear overrides metadata from settings
+        if clear_metadata:
+            clear_metadata_from_settings(value)
+
+        # Apply local settings
+        if local_settings is not None:
+            apply_locals_func(value, local_settings)
+        _SETTINGS_LAYERS.set(key, value)
+    return copy_settings_data(value)
 
 
 def load_json_file(fpath):
@@ -898,70 +1023,69 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+def _get_studio_system_settings_layer():
+    return _get_overrides_layer(
+        _get_defaults_layer(SYSTEM_SETTINGS_KEY),
+        get_studio_system_settings_overrides()
+    )
 
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
-    # Apply local settings
-    # Default behavior is based on `clear_metadata` value
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
+def _get_studio_project_settings_layer():
+    return _get_overrides_layer(
+        _get_defaults_layer(PROJECT_SETTINGS_KEY),
+        get_studio_project_settings_overrides()
+    )
 
-    if not exclude_locals:
-        # TODO local settings may be required to apply for environments
-        local_settings = get_local_settings()
-        apply_local_settings_on_system_settings(result, local_settings)
 
-    return result
+def _get_studio_anatomy_settings_layer():
+    return _get_overrides_layer(
+        _get_defaults_layer(PROJECT_ANATOMY_KEY),
+        get_studio_project_anatomy_overrides()
+    )
+
 
+def _replace_keys(source_dict, override_dict):
+    source_dict.update(override_dict)
+    return source_dict
 
-def get_default_project_settings(clear_metadata=True, exclude_locals=None):
-    """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
-    studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
 
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
+def get_system_settings(clear_metadata=True, exclude_locals=None):
+    """System settings with applied studio overrides."""
+    # TODO local settings may be required to apply for environments
+    return _get_output_settings(
+        _get_studio_system_settings_layer(),
+        clear_metadata,
+        exclude_locals,
+        apply_local_settings_on_system_settings
+    )
 
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, None
+
+def get_default_project_settings(clear_metadata=True, exclude_locals=None):
+    """Project settings with applied studio's default project overrides."""
+    return _get_output_settings(
+        _get_studio_project_settings_layer(),
+        clear_metadata,
+        exclude_locals,
+        lambda values, local_settings: (
+            apply_local_settings_on_project_settings(
+                values, local_settings, None
+            )
         )
-    return result
+    )
 
 
 def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
     """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
-    studio_values = get_studio_project_anatomy_overrides()
-
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, None
+    return _get_output_settings(
+        _get_studio_anatomy_settings_layer(),
+        clear_metadata,
+        exclude_locals,
+        lambda values, local_settings: (
+            apply_local_settings_on_anatomy_settings(
+                values, local_settings, None
+            )
         )
-    return result
+    )
 
 
 def get_anatomy_settings(
@@ -974,30 +1098,24 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
-    project_overrides = get_project_anatomy_overrides(
-        project_name
+    # Project overrides replace whole keys of studio anatomy
+    project_layer = _get_overrides_layer(
+        _get_studio_anatomy_settings_layer(),
+        get_project_anatomy_overrides(project_name),
+        _replace_keys
     )
-    result = copy.deepcopy(studio_overrides)
-    if project_overrides:
-        for key, value in project_overrides.items():
-            result[key] = value
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, project_name, site_name
+    # Layer key must contain project as local settings are project specific
+    layer_key, layer_value = project_layer
+    return _get_output_settings(
+        ((layer_key, project_name, site_name), layer_value),
+        clear_metadata,
+        exclude_locals,
+        lambda values, local_settings: (
+            apply_local_settings_on_anatomy_settings(
+                values, local_settings, project_name, site_name
+            )
         )
-
-    return result
+    )
 
 
 def get_project_settings(
@@ -1010,28 +1128,22 @@ def get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
+    project_layer = _get_overrides_layer(
+        _get_studio_project_settings_layer(),
+        get_project_settings_overrides(project_name)
     )
-
-    result = apply_overrides(studio_overrides, project_overrides)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
+    # Layer key must contain project as local settings are project specific
+    layer_key, layer_value = project_layer
+    return _get_output_settings(
+        ((layer_key, project_name), layer_value),
+        clear_metadata,
+        exclude_locals,
+        lambda values, local_settings: (
+            apply_local_settings_on_project_settings(
+                values, local_settings, project_name
+            )
         )
-
-    return result
+    )
 
 
 def get_current_project_settings():
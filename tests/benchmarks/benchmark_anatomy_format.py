@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of 'Anatomy.format' and 'Anatomy.format_all'.
+
+Anatomies and template data are shared with unit tests of anatomy
+formatting. Benchmark is not collected by pytest and must be executed
+directly with number of calls per case as optional argument.
+    python tests/benchmarks/benchmark_anatomy_format.py 1000
+"""
+import os
+import sys
+import copy
+import timeit
+import contextlib
+
+from openpype.lib import anatomy as anatomy_lib
+from openpype.lib.python_module_tools import import_filepath
+
+TESTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "unit", "openpype", "lib", "test_anatomy_format.py"
+)
+anatomy_tests = import_filepath(TESTS_PATH)
+
+
+@contextlib.contextmanager
+def project_anatomy(anatomy_data):
+    """Anatomy of project created from passed anatomy data."""
+    get_anatomy_settings = anatomy_lib.get_anatomy_settings
+    anatomy_lib.get_anatomy_settings = (
+        lambda *args, **kwargs: copy.deepcopy(anatomy_data)
+    )
+    try:
+        yield anatomy_lib.Anatomy("Sandbox")
+    finally:
+        anatomy_lib.get_anatomy_settings = get_anatomy_settings
+
+
+def benchmark(anatomy, number):
+    data = anatomy_tests.get_template_data()
+    templates_obj = anatomy.templates_obj
+
+    def format_eager():
+        copy_data = copy.deepcopy(data)
+        copy_data["root"] = anatomy.roots
+        templates_obj._solve_dict(templates_obj.objected_templates, copy_data)
+
+    cases = (
+        ("format publish path (eager)", format_eager),
+        ("format publish path", lambda: anatomy.format(data)["publish"][
+            "path"
+        ]),
+        ("format_all get_solved", lambda: anatomy.format_all(
+            data
+        ).get_solved()),
+    )
+    for label, func in cases:
+        duration = timeit.timeit(func, number=number)
+        print("    {:<30} {:>8.3f} ms/call".format(
+            label, (duration / number) * 1000
+        ))
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    anatomies = (
+        ("Default anatomy", anatomy_tests.get_default_anatomy_data()),
+        ("Studio anatomy", anatomy_tests.get_studio_anatomy_data()),
+    )
+    for label, anatomy_data in anatomies:
+        print(label)
+        with project_anatomy(anatomy_data) as anatomy:
+            benchmark(anatomy, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 """Test suite for repos bootstrapping (install)."""
 import os
 import sys
+import hashlib
 from collections import namedtuple
 from pathlib import Path
 from zipfile import ZipFile
@@ -12,6 +13,7 @@ import pytest
 
 from igniter.bootstrap_repos import BootstrapRepos
 from igniter.bootstrap_repos import OpenPypeVersion
+from igniter.bootstrap_repos import VersionIndex
 from igniter.user_settings import OpenPypeSettingsRegistry
 
 
@@ -388,3 +390,40 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def test_version_index(tmp_path):
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    zip_path.write_bytes(b"zip")
+    index_path = tmp_path / "index" / "version_index.json"
+
+    index = VersionIndex(index_path)
+    assert index.get(zip_path, "validation") is None
+    index.set(zip_path, "validation", (True, "All ok"))
+    index.save()
+
+    # index is loaded from disk by new instance
+    index = VersionIndex(index_path)
+    assert index.get(zip_path, "validation") == (True, "All ok")
+    assert index.get(zip_path, "version:3.0.0") is None
+
+    # changed file must be checked again
+    zip_path.write_bytes(b"changed zip")
+    assert index.get(zip_path, "validation") is None
+
+
+def test_validate_zip_checksums(fix_bootstrap, tmp_path):
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    files = {
+        "openpype/version.py": b"__version__ = '3.0.0'",
+        "openpype/lib.py": b"print('lib')",
+    }
+    with ZipFile(zip_path, "w") as zip_file:
+        checksums = []
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+            checksums.append("{}:{}".format(
+                hashlib.sha256(content).hexdigest(), name))
+        zip_file.writestr("checksums", "\n".join(checksums))
+
+    assert fix_bootstrap._validate_zip(zip_path)[0]
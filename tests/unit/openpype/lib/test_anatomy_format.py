@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Test suite for formatting of Anatomy templates."""
+import os
+import copy
+import json
+
+import pytest
+from openpype.lib import anatomy as anatomy_lib
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+    LazyTemplateValue,
+)
+
+DEFAULTS_DIR = os.path.join(
+    os.path.dirname(anatomy_lib.__file__),
+    "..", "settings", "defaults", "project_anatomy"
+)
+
+
+def _load_default(name):
+    with open(os.path.join(DEFAULTS_DIR, name + ".json"), "r") as stream:
+        return json.load(stream)
+
+
+def get_default_anatomy_data():
+    return {
+        "templates": _load_default("templates"),
+        "roots": _load_default("roots"),
+    }
+
+
+def get_studio_anatomy_data():
+    """Anatomy of studio with multiple roots and many delivery templates."""
+    anatomy_data = get_default_anatomy_data()
+    anatomy_data["roots"]["publish"] = {
+        "windows": "P:/projects",
+        "darwin": "/Volumes/publish",
+        "linux": "/mnt/publish/projects"
+    }
+    templates = anatomy_data["templates"]
+    for key in ("publish", "render", "hero"):
+        templates[key]["folder"] = templates[key]["folder"].replace(
+            "{root[work]}", "{root[publish]}"
+        )
+    templates["delivery"] = {
+        "delivery_{}".format(idx): (
+            "{root[publish]}/delivery/{project[code]}/{asset}"
+            "/{subset}_{@version}_" + str(idx) + "<.{@frame}>.{ext}"
+        )
+        for idx in range(40)
+    }
+    templates["others"] = {
+        "simple_{}".format(idx): {
+            "folder": "{root[work]}/{project[name]}/{hierarchy}/" + str(idx),
+            "file": "{asset}_{task[name]}_{@version}<_{comment}>.{ext}",
+            "path": "{@folder}/{@file}"
+        }
+        for idx in range(20)
+    }
+    return anatomy_data
+
+
+def get_template_data():
+    return {
+        "project": {"name": "Sandbox", "code": "sb"},
+        "hierarchy": "shots/sq01",
+        "asset": "sh010",
+        "task": {"name": "compositing", "type": "Compositing"},
+        "family": "render",
+        "subset": "renderCompositingMain",
+        "version": 12,
+        "frame": 1001,
+        "ext": "exr",
+        "representation": "exr",
+        "_id": "0123456789",
+        "thumbnail_root": "/mnt/thumbnails",
+        "thumbnail_type": "thumbnail",
+    }
+
+
+def create_anatomy(monkeypatch, anatomy_data):
+    monkeypatch.setattr(
+        anatomy_lib, "get_anatomy_settings",
+        lambda *args, **kwargs: copy.deepcopy(anatomy_data)
+    )
+    return anatomy_lib.Anatomy("Sandbox")
+
+
+@pytest.fixture
+def anatomy(monkeypatch):
+    yield create_anatomy(monkeypatch, get_studio_anatomy_data())
+
+
+def test_lazy_format_matches_eager(anatomy):
+    data = get_template_data()
+    filled = anatomy.format(data)
+
+    templates_obj = anatomy.templates_obj
+    copy_data = copy.deepcopy(data)
+    copy_data["root"] = anatomy.roots
+    expected = templates_obj._solve_dict(
+        templates_obj.objected_templates, copy_data
+    )
+    for key in ("publish", "work", "delivery", "simple_0"):
+        assert filled[key] == expected[key]
+
+    publish_path = filled["publish"]["path"]
+    assert publish_path == expected["publish"]["path"]
+    assert publish_path.rootless == expected["publish"]["path"].rootless
+    assert publish_path.rootless.startswith("{root[publish]}/Sandbox")
+
+
+def test_only_accessed_keys_are_formatted(anatomy):
+    filled = anatomy.format(get_template_data())
+    filled["publish"]["path"]
+
+    raw_value = dict.__getitem__(filled, "work")
+    assert isinstance(raw_value, LazyTemplateValue)
+    raw_value = dict.__getitem__(filled["publish"], "folder")
+    assert isinstance(raw_value, LazyTemplateValue)
+
+    # Iteration through values solves all of them
+    solved = dict(filled["work"])
+    assert not any(
+        isinstance(value, LazyTemplateValue)
+        for value in solved.values()
+    )
+
+
+def test_result_does_not_change_with_data(anatomy):
+    data = get_template_data()
+    filled = anatomy.format(data)
+    data["asset"] = "sh020"
+
+    assert "/sh010/" in filled["publish"]["folder"]
+
+
+def test_strict_and_format_all(anatomy):
+    data = get_template_data()
+    data.pop("frame")
+    data.pop("version")
+
+    filled = anatomy.format(data)
+    with pytest.raises(TemplateUnsolved):
+        filled["publish"]["path"]
+
+    filled_all = anatomy.format_all(data)
+    assert not filled_all["publish"]["path"].solved
+    solved = filled_all.get_solved()
+    assert "path" not in solved["publish"]
+    assert solved["publish"]["thumbnail"].solved
+
+
+def test_parsed_templates_are_shared():
+    template = "{root[work]}/{project[name]}<_{comment}>.{ext}"
+    first = StringTemplate(template)
+    second = StringTemplate(template)
+
+    assert first._parts is second._parts
+    assert first.format({"ext": "exr"}) == second.format({"ext": "exr"})
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Test suite for events callbacks registry."""
+import pytest
+from openpype.lib import events
+
+
+@pytest.fixture
+def callbacks_registry(monkeypatch):
+    registry = events.StoredCallbacks
+    monkeypatch.setattr(
+        registry, "_exact_callbacks", events.collections.defaultdict(list)
+    )
+    monkeypatch.setattr(registry, "_prefix_root", events._TopicPrefixNode())
+    monkeypatch.setattr(registry, "_pattern_callbacks", [])
+    monkeypatch.setattr(registry, "_callbacks_by_topic", {})
+    yield registry
+
+
+class Listener(object):
+    def __init__(self):
+        self.triggered = []
+
+    def on_event(self, event):
+        self.triggered.append(event.topic)
+
+
+def test_topics_matching(callbacks_registry):
+    listeners = {
+        topic: Listener()
+        for topic in ("workfile.save", "workfile.*", "*", "a*e", "save")
+    }
+    for topic, listener in listeners.items():
+        events.register_event_callback(topic, listener.on_event)
+
+    for topic in ("workfile.save", "workfile.", "save", "ae", "abe"):
+        events.emit_event(topic)
+
+    assert listeners["workfile.save"].triggered == ["workfile.save"]
+    assert listeners["workfile.*"].triggered == ["workfile.save"]
+    assert listeners["*"].triggered == [
+        "workfile.save", "workfile.", "save", "ae", "abe"
+    ]
+    assert listeners["a*e"].triggered == ["abe"]
+    assert listeners["save"].triggered == ["save"]
+
+
+def test_order_and_removal(callbacks_registry):
+    order = []
+    first = Listener()
+    second = Listener()
+    first.on_event = lambda event: order.append("first")
+    second.on_event = lambda event: order.append("second")
+
+    callback = events.register_event_callback("*", second.on_event)
+    events.register_event_callback("topic", first.on_event)
+    events.emit_event("topic")
+    assert order == ["second", "first"]
+
+    callback.deregister()
+    events.emit_event("topic")
+    assert order == ["second", "first", "first"]
+    assert callback not in callbacks_registry.get_callbacks()
+
+
+def test_queued_emit_and_metrics(callbacks_registry):
+    listener = Listener()
+    events.register_event_callback("queued.*", listener.on_event)
+
+    for idx in range(10):
+        events.emit_event("queued.{}".format(idx), queued=True)
+    events.wait_for_queued_events()
+
+    assert listener.triggered == ["queued.{}".format(idx) for idx in range(10)]
+    metrics = events.get_event_callbacks_metrics()
+    assert metrics[0]["topic"] == "queued.*"
+    assert metrics[0]["count"] == 10
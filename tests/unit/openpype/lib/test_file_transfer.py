@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transfer engine."""
+import os
+import hashlib
+
+import pytest
+from openpype.lib.file_hash_index import FileHashIndex
+from openpype.lib.file_transfer import (
+    FileTransferEngine,
+    FileTransferError
+)
+
+
+@pytest.fixture
+def source_files(tmpdir):
+    src_dir = tmpdir.mkdir("src")
+    paths = []
+    for idx in range(10):
+        path = src_dir.join("file.{:04d}.exr".format(idx))
+        path.write_binary(os.urandom(1024 * (idx + 1)))
+        paths.append(str(path))
+    yield paths
+
+
+def test_parallel_copy_with_checksum(tmpdir, source_files):
+    dst_dir = tmpdir.join("publish")
+    engine = FileTransferEngine(
+        max_workers=4,
+        checksum_algorithm="sha256",
+        chunk_size=1000,
+        roots={"work": str(dst_dir)}
+    )
+    for src in source_files:
+        engine.add_transfer(
+            src, str(dst_dir.join("v001", os.path.basename(src)))
+        )
+    report = engine.process()
+
+    checksums = report.get_checksums()
+    sizes = report.get_file_sizes()
+    assert len(sizes) == len(source_files)
+    for src in source_files:
+        dst = os.path.normpath(
+            str(dst_dir.join("v001", os.path.basename(src)))
+        )
+        with open(src, "rb") as stream:
+            expected = hashlib.sha256(stream.read()).hexdigest()
+        assert checksums[dst] == expected
+        assert sizes[dst] == os.path.getsize(src)
+
+    stats = report.get_root_stats()
+    assert list(stats.keys()) == ["work"]
+    assert stats["work"]["files"] == len(source_files)
+
+
+def test_hardlink(tmpdir, source_files):
+    dst = str(tmpdir.join("publish", "file.exr"))
+    engine = FileTransferEngine()
+    engine.add_transfer(source_files[0], dst, mode="hardlink")
+    report = engine.process()
+
+    assert os.path.samefile(source_files[0], dst)
+    assert report.get_root_stats()["other"]["files"] == 1
+
+
+def test_failed_transfer_is_retried(tmpdir, source_files):
+    engine = FileTransferEngine(retries=2, retry_delay=0)
+    engine.add_transfer(
+        str(tmpdir.join("missing.exr")), str(tmpdir.join("dst.exr"))
+    )
+    with pytest.raises(FileTransferError) as exc_info:
+        engine.process()
+    assert len(exc_info.value.failed_transfers) == 1
+
+
+def test_link_existing_published_file(tmpdir, source_files):
+    index = FileHashIndex(str(tmpdir.join("index.db")))
+    src = source_files[0]
+    published = str(tmpdir.join("publish", "v001", "file.exr"))
+
+    engine = FileTransferEngine(checksum_algorithm="sha256")
+    engine.add_transfer(src, published)
+    result = engine.process().get_result(published)
+    index.store_checksums(
+        [(src, result.checksum), (published, result.checksum, result.stat)],
+        "sha256"
+    )
+    index.add_published_files(
+        [(published, result.checksum, result.size)], "sha256"
+    )
+
+    checksum = index.get_checksum(src, "sha256")
+    assert checksum == result.checksum
+    link_src = index.find_published_file(
+        checksum, os.path.getsize(src), "sha256"
+    )
+    assert link_src == published
+
+    republished = str(tmpdir.join("publish", "v002", "file.exr"))
+    engine.add_transfer(src, republished, link_src=link_src)
+    result = engine.process().get_result(republished)
+    assert result.mode == "hardlink"
+    assert os.path.samefile(published, republished)
+
+    # Changed published file is not used anymore
+    os.remove(published)
+    assert index.find_published_file(
+        checksum, os.path.getsize(src), "sha256"
+    ) is None
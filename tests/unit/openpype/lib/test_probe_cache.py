@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of media probe outputs."""
+import os
+
+import pytest
+from openpype.lib.probe_cache import ProbeCache
+
+
+@pytest.fixture
+def media_file(tmpdir):
+    path = tmpdir.join("review.mov")
+    path.write_binary(b"movie")
+    yield str(path)
+
+
+def test_cache_is_invalidated_by_change(media_file):
+    cache = ProbeCache()
+    assert cache.get("ffprobe", media_file) is None
+
+    cache.set("ffprobe", media_file, "{}")
+    assert cache.get("ffprobe", media_file) == "{}"
+    assert cache.get("oiio_info", media_file) is None
+
+    with open(media_file, "ab") as stream:
+        stream.write(b" changed")
+    assert cache.get("ffprobe", media_file) is None
+
+
+def test_disk_store_is_shared(tmpdir, media_file):
+    cache_dir = str(tmpdir.join("cache"))
+    ProbeCache(cache_dir=cache_dir).set("ffprobe", media_file, "{}")
+
+    assert os.listdir(cache_dir)
+    assert ProbeCache(cache_dir=cache_dir).get("ffprobe", media_file) == "{}"
+
+
+def test_lru_limit(tmpdir):
+    cache = ProbeCache(max_items=2)
+    paths = []
+    for idx in range(3):
+        path = tmpdir.join("file{}.exr".format(idx))
+        path.write_binary(b"data")
+        paths.append(str(path))
+        cache.set("oiio_info", str(path), str(idx))
+
+    assert cache.get("oiio_info", paths[0]) is None
+    assert cache.get("oiio_info", paths[2]) == "2"
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test suite for filtering of profiles from settings."""
+import itertools
+
+from openpype.lib.profiles_filtering import (
+    ProfileIndex,
+    filter_profiles,
+    get_profile_index,
+    validate_value_by_regexes,
+)
+
+PROFILES = [
+    {"hosts": [], "families": [], "tasks": [], "name": "default"},
+    {"hosts": ["maya"], "families": ["render"], "tasks": [], "name": "a"},
+    {"hosts": ["ma.*"], "families": [], "tasks": ["comp"], "name": "b"},
+    {"hosts": ["*"], "families": ["review", "plate"], "tasks": [],
+     "name": "c"},
+    {"hosts": ["nuke"], "families": ["render"], "tasks": ["comp.*"],
+     "name": "d"},
+    {"hosts": ["nuke", "maya"], "families": ["render"], "tasks": ["comp"],
+     "name": "e"},
+    {"families": ["plate"], "name": "f"},
+]
+
+
+def _linear_filter(profiles, key_values, keys_order):
+    """Reference implementation scoring all profiles one by one."""
+    best_points = -1
+    matching = []
+    for profile in profiles:
+        points = 0
+        scores = []
+        for key in keys_order:
+            match = validate_value_by_regexes(
+                key_values[key], profile.get(key)
+            )
+            if match == -1:
+                break
+            points += match
+            scores.append(bool(match))
+        else:
+            if points > best_points:
+                best_points = points
+                matching = []
+            if points == best_points:
+                matching.append((profile, scores))
+
+    for idx in range(len(keys_order)):
+        if len(matching) < 2:
+            break
+        filtered = [item for item in matching if item[1][idx]]
+        matching = filtered or [item for item in matching if not item[1][idx]]
+    return matching[0][0] if matching else None
+
+
+def test_index_matches_linear_filter():
+    keys_order = ("hosts", "tasks", "families")
+    index = ProfileIndex(PROFILES)
+    for host, task, family in itertools.product(
+        ("maya", "nuke", "houdini", ""),
+        ("comp", "compositing", "anim", None),
+        ("render", "review", "plate", "model"),
+    ):
+        key_values = {"hosts": host, "tasks": task, "families": family}
+        expected = _linear_filter(PROFILES, key_values, keys_order)
+        # Call twice to validate cached results
+        for _ in range(2):
+            assert index.filter(key_values, keys_order) is expected
+
+
+def test_index_is_reused():
+    profiles = [dict(profile) for profile in PROFILES]
+    index = get_profile_index(profiles)
+
+    assert get_profile_index(profiles) is index
+    assert get_profile_index(list(profiles)) is not index
+    assert filter_profiles(
+        profiles, {"hosts": "maya", "families": "render"}
+    )["name"] == "a"
+    assert filter_profiles([], {"hosts": "maya"}) is None
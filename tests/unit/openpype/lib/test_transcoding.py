@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Test suite for transcoding helpers used by review extractors."""
+import os
+
+import pytest
+from openpype.lib.transcoding import (
+    get_sequence_gaps,
+    link_sequence_gaps,
+    split_frame_range
+)
+
+
+@pytest.fixture
+def sparse_sequence(tmpdir):
+    filenames = ["render.{:04d}.exr".format(idx) for idx in (3, 5, 9)]
+    for filename in filenames:
+        tmpdir.join(filename).write_binary(filename.encode("utf-8"))
+    yield str(tmpdir), filenames
+
+
+def test_gaps_use_previous_frame(sparse_sequence):
+    _, filenames = sparse_sequence
+    gaps = get_sequence_gaps(filenames, 1, 10)
+
+    assert gaps == {
+        "render.0001.exr": "render.0003.exr",
+        "render.0002.exr": "render.0003.exr",
+        "render.0004.exr": "render.0003.exr",
+        "render.0006.exr": "render.0005.exr",
+        "render.0007.exr": "render.0005.exr",
+        "render.0008.exr": "render.0005.exr",
+        "render.0010.exr": "render.0009.exr",
+    }
+    assert get_sequence_gaps(filenames, 5, 5) == {}
+
+
+def test_link_gaps(sparse_sequence):
+    staging_dir, filenames = sparse_sequence
+    gaps = get_sequence_gaps(filenames, 3, 9)
+    created = link_sequence_gaps(staging_dir, gaps)
+
+    assert len(created) == 4
+    with open(os.path.join(staging_dir, "render.0008.exr"), "rb") as stream:
+        assert stream.read() == b"render.0005.exr"
+
+    # Existing files are not created again
+    assert link_sequence_gaps(staging_dir, gaps) == []
+
+
+def test_split_frame_range():
+    shards = split_frame_range(1001, 1100, 8, min_frames=10)
+
+    assert len(shards) == 8
+    assert shards[0][0] == 1001 and shards[-1][1] == 1100
+    for (_, end), (start, _) in zip(shards, shards[1:]):
+        assert start == end + 1
+
+    # Short ranges are not split to shards smaller than min frames
+    assert split_frame_range(1, 15, 8, min_frames=10) == [(1, 15)]
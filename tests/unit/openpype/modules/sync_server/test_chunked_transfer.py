@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Test suite for chunked resumable transfer of sync server providers."""
+import os
+
+import pytest
+from openpype.modules.sync_server.providers.chunked_transfer import (
+    ChunkedTransfer,
+    LocalFileEndpoint,
+    PARTIAL_EXT
+)
+
+
+class BrokenEndpoint(LocalFileEndpoint):
+    """Endpoint failing to write chunk on given offset."""
+    fail_offset = None
+
+    def open_write(self):
+        stream = super(BrokenEndpoint, self).open_write()
+        write = stream.write
+
+        def _write(data):
+            if stream.tell() == self.fail_offset:
+                raise IOError("Connection lost")
+            return write(data)
+
+        class _Stream(object):
+            def __getattr__(self, name):
+                if name == "write":
+                    return _write
+                return getattr(stream, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                stream.close()
+
+        return _Stream()
+
+
+@pytest.fixture
+def source_path(tmpdir):
+    path = tmpdir.join("source.bin")
+    path.write_binary(os.urandom(10 * 1000 + 7))
+    yield str(path)
+
+
+def _transfer(tmpdir, source_path, target_path, partial_factory):
+    return ChunkedTransfer(
+        LocalFileEndpoint(source_path),
+        LocalFileEndpoint(target_path),
+        partial_factory,
+        chunk_size=1000,
+        streams=4,
+        journal_dir=str(tmpdir.join("journals"))
+    )
+
+
+def test_parallel_transfer(tmpdir, source_path):
+    target_path = str(tmpdir.join("target.bin"))
+    transfer = _transfer(tmpdir, source_path, target_path, LocalFileEndpoint)
+
+    assert transfer.transfer() == os.path.getsize(source_path)
+    with open(source_path, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
+    assert not os.path.exists(target_path + PARTIAL_EXT)
+    assert not os.path.exists(transfer.journal_path)
+
+
+def test_resume_interrupted_transfer(tmpdir, source_path):
+    target_path = str(tmpdir.join("target.bin"))
+    BrokenEndpoint.fail_offset = 5000
+    transfer = _transfer(tmpdir, source_path, target_path, BrokenEndpoint)
+    transfer.streams = 1
+    with pytest.raises(IOError):
+        transfer.transfer()
+    assert not os.path.exists(target_path)
+
+    transfer = _transfer(tmpdir, source_path, target_path, LocalFileEndpoint)
+    transferred = transfer.transfer()
+
+    assert transferred == os.path.getsize(source_path) - 5000
+    with open(source_path, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
+
+
+def test_changed_partial_file_is_not_resumed(tmpdir, source_path):
+    target_path = str(tmpdir.join("target.bin"))
+    BrokenEndpoint.fail_offset = 5000
+    transfer = _transfer(tmpdir, source_path, target_path, BrokenEndpoint)
+    transfer.streams = 1
+    with pytest.raises(IOError):
+        transfer.transfer()
+
+    with open(target_path + PARTIAL_EXT, "r+b") as stream:
+        stream.write(b"corrupted")
+
+    transfer = _transfer(tmpdir, source_path, target_path, LocalFileEndpoint)
+    assert transfer.transfer() == os.path.getsize(source_path)
+    with open(source_path, "rb") as src, open(target_path, "rb") as dst:
+        assert src.read() == dst.read()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Test suite for transfer scheduler of sync server."""
+import asyncio
+
+from openpype.modules.sync_server import sync_server
+from openpype.modules.sync_server.scheduler import TransferScheduler
+
+
+def test_transfer_scheduled_until_finished():
+    scheduler = TransferScheduler()
+    key = ("Sandbox", "file_id", "studio")
+
+    async def transfer():
+        return "file_id"
+
+    async def run():
+        task = scheduler.schedule(key, transfer())
+        await task
+        # Result of transfer is not stored in database yet
+        assert scheduler.is_scheduled(key)
+        scheduler.finish(key)
+
+    asyncio.run(run())
+    assert not scheduler.is_scheduled(key)
+
+
+class FakeModule(object):
+    def __init__(self, site_limits):
+        self.site_limits = site_limits
+        self.transfer_scheduler = TransferScheduler()
+
+    def get_provider_for_site(self, site):
+        return "local_drive"
+
+    def get_site_limits(self, project_name, site_name):
+        return self.site_limits[project_name]
+
+
+def test_site_limits_of_projects(monkeypatch):
+    monkeypatch.setattr(
+        sync_server.lib.factory, "get_provider_batch_limit", lambda _: 10
+    )
+    module = FakeModule({
+        "ProjectA": (4, 5.0),
+        "ProjectB": (8, 2.0),
+        "ProjectC": (0, 0),
+    })
+    thread = sync_server.SyncServerThread(module)
+
+    thread._configure_sites({
+        "ProjectA": ("studio", "sftp"),
+        "ProjectB": ("studio", "sftp"),
+    })
+    lane = module.transfer_scheduler._lanes["sftp"]
+    executor = lane.executor
+    assert lane.max_concurrency == 8
+    assert lane.rate_limiter.bytes_per_sec == 5 * 1024 * 1024
+
+    # Same settings in next loop keep executor of site
+    thread._configure_sites({
+        "ProjectB": ("studio", "sftp"),
+        "ProjectA": ("studio", "sftp"),
+    })
+    assert lane.executor is executor
+
+    # Provider default is used and 0 bandwidth means unlimited
+    thread._configure_sites({
+        "ProjectA": ("studio", "sftp"),
+        "ProjectC": ("studio", "sftp"),
+    })
+    assert lane.max_concurrency == 10
+    assert lane.rate_limiter.bytes_per_sec == 0
+    module.transfer_scheduler.shutdown()
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Test suite for incremental queue of synchronized representations."""
+import sys
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+from openpype.modules.sync_server.sync_queue import ProjectSyncQueue
+
+
+class FakeChangeStream(object):
+    def __init__(self):
+        self.alive = True
+        self.changes = []
+
+    def try_next(self):
+        if self.changes:
+            return self.changes.pop(0)
+        return None
+
+    def close(self):
+        self.alive = False
+
+
+class FakeCollection(object):
+    def __init__(self, change_stream=None):
+        self.change_stream = change_stream
+
+    def watch(self, *args, **kwargs):
+        if self.change_stream is None:
+            raise OperationFailure(
+                "Not supported",
+                code=ProjectSyncQueue.CHANGE_STREAM_NOT_SUPPORTED
+            )
+        return self.change_stream
+
+
+class FakeModule(object):
+    def __init__(self, change_stream=None):
+        self.collection = FakeCollection(change_stream)
+        self.connection = self
+        self.database = {"Sandbox": self.collection}
+        self.representations = {}
+        self.full_scans = 0
+        self.checked_ids = []
+
+    def get_sync_representations(
+        self, project_name, local_site, remote_site, representation_ids=None
+    ):
+        if representation_ids is None:
+            self.full_scans += 1
+            return list(self.representations.values())
+
+        self.checked_ids.extend(representation_ids)
+        return [
+            self.representations[repre_id]
+            for repre_id in representation_ids
+            if repre_id in self.representations
+        ]
+
+
+def _add_representation(module, priority=None):
+    repre_id = ObjectId()
+    module.representations[repre_id] = {"_id": repre_id, "priority": priority}
+    return repre_id
+
+
+class MongomockModule(object):
+    """Module querying representations of mongomock database."""
+    def __init__(self):
+        mongomock = pytest.importorskip("mongomock")
+        self.collection = mongomock.MongoClient().db["Sandbox"]
+        self.collection.watch = self._watch
+        self.connection = self
+        self.database = {"Sandbox": self.collection}
+        self.full_scans = 0
+        self.checked_ids = []
+
+    def _watch(self, *args, **kwargs):
+        raise OperationFailure(
+            "Not supported",
+            code=ProjectSyncQueue.CHANGE_STREAM_NOT_SUPPORTED
+        )
+
+    def get_sync_representations(
+        self, project_name, local_site, remote_site, representation_ids=None
+    ):
+        query = {"type": "representation", "pending": True}
+        if representation_ids is None:
+            self.full_scans += 1
+        else:
+            self.checked_ids.extend(representation_ids)
+            query["_id"] = {"$in": representation_ids}
+        return list(self.collection.find(query))
+
+    def write(self, repre_id, pending, last_modified=None):
+        self.collection.update_one(
+            {"_id": repre_id},
+            {"$set": {
+                "type": "representation",
+                "pending": pending,
+                "last_modified": last_modified or datetime.utcnow()
+            }},
+            upsert=True
+        )
+
+
+def test_poll_without_change_stream():
+    module = MongomockModule()
+    queue = ProjectSyncQueue(module, "Sandbox", "studio", "gdrive")
+    first_id = ObjectId()
+    module.write(first_id, True, datetime.utcnow() - timedelta(hours=1))
+    second_id = ObjectId()
+    module.write(second_id, False, datetime.utcnow() - timedelta(hours=1))
+
+    assert [repre["_id"] for repre in queue.get_representations(600)] == [
+        first_id
+    ]
+
+    # Changes of existing representations made by other process are
+    #   found in next loop without full scan
+    module.write(second_id, True)
+    module.write(first_id, False)
+    repres = queue.get_representations(600)
+    assert [repre["_id"] for repre in repres] == [second_id]
+    assert sorted(module.checked_ids) == sorted([first_id, second_id])
+
+    # Representations found in previous loop are not checked again
+    module.checked_ids = []
+    queue.get_representations(600)
+    assert module.checked_ids == []
+
+    # Deleted representation is removed from queue
+    module.collection.delete_one({"_id": second_id})
+    assert queue.get_representations(600) == []
+    assert module.full_scans == 1
+
+
+def test_changes_from_change_stream():
+    change_stream = FakeChangeStream()
+    module = FakeModule(change_stream)
+    queue = ProjectSyncQueue(module, "Sandbox", "studio", "gdrive")
+    first_id = _add_representation(module)
+    queue.get_representations(600)
+
+    second_id = _add_representation(module, priority=100)
+    change_stream.changes.append({
+        "operationType": "update", "documentKey": {"_id": second_id}
+    })
+    repres = queue.get_representations(600)
+
+    assert module.full_scans == 1
+    assert module.checked_ids == [second_id]
+    assert [repre["_id"] for repre in repres] == [second_id, first_id]
+
+    # Closed stream can't be trusted anymore
+    change_stream.alive = False
+    queue.get_representations(600)
+    assert module.full_scans == 2
+
+
+def test_mark_dirty_from_other_thread():
+    module = FakeModule(FakeChangeStream())
+    queue = ProjectSyncQueue(module, "Sandbox", "studio", "gdrive")
+    queue.get_representations(600)
+
+    repre_ids = [ObjectId() for _ in range(5000)]
+
+    def mark_dirty():
+        for repre_id in repre_ids:
+            queue.mark_dirty([repre_id])
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        thread = threading.Thread(target=mark_dirty)
+        thread.start()
+        while thread.is_alive():
+            queue.get_representations(600)
+        thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    queue.get_representations(600)
+
+    assert module.full_scans == 1
+    assert sorted(module.checked_ids) == sorted(repre_ids)
+
+
+@pytest.mark.parametrize("interval", [0, 600])
+def test_invalidate(interval):
+    module = FakeModule(FakeChangeStream())
+    queue = ProjectSyncQueue(module, "Sandbox", "studio", "gdrive")
+    queue.get_representations(interval)
+    queue.invalidate()
+    queue.get_representations(interval)
+
+    assert module.full_scans == 2
+
+
+class RecordingCollection(object):
+    def __init__(self):
+        self.updates = []
+
+    def update_one(self, query, update, **kwargs):
+        self.updates.append(update)
+
+
+def test_site_changes_stamp_last_modified():
+    from pymongo import UpdateOne
+    from openpype.modules.sync_server.sync_server_module import (
+        SyncServerModule
+    )
+
+    module = SyncServerModule.__new__(SyncServerModule)
+    collection = RecordingCollection()
+    module._connection = FakeModule()
+    module._connection.database = {"Sandbox": collection}
+    repre_id = ObjectId()
+    file_id = ObjectId()
+
+    module._update_site(
+        "Sandbox", {"_id": repre_id}, {"$unset": {"files.$[].sites.$[s]": ""}},
+        [{"s.name": "studio"}]
+    )
+    assert collection.updates[0]["$currentDate"] == {"last_modified": True}
+
+    _, operation = module._get_update_operation(
+        None, {"_id": file_id}, {"_id": repre_id}, "studio", priority=100
+    )
+    assert operation == UpdateOne(
+        {"_id": repre_id},
+        {
+            "$set": module._get_priority_dict(100, file_id),
+            "$currentDate": {"last_modified": True}
+        },
+        upsert=True,
+        array_filters=[{"s.name": "studio"}, {"f._id": file_id}]
+    )
+
+    # Progress of transfer doesn't change state of representation
+    _, operation = module._get_update_operation(
+        None, {"_id": file_id}, {"_id": repre_id}, "studio", progress=0.5
+    )
+    assert operation == UpdateOne(
+        {"_id": repre_id},
+        {"$set": module._get_progress_dict(0.5)},
+        upsert=True,
+        array_filters=[{"s.name": "studio"}, {"f._id": file_id}]
+    )
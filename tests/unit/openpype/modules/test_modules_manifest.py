@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached manifest of OpenPype modules."""
+import sys
+
+import pytest
+from openpype.modules import base
+
+
+@pytest.fixture
+def manifest_path(tmpdir, monkeypatch):
+    path = str(tmpdir.join("modules_manifest.json"))
+    monkeypatch.setattr(base, "get_modules_manifest_path", lambda: path)
+    yield path
+
+
+def test_manifest_is_invalidated_by_key(manifest_path):
+    modules = {
+        "ftrack": [{
+            "class_name": "FtrackModule",
+            "name": "ftrack",
+            "settings_key": "ftrack",
+            "interfaces": ["IPluginPaths"]
+        }]
+    }
+    base._save_modules_manifest("key", modules)
+
+    assert base._load_modules_manifest("key") == modules
+    assert base._load_modules_manifest("other_key") is None
+
+
+def test_lazy_module_names():
+    manifest_modules = {
+        "ftrack": [{"name": "ftrack", "settings_key": "ftrack"}],
+        "deadline": [{"name": "deadline", "settings_key": "deadline"}],
+        "launcher_action": [{"name": "launcher_tool", "settings_key": None}],
+        "helpers": [],
+    }
+    modules_settings = {
+        "ftrack": {"enabled": False},
+        "deadline": {"enabled": True},
+    }
+
+    assert base._get_lazy_module_names(
+        manifest_modules, modules_settings
+    ) == {"ftrack"}
+
+
+def test_lazy_modules_by_name():
+    initialized = []
+
+    def _initialize(name):
+        initialized.append(name)
+        return name if name == "ftrack" else None
+
+    modules_by_name = base._LazyModulesByName(_initialize)
+    modules_by_name.lazy_names = {"ftrack", "broken"}
+
+    assert "ftrack" in modules_by_name
+    assert not initialized
+    assert modules_by_name["ftrack"] == "ftrack"
+    assert modules_by_name.get("broken") is None
+    assert modules_by_name.get("missing") is None
+    assert initialized == ["ftrack", "broken"]
+
+
+ADDON_CONTENT = """from openpype.modules import OpenPypeModule
+
+
+class {class_name}(OpenPypeModule):
+    name = "{name}"
+
+    def initialize(self, modules_settings):
+        self.enabled = modules_settings[self.name]["enabled"]
+"""
+
+
+@pytest.fixture
+def modules_dir(tmpdir, monkeypatch, manifest_path):
+    """Directory with enabled and disabled addon and their manifest."""
+    modules_dir = tmpdir.mkdir("modules")
+    manifest_modules = {}
+    for name, class_name in (
+        ("enabled_addon", "EnabledAddon"),
+        ("disabled_addon", "DisabledAddon"),
+    ):
+        modules_dir.join(name + ".py").write(ADDON_CONTENT.format(
+            class_name=class_name, name=name
+        ))
+        manifest_modules[name] = [{
+            "class_name": class_name,
+            "name": name,
+            "settings_key": name,
+            "interfaces": []
+        }]
+    dirpaths = [str(modules_dir)]
+    base._save_modules_manifest(
+        base._get_modules_manifest_key(dirpaths), manifest_modules
+    )
+
+    modules_settings = {
+        "enabled_addon": {"enabled": True},
+        "disabled_addon": {"enabled": False},
+    }
+    monkeypatch.setattr(base, "get_module_dirs", lambda: dirpaths)
+    monkeypatch.setattr(base, "DEFAULT_OPENPYPE_MODULES", ())
+    monkeypatch.setattr(
+        base, "load_openpype_default_settings",
+        lambda: {base.SYSTEM_SETTINGS_KEY: {"modules": modules_settings}}
+    )
+    monkeypatch.setattr(
+        base, "get_studio_system_settings_overrides", lambda: {}
+    )
+    monkeypatch.setattr(
+        base, "get_system_settings", lambda: {"modules": modules_settings}
+    )
+    # Restore loaded modules of other tests
+    for attr_name in ("modules_loaded", "manifest_key", "manifest_modules"):
+        monkeypatch.setattr(
+            base._LoadCache, attr_name, getattr(base._LoadCache, attr_name)
+        )
+    monkeypatch.setitem(
+        sys.modules, "openpype_modules", sys.modules.get("openpype_modules")
+    )
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    base._LoadCache.modules_loaded = False
+    yield str(modules_dir)
+
+
+def test_install_keeps_disabled_modules_lazy(modules_dir, monkeypatch):
+    pytest.importorskip("avalon")
+    import openpype
+
+    monkeypatch.delenv("AVALON_PROJECT", raising=False)
+    openpype.install()
+    try:
+        manager = base.ModulesManager()
+    finally:
+        openpype.uninstall()
+
+    import openpype_modules
+
+    # Manifest tells that disabled module has no settings definitions
+    assert base.get_module_settings_defs() == []
+    assert openpype_modules.is_lazy("disabled_addon")
+    assert not openpype_modules.is_lazy("enabled_addon")
+    assert manager.modules_by_name.lazy_names == {"disabled_addon"}
+    assert manager.modules_by_name["enabled_addon"].enabled
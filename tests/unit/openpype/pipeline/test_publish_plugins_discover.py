@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cached discovery of publish plugins."""
+import os
+import json
+
+import pytest
+from openpype.pipeline.publish import lib
+
+PLUGIN_CONTENT = """
+import pyblish.api
+
+class {name}(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+    targets = {targets}
+
+    def process(self, context):
+        pass
+"""
+
+
+@pytest.fixture
+def plugins_dir(tmpdir, monkeypatch):
+    manifest_path = str(tmpdir.join("publish_plugins_manifest.json"))
+    monkeypatch.setattr(
+        lib, "get_publish_plugins_manifest_path", lambda: manifest_path
+    )
+    monkeypatch.setattr(lib._PublishPluginsCache, "modules", {})
+    monkeypatch.setattr(lib._PublishPluginsCache, "manifest", None)
+
+    dirpath = tmpdir.mkdir("plugins")
+    for name, targets in (
+        ("CollectDefault", ["default"]),
+        ("CollectFarm", ["farm"]),
+    ):
+        dirpath.join(name + ".py").write(
+            PLUGIN_CONTENT.format(name=name, targets=targets)
+        )
+    yield str(dirpath), manifest_path
+
+
+def _plugin_names(result):
+    return sorted(plugin.__name__ for plugin in result.plugins)
+
+
+def test_modules_are_reused(plugins_dir):
+    dirpath, manifest_path = plugins_dir
+    first = lib.publish_plugins_discover([dirpath])
+    second = lib.publish_plugins_discover([dirpath])
+
+    assert _plugin_names(first) == ["CollectDefault", "CollectFarm"]
+    assert first.plugins[0] is second.plugins[0]
+
+    with open(manifest_path, "r") as stream:
+        manifest = json.load(stream)
+    filepath = os.path.join(dirpath, "CollectFarm.py")
+    assert manifest["files"][filepath]["plugins"][0]["targets"] == ["farm"]
+
+
+def test_targets_skip_files_by_manifest(plugins_dir):
+    dirpath, _ = plugins_dir
+    lib.publish_plugins_discover([dirpath])
+
+    # New process with existing manifest
+    lib._PublishPluginsCache.modules.clear()
+    lib._PublishPluginsCache.manifest = None
+    result = lib.publish_plugins_discover([dirpath], targets=["farm"])
+    assert _plugin_names(result) == ["CollectFarm"]
+
+    # Changed file is executed again
+    filepath = os.path.join(dirpath, "CollectDefault.py")
+    with open(filepath, "a") as stream:
+        stream.write("\n# changed\n")
+    os.utime(filepath, (0, 0))
+    result = lib.publish_plugins_discover([dirpath], targets=["farm"])
+    assert _plugin_names(result) == ["CollectDefault", "CollectFarm"]
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Test suite for publish runner with concurrent instances."""
+import time
+import threading
+from multiprocessing.pool import ThreadPool
+
+import pyblish.api
+from openpype.pipeline.publish import runner
+from openpype.pipeline.publish.runner import publish_iter
+
+PROCESSED = []
+
+
+class CollectInstances(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for idx in range(4):
+            instance = context.create_instance("render{}".format(idx))
+            instance.data["family"] = "render"
+
+
+class ExtractConcurrent(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    families = ["render"]
+    concurrent_instances = True
+
+    def process(self, instance):
+        self.log.info(instance.name)
+        time.sleep(0.2)
+        PROCESSED.append(
+            (self.__class__.__name__, threading.current_thread().ident)
+        )
+
+
+class ExtractWithPool(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    families = ["render"]
+    concurrent_instances = True
+    cpu_budget = 0
+
+    def process(self, instance):
+        instance.data["cpuBudget"] = self.cpu_budget
+        pool = ThreadPool(2)
+        try:
+            pool.map(self._log_job, [
+                "{} job {}".format(instance.name, idx)
+                for idx in range(2)
+            ])
+        finally:
+            pool.close()
+            pool.join()
+
+    def _log_job(self, message):
+        time.sleep(0.05)
+        self.log.info(message)
+
+
+class IntegrateSequential(pyblish.api.InstancePlugin):
+    order = pyblish.api.IntegratorOrder
+    families = ["render"]
+
+    def process(self, instance):
+        PROCESSED.append(
+            (self.__class__.__name__, threading.current_thread().ident)
+        )
+
+
+class ValidateFailing(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    families = ["render"]
+    concurrent_instances = True
+
+    def process(self, instance):
+        raise ValueError("Invalid")
+
+
+def test_concurrent_instances():
+    del PROCESSED[:]
+    plugins = [CollectInstances, ExtractConcurrent, IntegrateSequential]
+
+    results = list(publish_iter(plugins=plugins, workers=4))
+
+    assert not any(result["error"] for result in results)
+    assert [result["plugin"] for result in results] == (
+        [CollectInstances] + [ExtractConcurrent] * 4
+        + [IntegrateSequential] * 4
+    )
+    # Records are separated per instance
+    for result in results[1:5]:
+        assert [record.getMessage() for record in result["records"]] == [
+            result["instance"].name
+        ]
+    # Next plugin starts when all instances of previous one are done
+    assert [item[0] for item in PROCESSED] == (
+        ["ExtractConcurrent"] * 4 + ["IntegrateSequential"] * 4
+    )
+    main_thread_id = threading.current_thread().ident
+    assert all(item[1] != main_thread_id for item in PROCESSED[:4])
+    assert all(item[1] == main_thread_id for item in PROCESSED[4:])
+
+
+def test_failed_validation_stops_publish():
+    plugins = [CollectInstances, ValidateFailing, IntegrateSequential]
+    results = list(publish_iter(plugins=plugins, workers=4))
+
+    assert len(results) == 5
+    assert all(result["error"] for result in results[1:])
+
+
+def test_records_of_child_threads(monkeypatch):
+    monkeypatch.setattr(runner, "_get_cpu_count", lambda: 8)
+    plugins = [CollectInstances, ExtractWithPool]
+    results = list(publish_iter(plugins=plugins, workers=4))
+
+    for result in results[1:]:
+        instance = result["instance"]
+        assert sorted(
+            record.getMessage() for record in result["records"]
+        ) == ["{} job {}".format(instance.name, idx) for idx in range(2)]
+        # Cpu cores are shared between concurrently processed instances
+        assert instance.data["cpuBudget"] == 2
+    assert ExtractWithPool.cpu_budget == 0
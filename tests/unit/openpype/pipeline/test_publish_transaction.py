@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched database writes of publishing."""
+import os
+import copy
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, ReplaceOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from openpype.pipeline.publish.transaction import PublishTransaction
+
+
+class FakeSession(object):
+    def __init__(self, client):
+        self.client = client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def with_transaction(self, callback):
+        if not self.client.replica_set:
+            raise OperationFailure(
+                "Transaction numbers are only allowed on a replica set"
+                " member or mongos",
+                code=20
+            )
+        collection = self.client.collection
+        written = list(collection.written)
+        try:
+            callback(self)
+        except Exception:
+            # Aborted transaction
+            collection.written = written
+            raise
+        self.client.transactions += 1
+
+
+class FakeClient(object):
+    def __init__(self, collection, replica_set):
+        self.collection = collection
+        self.replica_set = replica_set
+        self.transactions = 0
+
+    def start_session(self):
+        return FakeSession(self)
+
+
+class FakeDatabase(object):
+    def __init__(self, client):
+        self.client = client
+
+
+class FakeCollection(object):
+    def __init__(
+        self, fail=False, fail_at=None, replica_set=False, stored_docs=None,
+        fail_revert=False
+    ):
+        self.fail = fail
+        self.fail_at = fail_at
+        self.fail_revert = fail_revert
+        self.stored_docs = list(stored_docs or [])
+        self.written = []
+        self.reverted = []
+        self.database = FakeDatabase(FakeClient(self, replica_set))
+
+    def find(self, query):
+        doc_ids = query["_id"]["$in"]
+        return [doc for doc in self.stored_docs if doc["_id"] in doc_ids]
+
+    def bulk_write(self, operations, ordered=True, session=None):
+        if self.fail:
+            raise RuntimeError("Write failed")
+
+        # Only revert of operations is unordered
+        if not ordered:
+            if self.fail_revert:
+                raise RuntimeError("Revert failed")
+            self.reverted.extend(operations)
+            return
+
+        if self.fail_at is not None:
+            self.written.extend(operations[:self.fail_at])
+            raise BulkWriteError({
+                "writeErrors": [{
+                    "index": self.fail_at,
+                    "code": 11000,
+                    "errmsg": "Duplicate key"
+                }],
+                "nInserted": 1,
+                "nModified": self.fail_at - 1,
+                "nRemoved": 0
+            })
+        self.written.extend(operations)
+
+
+class FakeDbcon(object):
+    def __init__(self, docs=None, fail=False, **kwargs):
+        self.docs = list(docs or [])
+        self.collection = FakeCollection(fail, **kwargs)
+        self.database = {"Sandbox": self.collection}
+
+    def find(self, query):
+        return [
+            doc
+            for doc in self.docs
+            if all(doc.get(key) == value for key, value in query.items())
+        ]
+
+    def find_one(self, query):
+        for doc in self.find(query):
+            return doc
+        return None
+
+
+def _create_tmp_file(tmpdir, filename):
+    path = str(tmpdir.join(filename + ".tmp"))
+    with open(path, "w") as stream:
+        stream.write(filename)
+    return path
+
+
+@pytest.fixture
+def version_doc():
+    return {
+        "_id": ObjectId(),
+        "type": "version",
+        "parent": ObjectId(),
+        "name": 1,
+        "data": {"comment": ""}
+    }
+
+
+def test_stage_and_commit(tmpdir, version_doc):
+    dbcon = FakeDbcon([version_doc])
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    file_path = _create_tmp_file(tmpdir, "render.exr")
+
+    transaction.get_document(version_doc["_id"])
+    repre_id = transaction.insert_one({
+        "type": "representation", "parent": version_doc["_id"]
+    })
+    transaction.update_one(version_doc["_id"], {"data.comment": "Fix"})
+    transaction.add_files([file_path])
+
+    # Staged changes are visible through transaction but not written
+    assert transaction.get_document(version_doc["_id"])["data"] == {
+        "comment": "Fix"
+    }
+    assert [
+        doc["_id"]
+        for doc in transaction.get_representations(version_doc["_id"])
+    ] == [repre_id]
+    assert not dbcon.collection.written
+    assert os.path.exists(file_path)
+
+    transaction.commit()
+
+    assert len(dbcon.collection.written) == 2
+    assert not transaction.operations
+    assert not os.path.exists(file_path)
+    assert os.path.exists(file_path[:-len(".tmp")])
+
+
+def test_failed_commit_removes_files(tmpdir):
+    dbcon = FakeDbcon(fail=True)
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    file_path = _create_tmp_file(tmpdir, "render.exr")
+    transaction.insert_one({
+        "type": "subset", "parent": ObjectId(), "name": "renderMain"
+    })
+    transaction.add_files([file_path])
+
+    with pytest.raises(RuntimeError):
+        transaction.commit()
+
+    assert not os.path.exists(file_path)
+    assert not os.path.exists(file_path[:-len(".tmp")])
+
+
+def test_rollback(tmpdir):
+    dbcon = FakeDbcon()
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    file_paths = []
+    for filename in ("first.exr", "second.exr"):
+        transaction.start_group()
+        file_path = _create_tmp_file(tmpdir, filename)
+        transaction.insert_one({"type": "representation"})
+        transaction.add_files([file_path])
+        file_paths.append(file_path)
+
+    transaction.rollback()
+
+    assert transaction.rolled_back
+    assert not transaction.operations
+    assert not transaction.file_urls
+    assert not any(os.path.exists(path) for path in file_paths)
+
+    transaction.commit()
+    assert not dbcon.collection.written
+
+
+def test_discard_group(tmpdir, version_doc):
+    dbcon = FakeDbcon([version_doc])
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    first_path = _create_tmp_file(tmpdir, "first.exr")
+    second_path = _create_tmp_file(tmpdir, "second.exr")
+    transaction.get_document(version_doc["_id"])
+
+    transaction.start_group()
+    transaction.update_one(version_doc["_id"], {"data.comment": "First"})
+    transaction.add_files([first_path])
+
+    transaction.start_group()
+    transaction.update_one(version_doc["_id"], {"data.comment": "Second"})
+    subset_id = transaction.insert_one({
+        "type": "subset", "parent": ObjectId(), "name": "renderMain"
+    })
+    transaction.add_files([second_path])
+    transaction.discard_group()
+
+    # Only operations and files of the last group are discarded
+    assert len(transaction.operations) == 1
+    assert transaction.file_urls == [first_path]
+    assert transaction.get_document(version_doc["_id"])["data"] == {
+        "comment": "First"
+    }
+    assert transaction.get_document(subset_id) is None
+    assert not transaction.rolled_back
+
+
+def test_commit_stamps_representations(version_doc):
+    dbcon = FakeDbcon([version_doc])
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    repre_id = transaction.insert_one({
+        "type": "representation", "parent": version_doc["_id"]
+    })
+    subset_id = transaction.insert_one({
+        "type": "subset", "parent": ObjectId(), "name": "main"
+    })
+
+    transaction.commit()
+
+    # Sync server polls representations by time of their last write
+    assert "last_modified" in transaction.get_document(repre_id)
+    assert "last_modified" not in transaction.get_document(subset_id)
+
+
+def _stage_failing_commit(tmpdir, dbcon, version_doc, subset_id=None):
+    transaction = PublishTransaction(dbcon, "Sandbox", "tmp")
+    file_path = _create_tmp_file(tmpdir, "render.exr")
+    transaction.get_document(version_doc["_id"])
+    repre_id = transaction.insert_one({
+        "type": "representation", "parent": version_doc["_id"]
+    })
+    transaction.update_one(version_doc["_id"], {"data.comment": "Fix"})
+    if subset_id is not None:
+        # Document which is not cached by transaction
+        transaction.update_one(subset_id, {"name": "renderMain"})
+    # Fails with duplicate key
+    transaction.insert_one({"_id": repre_id, "type": "representation"})
+    transaction.add_files([file_path])
+    return transaction, file_path, repre_id
+
+
+def test_commit_in_transaction(tmpdir, version_doc):
+    dbcon = FakeDbcon([version_doc], fail_at=2, replica_set=True)
+    transaction, file_path, _ = _stage_failing_commit(
+        tmpdir, dbcon, version_doc
+    )
+
+    with pytest.raises(BulkWriteError):
+        transaction.commit()
+
+    assert not dbcon.collection.written
+    assert not dbcon.collection.reverted
+    assert not os.path.exists(file_path)
+
+    dbcon.collection.fail_at = None
+    transaction.insert_one({"type": "representation"})
+    transaction.commit()
+    assert dbcon.collection.database.client.transactions == 1
+    assert len(dbcon.collection.written) == 1
+
+
+def test_revert_applied_operations(tmpdir, version_doc):
+    subset_doc = {"_id": ObjectId(), "type": "subset", "name": "main"}
+    dbcon = FakeDbcon(
+        [copy.deepcopy(version_doc)], fail_at=3, stored_docs=[subset_doc]
+    )
+    transaction, file_path, repre_id = _stage_failing_commit(
+        tmpdir, dbcon, version_doc, subset_doc["_id"]
+    )
+
+    with pytest.raises(BulkWriteError):
+        transaction.commit()
+
+    assert len(dbcon.collection.written) == 3
+    assert dbcon.collection.reverted == [
+        DeleteOne({"_id": repre_id}),
+        ReplaceOne({"_id": version_doc["_id"]}, version_doc, upsert=True),
+        ReplaceOne({"_id": subset_doc["_id"]}, subset_doc, upsert=True)
+    ]
+    assert not os.path.exists(file_path)
+    assert not os.path.exists(file_path[:-len(".tmp")])
+
+
+def test_failed_revert_finalizes_files(tmpdir, version_doc):
+    dbcon = FakeDbcon([version_doc], fail_at=2, fail_revert=True)
+    transaction, file_path, _ = _stage_failing_commit(
+        tmpdir, dbcon, version_doc
+    )
+
+    with pytest.raises(BulkWriteError):
+        transaction.commit()
+
+    # Written documents keep their files
+    assert not os.path.exists(file_path)
+    assert os.path.exists(file_path[:-len(".tmp")])
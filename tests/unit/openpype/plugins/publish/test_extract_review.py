@@ -1,3 +1,9 @@
+import os
+
+import pytest
+import pyblish.api
+
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +33,114 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+@pytest.fixture
+def review_instance(tmpdir, monkeypatch):
+    staging_dir = tmpdir.mkdir("staging")
+    files = []
+    for frame in range(1001, 1004):
+        filename = "render.{}.exr".format(frame)
+        staging_dir.join(filename).write("")
+        files.append(filename)
+
+    monkeypatch.setenv("AVALON_TASK", "compositing")
+    context = pyblish.api.Context()
+    context.data["hostName"] = "shell"
+    context.data["project_settings"] = {
+        "global": {"publish": {"ExtractBurnin": {"enabled": True}}}
+    }
+    instance = context.create_instance("renderMain")
+    instance.data.update({
+        "family": "review",
+        "anatomyData": {},
+        "frameStart": 1001,
+        "frameEnd": 1003,
+        "handleStart": 0,
+        "handleEnd": 0,
+        "fps": 25,
+        "representations": [{
+            "name": "exr",
+            "ext": "exr",
+            "files": files,
+            "stagingDir": str(staging_dir),
+            "tags": ["review"]
+        }]
+    })
+    yield instance
+
+
+def _mock_review_encode(plugin, tmpdir, monkeypatch, do_convert):
+    transcode_dir = str(tmpdir.join("transcode"))
+
+    def convert_for_ffmpeg(first_input_path, output_dir, *args, **kwargs):
+        os.makedirs(output_dir)
+        for frame in range(1001, 1004):
+            filename = "render.{}.exr".format(frame)
+            open(os.path.join(output_dir, filename), "w").close()
+
+    def argument_parts(output_def, instance, new_repre, temp_data, fill):
+        input_path = os.path.join(
+            new_repre["stagingDir"], temp_data["origin_repre"]["files"][0]
+        )
+        temp_data["output_ext_is_image"] = False
+        new_repre["ext"] = "mov"
+        new_repre["resolutionWidth"] = 1920
+        new_repre["resolutionHeight"] = 1080
+        return (
+            ["-i \"{}\"".format(input_path)], [], [], ["-y", "output.mov"]
+        )
+
+    monkeypatch.setattr(
+        extract_review, "should_convert_for_ffmpeg", lambda path: do_convert
+    )
+    monkeypatch.setattr(
+        extract_review, "convert_for_ffmpeg", convert_for_ffmpeg
+    )
+    monkeypatch.setattr(
+        extract_review, "get_transcode_temp_directory", lambda: transcode_dir
+    )
+    monkeypatch.setattr(
+        plugin, "_get_outputs_for_instance",
+        lambda instance: [{"filename_suffix": "h264", "tags": ["burnin"]}]
+    )
+    monkeypatch.setattr(plugin, "_ffmpeg_argument_parts", argument_parts)
+    return transcode_dir
+
+
+@pytest.mark.parametrize("do_convert", [False, True])
+def test_fuse_burnins_with_converted_input(
+    review_instance, tmpdir, monkeypatch, do_convert
+):
+    """Converted input is removed by ExtractReview so it can't be fused."""
+    plugin = ExtractReview()
+    plugin.fuse_burnins = True
+    plugin.ffmpeg_path = "ffmpeg"
+    transcode_dir = _mock_review_encode(
+        plugin, tmpdir, monkeypatch, do_convert
+    )
+
+    encoded = []
+
+    def run_output_jobs(output_jobs):
+        for output_job in output_jobs:
+            if "review_encode" in output_job["new_repre"]:
+                continue
+            # Input must exist when ffmpeg runs
+            input_path = output_job["input_args"][0][4:-1]
+            assert os.path.exists(input_path)
+            encoded.append(output_job["new_repre"]["outputName"])
+
+    monkeypatch.setattr(plugin, "run_output_jobs", run_output_jobs)
+    plugin.process(review_instance)
+
+    new_repre = review_instance.data["representations"][-1]
+    assert new_repre["outputName"] == "h264"
+    if do_convert:
+        assert encoded == ["h264"]
+        assert "review_encode" not in new_repre
+        assert not os.path.exists(transcode_dir)
+    else:
+        assert encoded == []
+        input_path = new_repre["review_encode"]["input_args"][0][4:-1]
+        assert os.path.exists(input_path)